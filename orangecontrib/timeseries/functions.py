@@ -1,4 +1,6 @@
 import datetime
+import os
+import warnings
 from datetime import timedelta, timezone
 from numbers import Number
 
@@ -49,14 +51,14 @@ def pocid(true, pred):
     return 100 * np.mean((np.diff(true[-nobs:]) * np.diff(pred)) > 0)
 
 
-def _detrend(x, type):
+def _detrend(x, type, axis=0):
     if type == 'diff':
-        x = np.diff(x)
+        x = np.diff(x, axis=axis)
     elif isinstance(type, str):
         type = dict(constant=0, linear=1, quadratic=2, cubic=3)[type]
     if isinstance(type, Number):
         import statsmodels.api as sm
-        x = sm.tsa.detrend(x, type)
+        x = sm.tsa.detrend(x, type, axis=axis)
     return x
 
 
@@ -73,7 +75,45 @@ def _significant_periods(periods, pgram):
     return periods[significant], pgram[significant]
 
 
-def periodogram(x, *args, detrend='diff', **kwargs):
+def _welch(x, segment_length, overlap=.5, detrend='diff', window='hann',
+           block_size=2 ** 22):
+    """
+    Return frequencies and Welch's estimate of power spectral density of `x`
+    (the same as `scipy.signal.welch` with `average='mean'`).
+
+    The signal is processed in blocks of overlapping segments of at most
+    `block_size` samples, so `x` can be a memory-mapped array that does
+    not fit into memory. Each segment is detrended separately.
+    """
+    from scipy.signal import get_window
+    from orangecontrib.timeseries.aggregate import _windowed
+
+    extra = detrend == 'diff'  # diff needs one additional sample
+    segment_length = min(segment_length, len(x) - extra)
+    step = max(1, segment_length - int(overlap * segment_length))
+    n_segments = 1 + (len(x) - extra - segment_length) // step
+    per_block = max(1, block_size // segment_length)
+    win = get_window(window, segment_length)
+
+    pgram = np.zeros(segment_length // 2 + 1)
+    for first in range(0, n_segments, per_block):
+        last = min(first + per_block, n_segments)
+        block = np.asarray(
+            x[first * step:(last - 1) * step + segment_length + extra],
+            dtype=float)
+        frames = _windowed(block, segment_length + extra, step)
+        frames = _detrend(frames, detrend, axis=1)
+        spectra = np.fft.rfft(frames * win, axis=1)
+        pgram += np.sum(spectra.real ** 2 + spectra.imag ** 2, axis=0)
+
+    pgram /= n_segments * np.sum(win ** 2)
+    # One-sided spectrum: double all but the zero and the Nyquist frequency
+    pgram[1:len(pgram) - (segment_length % 2 == 0)] *= 2
+    return np.fft.rfftfreq(segment_length), pgram
+
+
+def periodogram(x, *args, detrend='diff', segment_length=None, overlap=.5,
+                **kwargs):
     """
     Return periodogram of signal `x`.
 
@@ -84,8 +124,18 @@ def periodogram(x, *args, detrend='diff', **kwargs):
     detrend: 'diff' or False or int
         Remove trend from x. If int, fit and subtract a polynomial of this
         order. See also: `statsmodels.tsa.detrend`.
+    segment_length: int, optional
+        If given, compute Welch's periodogram by averaging the periodograms
+        of (Hann-windowed) segments of this length. This reduces the noise
+        of the estimate, and the signal is read in blocks, so `x` can be
+        a memory-mapped array. Trend is removed from each segment. The
+        longest detectable period is `segment_length`.
+    overlap: float
+        The overlap between consecutive segments, as a fraction of
+        `segment_length`.
     args, kwargs:
-        As accepted by `scipy.signal.periodogram`.
+        As accepted by `scipy.signal.periodogram`; unused if
+        `segment_length` is given.
 
     Returns
     -------
@@ -94,6 +144,11 @@ def periodogram(x, *args, detrend='diff', **kwargs):
     pgram: array_like
         Power spectral density of x.
     """
+    if segment_length is not None:
+        freqs, pgram = _welch(x, segment_length, overlap, detrend)
+        periods, pgram = 1 / freqs[1:], pgram[1:]
+        return _significant_periods(periods, pgram)
+
     from scipy.signal import periodogram
     x = _detrend(x, detrend)
     freqs, pgram = periodogram(x, *args, detrend=False, **kwargs)
@@ -106,9 +161,80 @@ def periodogram(x, *args, detrend='diff', **kwargs):
     return periods, pgram
 
 
+def _extirpolate(x, y, n, order=4):
+    """
+    Return an array of length `n`, whose sums with (slowly varying)
+    functions sampled at 0, 1, ..., n - 1 approximate sums of `y` and the
+    functions' values at `x` (Press & Rybicki, 1989). Each value of `y` is
+    spread to `order` nearest points with Lagrange interpolation weights.
+    """
+    from math import factorial
+
+    result = np.zeros(n, dtype=y.dtype)
+
+    def add(indices, values):
+        if np.iscomplexobj(values):
+            result.real += np.bincount(indices, values.real, n)
+            result.imag += np.bincount(indices, values.imag, n)
+        else:
+            result[:] += np.bincount(indices, values, n)
+
+    on_grid = x % 1 == 0
+    add(x[on_grid].astype(int), y[on_grid])
+    x, y = x[~on_grid], y[~on_grid]
+    low = np.clip((x - order // 2).astype(int), 0, n - order)
+    numerator = y * np.prod(x - low - np.arange(order)[:, None], axis=0)
+    denominator = factorial(order - 1)
+    for j in range(order):
+        if j:
+            denominator *= j / (j - order)
+        indices = low + order - 1 - j
+        add(indices, numerator / (denominator * (x - indices)))
+    return result
+
+
+def _trig_sums(t, h, f0, df, n_freqs, oversampling=10):
+    """
+    Return sums of h * cos(2 pi f t) and h * sin(2 pi f t) for frequencies
+    f = f0 + k df, k = 0, ..., n_freqs - 1, computed with extirpolation of
+    h to a regular grid and a single FFT.
+    """
+    from scipy.fft import next_fast_len
+
+    n_fft = next_fast_len(oversampling * n_freqs)
+    t0 = t.min()
+    h = h * np.exp(2j * np.pi * f0 * (t - t0))
+    grid = _extirpolate(((t - t0) * n_fft * df) % n_fft, h, n_fft)
+    sums = np.fft.ifft(grid)[:n_freqs] * n_fft
+    sums *= np.exp(2j * np.pi * t0 * (f0 + df * np.arange(n_freqs)))
+    return sums.real, sums.imag
+
+
+def _fast_lombscargle(times, x, freqs):
+    """
+    Return the same (unnormalized) Lomb-Scargle periodogram as
+    `scipy.signal.lombscargle` for evenly spaced angular frequencies
+    `freqs`, in O(n log n) time by the method of Press & Rybicki (1989).
+    """
+    f0, df = freqs[0] / (2 * np.pi), (freqs[1] - freqs[0]) / (2 * np.pi)
+    n_freqs = len(freqs)
+    cos_h, sin_h = _trig_sums(times, x, f0, df, n_freqs)
+    cos_2, sin_2 = _trig_sums(times, np.ones(len(x)), 2 * f0, 2 * df, n_freqs)
+
+    # Shift tau makes the sine and cosine terms orthogonal
+    tan_2wt = np.arctan2(sin_2, cos_2)
+    cos_wt, sin_wt = np.cos(tan_2wt / 2), np.sin(tan_2wt / 2)
+    cos_2wt, sin_2wt = np.cos(tan_2wt), np.sin(tan_2wt)
+    yc = cos_h * cos_wt + sin_h * sin_wt
+    ys = sin_h * cos_wt - cos_h * sin_wt
+    cc = (len(x) + cos_2 * cos_2wt + sin_2 * sin_2wt) / 2
+    ss = len(x) - cc
+    return (yc ** 2 / cc + ys ** 2 / ss) / 2
+
+
 def periodogram_nonequispaced(times, x, *, freqs=None,
                               period_low=None, period_high=None,
-                              n_periods=1000, detrend='linear'):
+                              n_periods=1000, detrend='linear', fast=False):
     """
     Compute the Lomb-Scargle periodogram for non-equispaced timeseries.
 
@@ -133,6 +259,12 @@ def periodogram_nonequispaced(times, x, *, freqs=None,
     detrend: 'diff' or False or int
         Remove trend from x. If int, fit and subtract a polynomial of this
         order. See also: `statsmodels.tsa.detrend`.
+    fast: bool
+        If True, compute the periodogram in O(n log n) time with the
+        approximation of Press & Rybicki instead of `scipy`'s O(n n_periods)
+        algorithm. The frequencies must then be evenly spaced, so if `freqs`
+        is not provided, frequencies (not periods) between the given periods
+        are evenly spaced.
 
     Returns
     -------
@@ -158,14 +290,26 @@ def periodogram_nonequispaced(times, x, *, freqs=None,
         if period_high is None:
             period_high = max(200 * period_low, percentile[1])
         # Periods *from high to low* because they are reversed later!
-        periods = np.linspace(period_high, period_low, n_periods)
-        freqs = 2 * np.pi / periods
+        if fast:
+            freqs = np.linspace(2 * np.pi / period_high,
+                                2 * np.pi / period_low, n_periods)
+            periods = 2 * np.pi / freqs
+        else:
+            periods = np.linspace(period_high, period_low, n_periods)
+            freqs = 2 * np.pi / periods
     else:
         periods = 2 * np.pi / freqs
 
-    if times.base is not None:
-        times = times.copy()  # lombscargle is Pythonized and doesn't like views
-    pgram = lombscargle(times, x, freqs)
+    if fast:
+        if len(freqs) < 2 or not np.allclose(np.diff(freqs),
+                                             freqs[1] - freqs[0]):
+            raise ValueError("Fast periodogram requires at least two evenly "
+                             "spaced frequencies")
+        pgram = _fast_lombscargle(np.asarray(times, dtype=float), x, freqs)
+    else:
+        if times.base is not None:
+            times = times.copy()  # lombscargle is Pythonized and doesn't like views
+        pgram = lombscargle(times, x, freqs)
     # Normalize -- I have no idea what I am doing; took this from
     # https://jakevdp.github.io/blog/2015/06/13/lomb-scargle-in-python/#lomb-scargle-algorithms-in-python
     pgram *= 2 / (len(x) * x.std()**2)
@@ -174,6 +318,64 @@ def periodogram_nonequispaced(times, x, *, freqs=None,
     return periods, pgram
 
 
+def spectrogram(x, window=256, overlap=.5, *,
+                start=0, stop=None, max_frames=None):
+    """
+    Return the spectrogram (short-time power spectrum) of signal `x`.
+
+    Spectra of all (Hann-windowed, demeaned) frames are computed with
+    a single batched FFT over a strided view of `x`, so `x` may also be
+    a memory-mapped array.
+
+    Parameters
+    ----------
+    x: array_like
+        A 1D equispaced signal.
+    window: int
+        Length of frames in samples.
+    overlap: float
+        The overlap between consecutive frames, as a fraction of `window`.
+    start, stop: int, optional
+        The range of samples to compute the spectrogram for.
+    max_frames: int, optional
+        The maximal number of frames. If the range contains more frames,
+        the step between them is increased, so that frames are spread
+        evenly across the range; this is used to compute only as many
+        frames as can be shown.
+
+    Returns
+    -------
+    centers: array_like
+        Indices of the central samples of frames.
+    freqs: array_like
+        Frequencies, in cycles per sample.
+    sxx: array_like
+        Power spectral densities; an array of shape (len(centers),
+        len(freqs)).
+    """
+    from scipy.signal import get_window
+    from orangecontrib.timeseries.aggregate import _windowed
+
+    x = np.asanyarray(x)[start:stop]
+    window = min(window, len(x))
+    step = max(1, window - int(overlap * window))
+    n_frames = 1 + (len(x) - window) // step
+    if max_frames is not None and n_frames > max_frames:
+        step = (len(x) - window) // max(1, max_frames - 1)
+        n_frames = max_frames
+    win = get_window('hann', window)
+
+    frames = np.asarray(_windowed(x, window, step)[:n_frames], dtype=float)
+    frames = frames - frames.mean(axis=1, keepdims=True)
+    spectra = np.fft.rfft(frames * win, axis=1)
+    sxx = spectra.real ** 2 + spectra.imag ** 2
+    sxx /= np.sum(win ** 2)
+    # One-sided spectrum: double all but the zero and the Nyquist frequency
+    sxx[:, 1:sxx.shape[1] - (window % 2 == 0)] *= 2
+    centers = start + np.arange(n_frames) * step + window // 2
+    return centers, np.fft.rfftfreq(window), sxx
+
+
 def _significant_acf(corr, has_confint):
     if has_confint:
         corr, confint = corr
@@ -218,6 +420,56 @@ def autocorrelation(x, *args, nlags=None, fft=True, **kwargs):
     return _significant_acf(corr, kwargs.get('alpha'))
 
 
+def autocorrelations(X, nlags=None, alpha=None):
+    """
+    Return autocorrelation functions of all columns of `X` at once.
+
+    The ACFs are computed like `statsmodels.tsa.stattools.acf` (with
+    ``fft=True``), but with a single FFT along the first axis for all
+    columns.
+
+    Parameters
+    ----------
+    X: array_like
+        A 2D array with signals in columns.
+    nlags: int
+        The number of lags to calculate the correlation for (default .9*len(X))
+    alpha: float, optional
+        If given, also return half-widths of (1 - alpha) confidence intervals
+        around zero, computed with Bartlett's formula.
+
+    Returns
+    -------
+    acf: array
+        Autocorrelation functions in columns, for lags from 0 to nlags.
+    bands: array, optional
+        Half-widths of confidence intervals for each lag and column; the
+        autocorrelation at lags outside ±bands is significant.
+    """
+    from scipy.fft import next_fast_len
+    from scipy.stats import norm
+
+    X = np.asarray(X, dtype=float)
+    n = len(X)
+    if nlags is None:
+        nlags = int(.9 * n)
+    X = X - X.mean(axis=0)
+    n_fft = next_fast_len(2 * n - 1)
+    spectrum = np.fft.rfft(X, n_fft, axis=0)
+    acov = np.fft.irfft(spectrum * spectrum.conj(), n_fft, axis=0)[:nlags + 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        acf = acov / acov[0]
+    if alpha is None:
+        return acf
+
+    varacf = np.empty_like(acf)
+    varacf[0] = 0
+    varacf[1:] = 1 + 2 * np.cumsum(
+        np.vstack((np.zeros(acf.shape[1]), acf[1:-1] ** 2)), axis=0)
+    bands = norm.ppf(1 - alpha / 2) * np.sqrt(varacf / n)
+    return acf, bands
+
+
 def partial_autocorrelation(x, *args, nlags=None, method='ldb', **kwargs):
     """
     Return partial autocorrelation function (PACF) of signal `x`.
@@ -345,7 +597,231 @@ def interpolate_timeseries(data, method='linear', multivariate=False):
     return ts
 
 
-def seasonal_decompose(data, model='multiplicative', period=12, *, callback=None):
+def difference(X, op='diff', shift=1, invert=False, assume_zero=False):
+    """
+    Return discrete differences (or change quotients) along columns of `X`.
+
+    Parameters
+    ----------
+    X : array_like
+        A 1D signal or a 2D array with signals in columns.
+    op : str {'diff', 'diff2', 'quotient', 'percent'}
+        First order difference, second order difference, change quotient
+        or percentage change.
+    shift : int
+        The distance between the compared points; ignored for 'diff2'.
+    invert : bool
+        Compare each point with the one following it instead of the one
+        preceding it.
+    assume_zero : bool
+        For differences without `invert`, assume zeros before the start
+        of the series, so that the first values are defined.
+
+    Returns
+    -------
+    out : np.ndarray
+        Array of the same shape as `X`. Values that cannot be computed,
+        including quotients with zero denominator, are nan.
+    """
+    assert op in ('diff', 'diff2', 'quotient', 'percent')
+    X = np.asarray(X, dtype=float)
+    result = out = np.full(X.shape, np.nan)
+    if invert:
+        # Write into a reversed view, so that result needs no reversing
+        X, out = X[::-1], out[::-1]
+
+    if op == 'diff':
+        np.subtract(X[shift:], X[:-shift], out=out[shift:])
+        if assume_zero and not invert:
+            out[:shift] = X[:shift]
+    elif op == 'diff2':
+        out[2:] = np.diff(X, 2, axis=0)
+        if assume_zero and not invert:
+            out[1:2] = X[1:2] - 2 * X[:1]
+            out[:1] = X[:1]
+    else:
+        denominators = X[:-shift]
+        quotients = out[shift:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(X[shift:], denominators, out=quotients)
+        if op == 'percent':
+            quotients -= 1
+            quotients *= 100
+        quotients[denominators == 0] = np.nan
+    return result
+
+
+def _pool_context():
+    """
+    Return a multiprocessing context for process pools.
+
+    Workers are forked from a fork server (which preloads this module) or
+    spawned where fork server is unavailable, but never forked from this
+    process, so pools are safe to use from a thread of a GUI application.
+    """
+    from multiprocessing import get_context, get_all_start_methods
+
+    if "forkserver" in get_all_start_methods():
+        context = get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+    else:
+        context = get_context("spawn")
+    return context
+
+
+def _process_pool(n_jobs, initializer=None, initargs=()):
+    """
+    Return a process pool executor with `n_jobs` workers (-1 for all
+    processors), created in the context from `_pool_context`.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if n_jobs < 0:
+        n_jobs = os.cpu_count()
+    return ProcessPoolExecutor(n_jobs, mp_context=_pool_context(),
+                               initializer=initializer, initargs=initargs)
+
+
+def _map_in_pool(executor, func, tasks, task_done=None):
+    """
+    Call `func(*args)` for each `args` in `tasks` in the executor and
+    return the list of results in the order of tasks.
+
+    `task_done(index, result)` is called as each task completes. If a task
+    or `task_done` raises an exception (e.g. to interrupt the computation),
+    pending tasks are cancelled and the executor is shut down.
+    """
+    from concurrent.futures import as_completed
+
+    results = [None] * len(tasks)
+    futures = {executor.submit(func, *args): i
+               for i, args in enumerate(tasks)}
+    try:
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            if task_done:
+                task_done(i, results[i])
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    return results
+
+
+def _classical_decompose(X, model, period):
+    """
+    Decompose columns of X with centered moving averages, like statsmodels'
+    `seasonal_decompose`, and extrapolate the trend linearly from three
+    points at each end. Return seasonally adjusted series, seasonal, trend
+    and residual components, each with the same shape as X.
+    """
+    from scipy.signal import convolve
+
+    nobs, k = X.shape
+    if not np.all(np.isfinite(X)):
+        raise ValueError("This function does not handle missing values")
+    multiplicative = model == 'multiplicative'
+    if multiplicative and np.any(X <= 0):
+        raise ValueError("Multiplicative seasonality is not appropriate "
+                         "for zero and negative values")
+    if nobs < 2 * period:
+        raise ValueError(f"x must have 2 complete cycles requires "
+                         f"{2 * period} observations. x only has {nobs} "
+                         f"observation(s)")
+    recomposition = np.divide if multiplicative else np.subtract
+
+    if period % 2 == 0:  # split weights at ends
+        filt = np.array([.5] + [1] * (period - 1) + [.5]) / period
+    else:
+        filt = np.repeat(1 / period, period)
+    first = (len(filt) - 1) // 2
+    last = nobs - 1 - first
+    trend = np.full(X.shape, np.nan)
+    trend[first:last + 1] = convolve(X, filt[:, None], mode='valid')
+    detrended = recomposition(X, trend)
+
+    n_periods = -(-nobs // period)
+    padded = np.full((n_periods * period, k), np.nan)
+    padded[:nobs] = detrended
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        means = np.nanmean(padded.reshape(n_periods, period, k), axis=0)
+    if multiplicative:
+        means /= np.mean(means, axis=0)
+    else:
+        means -= np.mean(means, axis=0)
+    seasonal = np.tile(means, (n_periods, 1))[:nobs]
+    adjusted = recomposition(X, seasonal)
+
+    # Extrapolate the trend with lines through (up to) three points at ends
+    for fit_first, fit_last, fill in (
+            (first, min(first + 3, last), slice(None, first)),
+            (max(first, last - 3), last, slice(last + 1, None))):
+        x = np.arange(fit_first, fit_last)
+        coefs = np.linalg.lstsq(np.column_stack((x, np.ones(len(x)))),
+                                trend[fit_first:fit_last], rcond=None)[0]
+        x = np.arange(nobs)[fill]
+        trend[fill] = np.outer(x, coefs[0]) + coefs[1]
+    resid = recomposition(adjusted, trend)
+    return adjusted, seasonal, trend, resid
+
+
+def _stl_decompose(x, periods):
+    """
+    Return seasonal and trend components of a series x from robust STL
+    (or MSTL if multiple periods are given); seasonal components of
+    multiple periods are summed.
+    """
+    if len(periods) == 1:
+        from statsmodels.tsa.seasonal import STL
+        result = STL(x, period=periods[0], robust=True).fit()
+        seasonal = result.seasonal
+    else:
+        from statsmodels.tsa.seasonal import MSTL
+        result = MSTL(x, periods=periods, stl_kwargs=dict(robust=True)).fit()
+        seasonal = np.atleast_2d(result.seasonal.T).sum(axis=0)
+    return seasonal, result.trend
+
+
+def _stl_components(X, model, periods, n_jobs, callback):
+    """
+    Decompose columns of X with STL, each in a separate task, and return
+    seasonally adjusted series, seasonal, trend and residual components.
+    Multiplicative decomposition decomposes logarithms of series.
+    """
+    multiplicative = model == 'multiplicative'
+    if multiplicative:
+        if np.any(X <= 0):
+            raise ValueError("Multiplicative seasonality is not appropriate "
+                             "for zero and negative values")
+        X = np.log(X)
+    seasonal, trend = np.empty(X.shape), np.empty(X.shape)
+    if n_jobs in (None, 1):
+        for i, x in enumerate(X.T):
+            seasonal[:, i], trend[:, i] = _stl_decompose(x, periods)
+            if callback:
+                callback()
+    else:
+        def task_done(i, components):
+            seasonal[:, i], trend[:, i] = components
+            if callback:
+                callback()
+
+        with _process_pool(n_jobs) as executor:
+            _map_in_pool(executor, _stl_decompose,
+                         [(x, periods) for x in X.T], task_done)
+    adjusted = X - seasonal
+    resid = adjusted - trend
+    if multiplicative:
+        return tuple(map(np.exp, (adjusted, seasonal, trend, resid)))
+    return adjusted, seasonal, trend, resid
+
+
+DECOMPOSE_CLASSICAL, DECOMPOSE_STL = 'classical', 'stl'
+
+
+def seasonal_decompose(data, model='multiplicative', period=12, *,
+                       callback=None, method=DECOMPOSE_CLASSICAL, n_jobs=None):
     """
     Return table of decomposition components of original features and
     original features seasonally adjusted.
@@ -357,10 +833,22 @@ def seasonal_decompose(data, model='multiplicative', period=12, *, callback=None
     model : str {'additive', 'multiplicative'}
         A decompostition model. See:
         https://en.wikipedia.org/wiki/Decomposition_of_time_series
-    period : int
-        The period length of season.
+    period : int or sequence of int
+        The period length of season. STL accepts multiple periods
+        (e.g. ``(24, 24 * 7)`` for daily and weekly seasonality in hourly
+        data), which are decomposed with MSTL.
     callback : callable
         Optional callback to call (with no parameters) after each iteration.
+    method : {DECOMPOSE_CLASSICAL, DECOMPOSE_STL}
+        Classical decomposition with moving averages, which decomposes all
+        features at once, or robust STL (Seasonal-Trend decomposition using
+        LOESS), which decomposes each feature separately. STL with a
+        multiplicative model decomposes logarithms of features.
+        If there are multiple periods, the seasonal column contains the
+        combined seasonal component.
+    n_jobs : int, optional
+        Number of processes for STL. If None or 1, features are decomposed
+        in this process; -1 uses all processors.
 
     Returns
     -------
@@ -368,69 +856,292 @@ def seasonal_decompose(data, model='multiplicative', period=12, *, callback=None
         Table with columns: original series seasonally adjusted, original
         series' seasonal components, trend components, and residual components.
     """
-    from operator import sub, truediv
     from Orange.data import Domain, ContinuousVariable
     from orangecontrib.timeseries import Timeseries
     from orangecontrib.timeseries.widgets.utils import available_name
-    import statsmodels.api as sm
-
-    def _interp_trend(trend):
-        first = next(i for i, val in enumerate(trend) if val == val)
-        last = trend.size - 1 - next(
-            i for i, val in enumerate(trend[::-1]) if val == val)
-        d = 3
-        first_last = min(first + d, last)
-        last_first = max(first, last - d)
-
-        k, n = np.linalg.lstsq(
-            np.column_stack((np.arange(first, first_last), np.ones(first_last - first))),
-            trend[first:first_last])[0]
-        trend[:first] = np.arange(0, first) * k + n
-
-        k, n = np.linalg.lstsq(
-            np.column_stack((np.arange(last_first, last), np.ones(last - last_first))),
-            trend[last_first:last])[0]
-        trend[last + 1:] = np.arange(last + 1, trend.size) * k + n
-        return trend
-
-    attrs = []
-    X = []
-    recomposition = sub if model == 'additive' else truediv
+
+    variables = data.domain.variables
     interp_data = data.interp()
-    for var in data.domain.variables:
-        decomposed = sm.tsa.seasonal_decompose(np.ravel(interp_data[:, var]),
-                                               model=model,
-                                               period=period)
-        adjusted = recomposition(decomposed.observed,
-                                 decomposed.seasonal)
-
-        season = decomposed.seasonal
-        trend = _interp_trend(decomposed.trend)
-        resid = recomposition(adjusted, trend)
-
-        # Re-apply nans
-        isnan = np.isnan(data[:, var]).ravel()
-        adjusted[isnan] = np.nan
-        trend[isnan] = np.nan
-        resid[isnan] = np.nan
-
-        attrs.extend(
-            ContinuousVariable(
-                available_name(data.domain,
-                               var.name + ' ({})'.format(transform)))
-            for transform in
-            ('season. adj.', 'seasonal', 'trend', 'residual')
-        )
-        X.extend((adjusted, season, trend, resid))
+    X = np.column_stack([interp_data.get_column(var) for var in variables])
+    if method == DECOMPOSE_STL:
+        periods = tuple(np.atleast_1d(period).astype(int))
+        components = _stl_components(X, model, periods, n_jobs, callback)
+    else:
+        if not isinstance(period, Number):
+            raise ValueError('Classical decomposition supports a single '
+                             'period')
+        # Decompose blocks of columns, so that progress can be reported
+        components = tuple(np.empty(X.shape) for _ in range(4))
+        for cols in np.array_split(np.arange(X.shape[1]),
+                                   min(X.shape[1], 10)):
+            parts = _classical_decompose(X[:, cols], model, period)
+            for component, part in zip(components, parts):
+                component[:, cols] = part
+            if callback:
+                for _ in cols:
+                    callback()
+    # Re-apply nans
+    isnan = np.isnan(np.column_stack([data.get_column(var)
+                                      for var in variables]))
+    adjusted, season, trend, resid = components
+    for component in (adjusted, trend, resid):
+        component[isnan] = np.nan
+
+    attrs = [
+        ContinuousVariable(
+            available_name(data.domain,
+                           var.name + ' ({})'.format(transform)))
+        for var in variables
+        for transform in ('season. adj.', 'seasonal', 'trend', 'residual')
+    ]
+    # Interleave components so that each variable's components are adjacent
+    X = np.stack(components, axis=2).reshape(len(data), -1)
+    ts = Timeseries.from_numpy(Domain(attrs), X)
+    return ts
+
+
+GRANGER_PAIRWISE, GRANGER_CONDITIONAL = 'pairwise', 'conditional'
 
+
+def _lag_matrix(x, max_lag):
+    """
+    Return an array whose element [t, l] is x[t - l - 1], or 0 for t <= l
+    """
+    lags = np.zeros((len(x), max_lag))
+    for l in range(max_lag):
+        lags[l + 1:, l] = x[:len(x) - l - 1]
+    return lags
+
+
+def _nested_ssr(designs, y, max_lag, width):
+    """
+    Return residual sums of squares of least squares fits for all lags.
+
+    Element [m, l] of the returned (number of designs, max_lag) array is
+    the SSR of fitting `y[lag:]` with the first `1 + width * lag` columns of
+    the m-th design's rows from `lag` on, where `lag = l + 1`; that is,
+    columns are ordered by lag and rows t < lag are not used, as in `lagmat`.
+
+    Each design is decomposed (QR) only once, at `max_lag`. The R factor of
+    a fit with fewer columns is the leading block of R, and a row is added
+    to R by decomposing R with the row appended. `designs` may be
+    an iterator; only the R factors and the first `max_lag` rows of
+    designs are kept.
+    """
+    n_cols = 1 + width * max_lag
+    # R factors of [design, y]; the last column holds Q^T y and the residual
+    r, heads = [], []
+    for design in designs:
+        r.append(np.linalg.qr(
+            np.column_stack((design[max_lag:], y[max_lag:])), mode='r'))
+        heads.append(design[:max_lag])
+    r, heads = np.array(r), np.array(heads)
+    ssr = np.empty((len(r), max_lag))
+    for lag in range(max_lag, 0, -1):
+        ssr[:, lag - 1] = r[:, n_cols, n_cols] ** 2
+        if lag == 1:
+            break
+        # Keep the columns for lag - 1 and add the row t = lag - 1
+        n_keep = n_cols - width
+        resid = np.sqrt(np.sum(r[:, n_keep:n_cols + 1, n_cols] ** 2, axis=1))
+        stacked = np.zeros((len(r), n_keep + 2, n_keep + 1))
+        stacked[:, :n_keep, :n_keep] = r[:, :n_keep, :n_keep]
+        stacked[:, :n_keep, n_keep] = r[:, :n_keep, n_cols]
+        stacked[:, n_keep, n_keep] = resid
+        stacked[:, -1, :n_keep] = heads[:, lag - 1, :n_keep]
+        stacked[:, -1, n_keep] = y[lag - 1]
+        r = np.linalg.qr(stacked, mode='r')
+        n_cols = n_keep
+    return ssr
+
+
+def _granger_pvalues(X, max_lag, callback=None, alpha=None,
+                     consequents=None):
+    """
+    Return p-values of Granger causality F-tests between columns of X.
+
+    The result is an array of shape (k, k, max_lag), whose element [i, j, l]
+    is the p-value of the test (as `ssr_ftest` in statsmodels'
+    `grangercausalitytests`) that column i Granger-causes column j at lag
+    l + 1. Tests that cannot be computed (e.g. i == j) give nan.
+
+    If `alpha` is given, the tests for a pair stop at the first lag with
+    p-value below `alpha`; p-values at higher lags are nan.
+
+    If `consequents` (a sequence of column indices) is given, only the
+    tests for these consequents are computed.
+
+    Designs with lags interleaved by lag, [1, own lag 1, other's lag 1,
+    own lag 2, ...], are constructed once per pair, at `max_lag`, and
+    the tests at all lags are computed from their QR (see `_nested_ssr`).
+    """
+    from scipy.stats import f
+
+    n, k = X.shape
+    pvalues = np.full((k, k, max_lag), np.nan)
+    # Statsmodels refuses constant columns and too short series
+    feasible = np.ptp(X, axis=0) > 0
+    if n <= 3 * max_lag + 1:
+        feasible[:] = False
+
+    if consequents is None:
+        consequents = range(k)
+    n_cons = len(consequents)
+    lags = np.arange(1, max_lag + 1)
+    nobs = n - lags
+    df = nobs - 2 * lags - 1
+    for done, j in enumerate(consequents):
+        antecedents = np.flatnonzero(feasible)
+        antecedents = antecedents[antecedents != j]
+        if feasible[j] and antecedents.size:
+            y = X[:, j]
+            own = np.column_stack((np.ones(n), _lag_matrix(y, max_lag)))
+            ssr_own = _nested_ssr([own], y, max_lag, 1)[0]
+
+            def joint_design(i):
+                design = np.empty((n, 1 + 2 * max_lag))
+                design[:, 0] = 1
+                design[:, 1::2] = own[:, 1:]
+                design[:, 2::2] = _lag_matrix(X[:, i], max_lag)
+                return design
+
+            ssr_joint = _nested_ssr(
+                map(joint_design, antecedents), y, max_lag, 2)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                fstat = (ssr_own - ssr_joint) / ssr_joint / lags * df
+            pvals = f.sf(fstat, lags, df)
+            if alpha is not None:
+                # Discard lags after the first significant one
+                significant = pvals < alpha
+                pvals[np.cumsum(significant, axis=1) > significant] = np.nan
+            pvalues[antecedents, j] = pvals
         if callback:
-            callback()
+            callback((done + 1) / n_cons)
+    return pvalues
 
-    ts = Timeseries.from_numpy(Domain(attrs), np.column_stack(X))
-    return ts
 
+def _var_granger_pvalues(X, max_lag):
+    """
+    Return the order of a VAR model fitted to columns of X and p-values of
+    conditional Granger causality F-tests between them.
+
+    The order is selected by AIC among orders up to `max_lag` (reduced if
+    the series is too short). Element [i, j] of the returned (k, k) array is
+    the p-value of the test (as `VARResults.test_causality` with
+    ``kind='f'``) that column i Granger-causes column j given all other
+    columns. Tests that cannot be computed (e.g. i == j) give nan.
+
+    All tests are derived from a single fit: the covariance of the
+    coefficients of column i's lags in the equation for j is the block
+    of ``inv(Z'Z)`` for these lags, scaled by the residual variance of j.
+    """
+    from scipy.stats import f
+    from orangecontrib.timeseries.models import VAR
+
+    n, k = X.shape
+    pvalues = np.full((k, k), np.nan)
+    feasible = np.flatnonzero(np.ptp(X, axis=0) > 0)
+    kf = len(feasible)
+    max_lag = min(max_lag, (n - 2) // (kf + 1))
+    if kf < 2 or max_lag < 1:
+        return 0, pvalues
+
+    results = VAR(max_lag, ic='aic').fit(X[:, feasible]).results
+    lag = results.k_ar
+    if not lag:
+        return 0, pvalues
+    Z = results.endog_lagged
+    cov = np.linalg.inv(Z.T @ Z)
+    n_trend = results.params.shape[0] - kf * lag
+    df = (lag, kf * results.df_resid)
+    for i in range(kf):
+        rows = n_trend + np.arange(lag) * kf + i
+        coefs = results.params[rows]
+        wald = np.einsum('lj,lm,mj->j', coefs,
+                         np.linalg.inv(cov[np.ix_(rows, rows)]), coefs)
+        wald /= np.diag(results.sigma_u)
+        pvals = f.sf(wald / lag, *df)
+        pvals[i] = np.nan
+        pvalues[feasible[i], feasible] = pvals
+    return lag, pvalues
+
+
+_granger_data = None
+
+
+def _init_granger_worker(name, shape, dtype):
+    global _granger_data
+    from multiprocessing.shared_memory import SharedMemory
+
+    block = SharedMemory(name)
+    # Keep a reference to the block so that the array's buffer stays mapped
+    _granger_data = block, np.ndarray(shape, dtype, buffer=block.buf)
+
+
+def _granger_pvalues_in_worker(max_lag, alpha, consequents):
+    pvalues = _granger_pvalues(_granger_data[1], max_lag, alpha=alpha,
+                               consequents=consequents)
+    return pvalues[:, consequents]
+
+
+def _granger_pvalues_in_pool(X, max_lag, alpha, n_jobs, callback,
+                             chunk_done):
+    """
+    Compute `_granger_pvalues` in a pool of processes, which get X through
+    shared memory. Consequents are split into chunks; `chunk_done` is
+    called with pvalues and indices of consequents of each completed chunk.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    if n_jobs < 0:
+        n_jobs = os.cpu_count()
+    k = X.shape[1]
+    pvalues = np.full((k, k, max_lag), np.nan)
+    done = 0
+
+    def task_done(i, chunk_pvalues):
+        nonlocal done
+        chunk = chunks[i]
+        pvalues[:, chunk] = chunk_pvalues
+        chunk_done(pvalues, chunk)
+        done += chunk.size
+        if callback:
+            callback(done / k)
+
+    block = SharedMemory(create=True, size=max(X.nbytes, 1))
+    try:
+        np.ndarray(X.shape, X.dtype, buffer=block.buf)[:] = X
+        chunks = [chunk for chunk in np.array_split(np.arange(k), 4 * n_jobs)
+                  if chunk.size]
+        with _process_pool(
+                n_jobs, initializer=_init_granger_worker,
+                initargs=(block.name, X.shape, X.dtype.str)) as executor:
+            _map_in_pool(executor, _granger_pvalues_in_worker,
+                         [(max_lag, alpha, chunk) for chunk in chunks],
+                         task_done)
+        return pvalues
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _granger_significant(pvalues, domain, alpha, consequents):
+    """Return [lag, p-value, antecedent, consequent] for the first
+    significant lag of each pair with consequent in `consequents`"""
+    res = []
+    for i, row_attr in enumerate(domain):
+        for j in consequents:
+            significant = np.flatnonzero(pvalues[i, j] < alpha)
+            if significant.size:
+                lag = significant[0]
+                res.append([lag + 1, pvalues[i, j, lag],
+                            row_attr.name, domain[j].name])
+    return res
 
-def granger_causality(data, max_lag=10, alpha=.05, *, callback=None):
+
+def granger_causality(data, max_lag=10, alpha=.05, *, callback=None,
+                      method=GRANGER_PAIRWISE, n_jobs=None,
+                      partial_result=None):
     """
     Return results of Granger-causality tests.
 
@@ -444,55 +1155,256 @@ def granger_causality(data, max_lag=10, alpha=.05, *, callback=None):
         Confidence of test is 1 - alpha.
     callback : callable
         A callback to call in each iteration with ratio of completion.
+    method : {GRANGER_PAIRWISE, GRANGER_CONDITIONAL}
+        Pairwise tests fit a pair of regressions for each pair of features
+        and lag. The conditional test fits a single VAR model of all
+        features, with the order selected by AIC, so it also controls for
+        the remaining features.
+    n_jobs : int, optional
+        Number of processes for pairwise tests. If None or 1, the tests
+        run in this process; -1 uses all processors.
+    partial_result : callable, optional
+        If given and the tests run in multiple processes, it is called
+        with the list of results for each completed chunk of consequents.
 
     Returns
     -------
     res : list of lists
         Each internal list is [lag, p-value, antecedent, consequent] where
         lag is the minimum lag at which antecedent feature in data is
-        Granger-causal for the consequent feature in data.
+        Granger-causal for the consequent feature in data. For the
+        conditional test, lag is the order of the fitted VAR model.
     """
-    from statsmodels.tsa.stattools import grangercausalitytests
-    from Orange.data import Table, Domain
-    # TODO: use VAR Granger causality
     # TODO: consider CCM in stead/addition of GC: https://en.wikipedia.org/wiki/Convergent_cross_mapping
-    # http://statsmodels.sourceforge.net/devel/generated/statsmodels.tsa.vector_ar.var_model.VARResults.test_causality.html
-    # http://statsmodels.sourceforge.net/devel/vector_ar.html#granger-causality
 
     data = data.interp()
     domain = [var for var in data.domain.variables
               if var.is_continuous and var is not data.time_variable]
-    res = []
+    X = np.column_stack([data.get_column(var) for var in domain]) \
+        if domain else np.empty((len(data), 0))
+    if method == GRANGER_CONDITIONAL:
+        lag, pvalues = _var_granger_pvalues(X, max_lag)
+        if callback:
+            callback(1)
+        return [[lag, pvalues[i, j], row_attr.name, col_attr.name]
+                for i, row_attr in enumerate(domain)
+                for j, col_attr in enumerate(domain)
+                if pvalues[i, j] < alpha]
+
+    if n_jobs in (None, 1):
+        pvalues = _granger_pvalues(X, max_lag, callback, alpha)
+    else:
+        def chunk_done(pvalues, chunk):
+            if partial_result:
+                partial_result(
+                    _granger_significant(pvalues, domain, alpha, chunk))
+
+        pvalues = _granger_pvalues_in_pool(
+            X, max_lag, alpha, n_jobs, callback, chunk_done)
+    return _granger_significant(pvalues, domain, alpha, range(len(domain)))
+
+
+def _cross_correlation_peaks(X, max_lag, callback=None):
+    """
+    Return lags and values of peak (by absolute value) cross-correlations
+    between all pairs of columns of X, at lags up to `max_lag`.
+
+    Element [i, j] of the returned (k, k) arrays, for i < j, refers to the
+    correlation between X[t, i] and X[t + lag, j]; a positive lag thus means
+    that column i leads column j. Correlations of constant columns are nan.
+
+    Each column is transformed with a single FFT. Cross-correlations of all
+    pairs with the same first column are computed with one inverse FFT of
+    the products of spectra.
+    """
+    from scipy.fft import next_fast_len
+
+    n, k = X.shape
+    max_lag = min(max_lag, n - 1)
+    lags = np.full((k, k), 0)
+    peaks = np.full((k, k), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        X = (X - X.mean(axis=0)) / (X.std(axis=0) * np.sqrt(n))
+    n_fft = next_fast_len(n + max_lag)
+    spectra = np.fft.rfft(X, n_fft, axis=0)
+    # Order of lags in the inverse transform's output
+    shifts = np.r_[-max_lag:max_lag + 1]
+    for i in range(k - 1):
+        cross = np.fft.irfft(spectra[:, i, None].conj() * spectra[:, i + 1:],
+                             n_fft, axis=0)[shifts]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            valid = ~np.isnan(cross).all(axis=0)
+            best = np.nanargmax(np.abs(cross[:, valid]), axis=0)
+        j = np.flatnonzero(valid) + i + 1
+        lags[i, j] = shifts[best]
+        peaks[i, j] = cross[best, valid]
+        if callback:
+            callback((i + 1) / (k - 1))
+    return lags, peaks
+
+
+def cross_correlation(data, max_lag=10, *, callback=None):
+    """
+    Return peak cross-correlations between all pairs of features.
+
+    Parameters
+    ----------
+    data : Timeseries
+        A table of features to compute cross-correlations between.
+    max_lag : int
+        The maximal lag at which to look for the peak.
+    callback : callable
+        A callback to call in each iteration with ratio of completion.
 
-    step = 0
-    nsteps = len(domain) * (len(domain) - 1)
-    for row_attr in domain:
-        for col_attr in domain:
-            if row_attr is col_attr:
+    Returns
+    -------
+    res : list of lists
+        Each internal list is [lag, correlation, leading, following] where
+        correlation is the largest (by absolute value) correlation between
+        the leading feature and the following feature, which lags by `lag`
+        (lag is never negative). Each pair of features appears once;
+        pairs with constant features are omitted.
+    """
+    data = data.interp()
+    domain = [var for var in data.domain.variables
+              if var.is_continuous and var is not data.time_variable]
+    X = np.column_stack([data.get_column(var) for var in domain]) \
+        if domain else np.empty((len(data), 0))
+    lags, peaks = _cross_correlation_peaks(X, max_lag, callback)
+    res = []
+    for i, attr1 in enumerate(domain):
+        for j, attr2 in enumerate(domain[i + 1:], start=i + 1):
+            lag, peak = lags[i, j], peaks[i, j]
+            if np.isnan(peak):
                 continue
-            X = Table.from_table(Domain([], [], [col_attr, row_attr], data.domain), data).metas
-            try:
-                tests = grangercausalitytests(X, max_lag, verbose=False)
-                lag, p_val = next(
-                    (
-                        (lag, tests[lag][0]["ssr_ftest"][1])
-                        for lag in range(1, 1 + max_lag)
-                        if tests[lag][0]["ssr_ftest"][1] < alpha
-                    ),
-                    (None, None),
-                )
-            except ValueError:
-                lag = p_val = None
-            if lag:
-                res.append([lag, p_val, row_attr.name, col_attr.name])
-
-            step += 1
-            if callback:
-                callback(step / nsteps)
+            if lag < 0:
+                res.append([-lag, peak, attr2.name, attr1.name])
+            else:
+                res.append([lag, peak, attr1.name, attr2.name])
     return res
 
 
-def model_evaluation(data, models, n_folds, forecast_steps, *, callback=None):
+def _evaluate_fold(model, data, fold, forecast_steps, start_params=None):
+    """
+    Fit the model on data without the last `fold` windows of `forecast_steps`
+    and return the forecast of the class variable with the fitted model's
+    (AIC, BIC). For `fold` 0, fit the model on all data and return in-sample
+    fitted values instead of the forecast. Return None if the model fails.
+    """
+    # Models without warm start need not accept start_params
+    kwargs = {} if start_params is None else dict(start_params=start_params)
+    try:
+        if fold:
+            model.fit(data[:-fold * forecast_steps], **kwargs)
+            pred, _, _ = model.predict(forecast_steps)
+            values = np.c_[pred][:, 0]  # Only interested in the class var
+        else:
+            model.fit(data, **kwargs)
+            values = model.fittedvalues()
+            if values.ndim > 1:
+                values = values[..., 0]
+    except Exception:
+        return None
+    try:
+        criteria = (model.results.aic, model.results.bic)
+    except Exception:
+        criteria = None
+    return values, criteria
+
+
+def _evaluate_folds(model, data, folds, forecast_steps, warm_start,
+                    callback=None):
+    """
+    Evaluate the model on each of `folds` (see `_evaluate_fold`) and return
+    a list of results. If `warm_start` is set, each fit starts from
+    the parameters of the previous successful fit.
+    """
+    results = []
+    start_params = None
+    for fold in folds:
+        results.append(
+            _evaluate_fold(model, data, fold, forecast_steps, start_params))
+        if warm_start and results[-1] is not None:
+            start_params = model.results.params
+        if callback and fold:
+            callback()
+    return results
+
+
+# Data of the evaluation, set in each worker process by _init_worker
+_worker_data = None
+
+
+def _init_worker(domain, time_variable, arrays):
+    global _worker_data
+    from multiprocessing.shared_memory import SharedMemory
+
+    blocks = [SharedMemory(name) for name, _, _ in arrays]
+    X, Y = (np.ndarray(shape, dtype, buffer=block.buf)
+            for block, (_, shape, dtype) in zip(blocks, arrays))
+    data = Timeseries.from_numpy(domain, X, Y)
+    data.time_variable = time_variable
+    # Keep references to blocks so that the arrays' buffers stay mapped
+    _worker_data = blocks, data
+
+
+def _evaluate_folds_in_worker(model, folds, forecast_steps, warm_start):
+    return _evaluate_folds(
+        model, _worker_data[1], folds, forecast_steps, warm_start)
+
+
+def _evaluate_in_pool(models, data, tasks, forecast_steps, warm_start,
+                      n_jobs, callback):
+    """
+    Evaluate (model index, folds) `tasks` in a pool of processes, which
+    get the data through shared memory. Return a dict of results by
+    (model index, fold).
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    from Orange.data import Domain
+
+    # Models use only X and Y, so we don't need to share (object) metas
+    domain = Domain(data.domain.attributes, data.domain.class_vars)
+    time_variable = data.time_variable
+    if time_variable not in domain:
+        time_variable = None
+
+    blocks = []
+    try:
+        arrays = []
+        for arr in (data.X, data.Y):
+            block = SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks.append(block)
+            np.ndarray(arr.shape, arr.dtype, buffer=block.buf)[:] = arr
+            arrays.append((block.name, arr.shape, arr.dtype.str))
+
+        results = {}
+
+        def task_done(task, task_results):
+            i, folds = tasks[task]
+            for fold, result in zip(folds, task_results):
+                results[i, fold] = result
+                if callback and fold:
+                    callback()
+
+        with _process_pool(
+                n_jobs, initializer=_init_worker,
+                initargs=(domain, time_variable, arrays)) as executor:
+            _map_in_pool(
+                executor, _evaluate_folds_in_worker,
+                [(models[i], folds, forecast_steps, warm_start)
+                 for i, folds in tasks],
+                task_done)
+        return results
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def model_evaluation(data, models, n_folds, forecast_steps, *, callback=None,
+                     n_jobs=None, warm_start=False, interp_data=None):
     """
     Evaluate models on data.
 
@@ -509,6 +1421,20 @@ def model_evaluation(data, models, n_folds, forecast_steps, *, callback=None):
         Number of forecast steps at each iteraction.
     callback : callable, optional
         Optional argument-less callback to call after each iteration.
+    n_jobs : int, optional
+        Number of processes to fit the models in. If None or 1, the models
+        are fitted in this process (and are left fitted to the entire
+        data); -1 uses all processors. Otherwise, the models are copied
+        to worker processes, which share the data with this process.
+    warm_start : bool
+        If True, each fit of a model starts the optimization from the
+        parameters fitted on the previous (one window longer) fold instead
+        of the default start parameters. This is much faster for models
+        that support it, like ARIMA. Models are then evaluated on
+        all folds within the same process.
+    interp_data : Timeseries, optional
+        `data` with interpolated missing values, if already computed
+        by the caller; otherwise, it is computed from `data`.
 
     Returns
     -------
@@ -525,7 +1451,7 @@ def model_evaluation(data, models, n_folds, forecast_steps, *, callback=None):
             'Supplied time series is too short for this many folds '
             '/ step size. Retry with fewer iterations.')
 
-    def _score_vector(model, true, pred):
+    def _score_vector(model, true, pred, criteria):
         true = np.asanyarray(true)
         pred = np.asanyarray(pred)
         nonnan = ~np.isnan(true)
@@ -537,46 +1463,51 @@ def model_evaluation(data, models, n_folds, forecast_steps, *, callback=None):
             row.extend(score(true, pred) for score in (rmse, mae, mape, pocid, r2))
         else:
             row.extend(['err'] * 5)
-        try:
-            row.extend([model.results.aic, model.results.bic])
-        except Exception:
-            row.extend(['err'] * 2)
+        row.extend(criteria or ['err'] * 2)
         return row
 
     res = [['Model', 'RMSE', 'MAE', 'MAPE', 'POCID', 'R²', 'AIC', 'BIC']]
-    interp_data = data.interp()
+    if interp_data is None:
+        interp_data = data.interp()
     true_y = np.ravel(data[:, data.domain.class_var])
 
-    for model in models:
+    # Fold 0 is the in-sample fit on all data
+    folds = (*range(1, n_folds + 1), 0)
+    if warm_start:
+        tasks = [(i, folds) for i in range(len(models))]
+    else:
+        tasks = [(i, (fold, )) for i in range(len(models)) for fold in folds]
+    if n_jobs in (None, 1):
+        results = {}
+        for i, task_folds in tasks:
+            results.update(zip(
+                ((i, fold) for fold in task_folds),
+                _evaluate_folds(models[i], interp_data, task_folds,
+                                forecast_steps, warm_start, callback)))
+    else:
+        results = _evaluate_in_pool(models, interp_data, tasks, forecast_steps,
+                                    warm_start, n_jobs, callback)
+
+    for i, model in enumerate(models):
         full_true = []
         full_pred = []
+        criteria = None
         for fold in range(1, n_folds + 1):
-            train_end = -fold * forecast_steps
-            try:
-                model.fit(interp_data[:train_end])
-                pred, _, _ = model.predict(forecast_steps)
-            except Exception:
+            if results[i, fold] is None:
                 continue
-            finally:
-                if callback:
-                    callback()
-
+            pred, criteria = results[i, fold]
+            train_end = -fold * forecast_steps
             full_true.extend(true_y[train_end:][:forecast_steps])  # Sliced twice because it doesn't work at the end, e.g. [-3:0] == [] :(
-            full_pred.extend(np.c_[pred][:, 0])  # Only interested in the class var
+            full_pred.extend(pred)
             assert len(full_true) == len(full_pred)
 
-        res.append(_score_vector(model, full_true, full_pred))
+        res.append(_score_vector(model, full_true, full_pred, criteria))
 
         # Score in-sample fittedvalues
-        try:
-            model.fit(interp_data)
-            fittedvalues = model.fittedvalues()
-            if fittedvalues.ndim > 1:
-                fittedvalues = fittedvalues[..., 0]
-        except Exception:
+        if results[i, 0] is None:
             row = ['err'] * 8
         else:
-            row = _score_vector(model, true_y, fittedvalues)
+            row = _score_vector(model, true_y, *results[i, 0])
         row[0] = row[0] + ' (in-sample)'
         res.append(row)
     return res
@@ -1,9 +1,12 @@
+import warnings
 from itertools import chain
+from types import SimpleNamespace
 
 import numpy as np
 import statsmodels
 from scipy.stats import norm
 import statsmodels.api as sm
+from statsmodels.tools.sm_exceptions import MissingDataError
 
 from Orange.data import Table
 from orangecontrib.timeseries import Timeseries, rmse, mape, mae, pocid, r2
@@ -16,6 +19,14 @@ class NotFittedError(ValueError, AttributeError):
     """Raised when model predictions made without fitting"""
 
 
+def _fit_series(model, data):
+    """Return the model fitted to data, or the exception if fitting fails"""
+    try:
+        return model.fit(data)
+    except Exception as ex:
+        return ex
+
+
 class _BaseModel:
     REQUIRES_STATIONARY = True
     SUPPORTS_VECTOR = False
@@ -31,12 +42,17 @@ class _BaseModel:
         self._model_kwargs = dict(missing='raise')
         self._fit_kwargs = dict()
         self._endog = None
+        self._exog = None
 
         self._table_var_names = None
         self._table_name = None
         self._table_timevar = None
         self._table_timevals = None
 
+        # Fitted copies of the model and errors by series; see fit_many()
+        self.series_models = {}
+        self.series_errors = {}
+
     def _before_init(self, endog, exog):
         """
         This method is called before the statsmodels model is init. It can
@@ -149,7 +165,41 @@ class _BaseModel:
             X = X[:defined_range]
         return y, X
 
-    def fit(self, endog, exog=None):
+    def _init_model(self):
+        """Return the statsmodels model for the stored endog and exog"""
+        kwargs = self._model_kwargs.copy()
+        kwargs.update(endog=self._endog)
+        if self._exog is not None:
+            kwargs.update(exog=self._exog)
+        return self.__wrapped__(**kwargs)
+
+    def _restore_results(self, params):
+        """
+        Recreate the statsmodels model and results with the given (fitted)
+        parameters from stored data; see `__setstate__`. By default, the
+        model is refitted, which is exact for models without optimization.
+        Override it to avoid refitting, if possible.
+        """
+        self.model = self._init_model()
+        self.results = self.model.fit(**self._fit_kwargs)
+
+    def _callback_kwargs(self, callback):
+        """
+        Return fit() arguments with which the statsmodels model calls
+        the argument-less `callback` in each iteration of optimization.
+        Override it if the wrapped model supports callbacks.
+        """
+        return {}
+
+    def _start_params_kwargs(self, start_params):
+        """
+        Return fit() arguments with which the statsmodels model starts the
+        optimization from `start_params`. Override it if the wrapped model
+        supports it.
+        """
+        return {}
+
+    def fit(self, endog, exog=None, *, callback=None, start_params=None):
         """
         Fit the model to endogenous variable endog, optionally given
         exogenous column variables exog.
@@ -162,6 +212,13 @@ class _BaseModel:
         exog : array_like
             If model supports it, the additional independent variables (X) of
             shape ``[nobs, k_vars]``.
+        callback : callable, optional
+            An argument-less callback, called in each iteration of fitting,
+            if the model supports it. Raising an exception aborts the fit.
+        start_params : array_like, optional
+            If the model supports it, parameters (e.g. `results.params`
+            of the same model fitted to similar data) from which to start
+            the optimization.
 
         Returns
         -------
@@ -178,17 +235,136 @@ class _BaseModel:
 
         endog, exog = self._before_init(endog, exog)
         self._endog = endog
-        kwargs = self._model_kwargs.copy()
-        kwargs.update(endog=endog)
-        if exog is not None:
-            kwargs.update(exog=exog)
-        model = self.model = self.__wrapped__(**kwargs)
+        self._exog = exog
+        model = self.model = self._init_model()
 
         self._before_fit(endog, exog)
         kwargs = self._fit_kwargs.copy()
+        if callback is not None:
+            kwargs.update(self._callback_kwargs(callback))
+        if start_params is not None:
+            kwargs.update(self._start_params_kwargs(start_params))
         self.results = model.fit(**kwargs)
         return self
 
+    @staticmethod
+    def _many_series(data, variables, group_var):
+        """Yield (name, table) for each series; see `fit_many`"""
+        if group_var is None:
+            from Orange.data import Domain
+            if variables is None:
+                variables = [var for var in data.domain.variables
+                             if var.is_continuous
+                             and var is not getattr(data, 'time_variable', None)]
+            for var in variables:
+                yield var.name, data.transform(Domain([], var))
+        else:
+            column = data.get_column(group_var)
+            if group_var.is_discrete:
+                values = np.unique(column[~np.isnan(column)])
+                names = [group_var.values[int(value)] for value in values]
+            else:
+                values = names = sorted(set(column) - {'', None})
+            for name, value in zip(names, values):
+                yield name, data[column == value]
+
+    def fit_many(self, data, variables=None, group_var=None, *, n_jobs=None):
+        """
+        Fit an independent copy of the model to each of many series in data.
+
+        The series are either the given columns, each fitted as the only
+        variable, or groups of rows with the same value of `group_var`,
+        each fitted as by `fit(group)`. Fitted models are stored in
+        `series_models`; series that failed to fit are reported in
+        `series_errors`. Both are dictionaries with series names as keys.
+
+        Parameters
+        ----------
+        data : Timeseries
+            Time series with one series per column, or, with `group_var`,
+            consecutive rows of many series.
+        variables : list of Variable, optional
+            Columns to fit if `group_var` is not given. Defaults to all
+            continuous variables except the time variable.
+        group_var : DiscreteVariable or StringVariable, optional
+            Variable (e.g. an id meta) that identifies the series of rows.
+        n_jobs : int, optional
+            Number of processes to fit the models in. None or 1 fits them
+            in this process; -1 uses all processors.
+
+        Returns
+        -------
+        self
+        """
+        names, tables = [], []
+        for name, table in self._many_series(data, variables, group_var):
+            names.append(name)
+            tables.append(table)
+        models = [self.clone() for _ in names]
+
+        if n_jobs in (None, 1):
+            fitted = map(_fit_series, models, tables)
+        else:
+            from orangecontrib.timeseries.functions import \
+                _process_pool, _map_in_pool
+            with _process_pool(n_jobs) as executor:
+                fitted = _map_in_pool(executor, _fit_series,
+                                      list(zip(models, tables)))
+
+        self.series_models = {}
+        self.series_errors = {}
+        for name, model in zip(names, fitted):
+            if isinstance(model, Exception):
+                self.series_errors[name] = model
+            else:
+                self.series_models[name] = model
+        return self
+
+    def predict_many(self, steps=1, *, alpha=.05):
+        """Forecast all series fitted by `fit_many`.
+
+        Series for which forecasting fails are added to `series_errors`.
+
+        Parameters
+        ----------
+        steps : int
+            The number of steps to make forecast for.
+        alpha : float
+            Calculate and return (1-alpha)100% confidence intervals.
+
+        Returns
+        -------
+        forecast : Timeseries
+            A table with a row for each series and step, with columns for
+            step, forecast and confidence intervals, and the series name
+            as meta attribute. For vector models, these are the forecasts
+            of the first (target) variable.
+        """
+        from Orange.data import Domain, ContinuousVariable, StringVariable
+        X, names = [], []
+        for name, model in self.series_models.items():
+            try:
+                prediction = np.asarray(model.predict(steps, alpha=alpha))
+            except Exception as ex:
+                self.series_errors[name] = ex
+                continue
+            if prediction.ndim > 2:
+                prediction = prediction[..., 0]
+            X.append(np.column_stack((np.arange(1, steps + 1), prediction.T)))
+            names += [name] * steps
+
+        confidence = int((1 - alpha) * 100)
+        mean = ContinuousVariable('Forecast')
+        low = ContinuousVariable('{:d}%CI low'.format(confidence))
+        high = ContinuousVariable('{:d}%CI high'.format(confidence))
+        low.ci_percent = high.ci_percent = confidence
+        mean.ci_attrs = (low, high)
+        domain = Domain([ContinuousVariable('Step'), mean, low, high],
+                        metas=[StringVariable('Series')])
+        return Timeseries.from_numpy(
+            domain, np.vstack(X) if X else np.empty((0, 4)),
+            metas=np.array(names, dtype=object).reshape(-1, 1))
+
     def errors(self):
         """Return dict of RMSE/MAE/MAPE/POCID/R² errors on in-sample, fitted values
 
@@ -265,16 +441,51 @@ class _BaseModel:
         self.model = None
         self.results = None
         self._endog = None
+        self._exog = None
         self._table_var_names = None
         self._table_name = None
         self._table_timevar = None
         self._table_timevals = None
+        self.series_models = {}
+        self.series_errors = {}
+
+    def get_params(self):
+        """Return the model's parameters, i.e. arguments of the constructor"""
+        from inspect import signature
+        return {name: getattr(self, name)
+                for name in list(signature(type(self).__init__).parameters)[1:]}
+
+    def clone(self):
+        """Return an unfitted model with the same parameters and name"""
+        model = type(self)(**self.get_params())
+        if hasattr(self, 'name'):
+            model.name = self.name
+        return model
 
     def copy(self):
         """Copy the current model"""
         from copy import deepcopy
         return deepcopy(self)
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.model is not None and self.results is not None:
+            # Statsmodels' models and results keep many copies of data and
+            # of matrices derived from it; store just the fitted parameters
+            state.update(model=None, results=None,
+                         _fitted_params=self.results.params)
+        return state
+
+    def __setstate__(self, state):
+        params = state.pop('_fitted_params', None)
+        # Models pickled before these attributes were added
+        self.__dict__.setdefault('_exog', None)
+        self.__dict__.setdefault('series_models', {})
+        self.__dict__.setdefault('series_errors', {})
+        self.__dict__.update(state)
+        if params is not None:
+            self._restore_results(params)
+
 
 class ARIMA(_BaseModel):
     """Autoregressive integrated moving average (ARIMA) model
@@ -290,6 +501,23 @@ class ARIMA(_BaseModel):
         Tuple of three non-negative integers: (p) the AR order, (d) the
         degree of differencing, and (q) the order of MA model.
         If d = 0, this becomes an ARMA model.
+    use_exog : bool
+        If True, exogenous variables passed to fit() are used.
+    method : {'auto', 'statespace', 'innovations_mle', 'hannan_rissanen', \
+              'yule_walker', 'burg'}
+        Estimation method (see `statsmodels.tsa.arima.model.ARIMA.fit`).
+        'statespace' is the exact maximum likelihood estimation with
+        Kalman filter; 'innovations_mle' also maximizes the likelihood, but
+        faster; the remaining methods are cheaper approximations, and
+        'yule_walker' and 'burg' only support AR models. 'auto' uses
+        'statespace' for series shorter than `LONG_SERIES`, and seasonal
+        and integrated models; other models of long series are fitted with
+        'yule_walker' or 'innovations_mle', if they are without or with
+        MA component, respectively.
+    concentrate_scale : bool
+        If True, the scale (variance of errors) is concentrated out of the
+        likelihood, which speeds up the optimization; only used by
+        'statespace' method.
 
     Returns
     -------
@@ -298,16 +526,45 @@ class ARIMA(_BaseModel):
     REQUIRES_STATIONARY = False
     __wrapped__ = statsmodels.tsa.arima.model.ARIMA
 
-    def __init__(self, order=(1, 0, 0), use_exog=False):
+    METHODS = ('auto', 'statespace', 'innovations_mle', 'hannan_rissanen',
+               'yule_walker', 'burg')
+    LONG_SERIES = 1000
+
+    def __init__(self, order=(1, 0, 0), use_exog=False, method='auto',
+                 concentrate_scale=False):
         super().__init__()
+        if method not in self.METHODS:
+            raise ValueError('Unknown estimation method: {}'.format(method))
         self.order = order
         self.use_exog = use_exog
+        self.method = method
+        self.concentrate_scale = concentrate_scale
+        self._fit_method = None
         self._model_kwargs.update(order=order)
 
     def __str__(self):
-        return '{}({})'.format('AR{}MA{}'.format('I' if self.order[1] else '',
-                                                 'X' if self.use_exog else ''),
-                               ','.join(map(str, self.order)))
+        return '{}({}{})'.format('AR{}MA{}'.format('I' if self.order[1] else '',
+                                                   'X' if self.use_exog else ''),
+                                 ','.join(map(str, self.order)),
+                                 '; ' + self.method if self.method != 'auto' else '')
+
+    def __setstate__(self, state):
+        # Models pickled before estimation methods could be chosen
+        self.__dict__.setdefault('method', 'auto')
+        self.__dict__.setdefault('concentrate_scale', False)
+        self.__dict__.setdefault('_fit_method', None)
+        super().__setstate__(state)
+
+    def _select_method(self, nobs):
+        if self.method != 'auto':
+            return self.method
+        seasonal_order = self._model_kwargs.get('seasonal_order')
+        # Other methods difference integrated models themselves (with
+        # a warning), which is slower than the state space model
+        if nobs < self.LONG_SERIES or self.order[1] > 0 \
+                or seasonal_order and any(seasonal_order):
+            return 'statespace'
+        return 'yule_walker' if self.order[2] == 0 else 'innovations_mle'
 
     def _predict(self, steps, exog, alpha):
         pred_res = self.results.get_forecast(steps, exog=exog)
@@ -315,10 +572,35 @@ class ARIMA(_BaseModel):
         confint = pred_res.conf_int(alpha=alpha)
         return np.c_[forecast, confint].T
 
+    def _callback_kwargs(self, callback):
+        if self._fit_method == 'statespace':
+            return dict(method_kwargs=dict(callback=lambda _params: callback()))
+        if self._fit_method == 'innovations_mle':
+            return dict(method_kwargs=dict(
+                minimize_kwargs=dict(callback=lambda _params: callback())))
+        return {}
+
+    def _start_params_kwargs(self, start_params):
+        if self._fit_method == 'statespace':
+            return dict(start_params=start_params)
+        return {}
+
+    def _restore_results(self, params):
+        # All estimation methods end by smoothing with the estimated params
+        self.model = self._init_model()
+        self.results = self.model.smooth(params)
+
     def _before_init(self, endog, exog):
         exog = exog if self.use_exog else None
         if len(endog) == 0:
             raise ValueError('Need an endogenous (target) variable to fit')
+        self._fit_method = method = self._select_method(len(endog))
+        self._fit_kwargs.update(method=method)
+        if method == 'statespace':
+            self._model_kwargs.update(concentrate_scale=self.concentrate_scale)
+        else:
+            # Other methods don't support it
+            self._model_kwargs.pop('concentrate_scale', None)
         return endog, exog
 
     def _fittedvalues(self):
@@ -328,6 +610,208 @@ class ARIMA(_BaseModel):
         return self.results.predict(**kwargs)
 
 
+def _arima_ic(endog, exog, order, seasonal_order, ic):
+    """Return the information criterion of ARIMA fitted to the data,
+    or inf if fitting fails"""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            model = statsmodels.tsa.arima.model.ARIMA(
+                endog, exog, order=order, seasonal_order=seasonal_order,
+                missing='raise')
+            value = getattr(model.fit(), ic)
+    except Exception:
+        return np.inf
+    return value if np.isfinite(value) else np.inf
+
+
+# Data for fitting AutoARIMA's candidate models, set in each worker process
+_auto_arima_data = None
+
+
+def _init_auto_arima_worker(endog, exog):
+    global _auto_arima_data
+    _auto_arima_data = endog, exog
+
+
+def _arima_ic_in_worker(order, seasonal_order, ic):
+    return _arima_ic(*_auto_arima_data, order, seasonal_order, ic)
+
+
+class AutoARIMA(ARIMA):
+    """ARIMA model with automatically selected order
+
+    The degree of differencing `d` is the number of differences after which
+    the KPSS test no longer rejects stationarity. If `period` is given,
+    seasonal differencing is used when the seasonal component, estimated
+    with STL, is strong. AR and MA orders are then chosen by stepwise
+    search (Hyndman and Khandakar, 2008): starting from a few simple
+    models, it moves to the neighbouring order with the lowest information
+    criterion, until no neighbour improves it.
+
+    After fitting, the model is an ARIMA model of the selected order.
+
+    Parameters
+    ----------
+    max_p : int
+        Maximal order of the AR model.
+    max_d : int
+        Maximal degree of differencing.
+    max_q : int
+        Maximal order of the MA model.
+    period : int, optional
+        Seasonal period. If given, the search also includes seasonal
+        AR, MA and differencing orders up to 1.
+    ic : {'aicc', 'aic', 'bic', 'hqic'}
+        The information criterion to minimize.
+    use_exog : bool
+        If True, exogenous variables are used (see `ARIMA`).
+    method : str
+        Estimation method of the selected model (see `ARIMA`). Candidate
+        models are always compared by exact maximum likelihood.
+    n_jobs : int, optional
+        Number of processes in which the candidate models are fitted.
+        None or 1 fits them in this process; -1 uses all processors.
+
+    Returns
+    -------
+    unfitted_model
+    """
+    def __init__(self, max_p=5, max_d=2, max_q=5, period=None, ic='aicc',
+                 use_exog=False, method='auto', n_jobs=None):
+        super().__init__((0, 0, 0), use_exog, method)
+        self.max_p = max_p
+        self.max_d = max_d
+        self.max_q = max_q
+        self.period = period if period and period > 1 else None
+        self.ic = ic
+        self.n_jobs = n_jobs
+        self.seasonal_order = (0, 0, 0, 0)
+
+    def __str__(self):
+        if self.results is None:
+            return 'AutoARIMA'
+        seasonal = ''
+        if self.period:
+            seasonal = '({}){}'.format(','.join(map(str, self.seasonal_order[:3])),
+                                       self.period)
+        return 'AutoARIMA({}){}'.format(','.join(map(str, self.order)),
+                                        seasonal)
+
+    @property
+    def max_order(self):
+        return max(self.max_p, self.max_d, self.max_q, self.period or 0)
+
+    def fit(self, endog, exog=None, *, callback=None, start_params=None):
+        """
+        Select the order, and fit the model to endogenous variable endog,
+        optionally given exogenous column variables exog.
+
+        See `_BaseModel.fit`. Parameters `start_params` are ignored since
+        they depend on the selected order. `callback` is also called after
+        fitting each batch of candidate models.
+        """
+        if isinstance(endog, Table):
+            assert exog is None
+            endog, exog = self._orange_arrays(endog)
+        self._select_order(*ARIMA._before_init(self, endog, exog), callback)
+        return super().fit(endog, exog, callback=callback)
+
+    def _seasonal_diffs(self, endog):
+        from statsmodels.tsa.seasonal import STL
+
+        period = self.period
+        if not period or len(endog) < 2 * period + 1:
+            return 0
+        res = STL(endog, period=period).fit()
+        # Seasonal strength as defined by Wang, Smith and Hyndman (2006)
+        strength = 1 - np.var(res.resid) / np.var(res.seasonal + res.resid)
+        return int(strength > 0.64)
+
+    def _diffs(self, endog):
+        from statsmodels.tsa.stattools import kpss
+
+        for d in range(self.max_d):
+            if len(endog) < 3 or np.ptp(endog) == 0:
+                return d
+            with warnings.catch_warnings():
+                # Warns when the p-value is outside the table
+                warnings.simplefilter('ignore')
+                pvalue = kpss(endog, nlags='auto')[1]
+            if pvalue >= 0.05:
+                return d
+            endog = np.diff(endog)
+        return self.max_d
+
+    def _select_order(self, endog, exog, callback=None):
+        from orangecontrib.timeseries.functions import \
+            _process_pool, _map_in_pool
+
+        D = self._seasonal_diffs(endog)
+        d = self._diffs(endog[self.period:] - endog[:-self.period] if D
+                        else endog)
+        # Orders are (p, q, P, Q)
+        steps = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1)]
+        if self.period:
+            starts = [(2, 2, 1, 1), (0, 0, 0, 0), (1, 0, 1, 0), (0, 1, 0, 1)]
+            steps = [step + (0, 0) for step in steps] \
+                + [(0, 0) + step for step in steps]
+            max_orders = (self.max_p, self.max_q, 1, 1)
+        else:
+            starts = [(2, 2, 0, 0), (0, 0, 0, 0), (1, 0, 0, 0), (0, 1, 0, 0)]
+            steps = [step + (0, 0) for step in steps]
+            max_orders = (self.max_p, self.max_q, 0, 0)
+
+        def arima_orders(orders):
+            p, q, P, Q = orders
+            return (p, d, q), (P, D, Q, self.period or 0)
+
+        def valid(orders):
+            return all(0 <= o <= m for o, m in zip(orders, max_orders))
+
+        executor = None
+        if self.n_jobs not in (None, 1):
+            executor = _process_pool(
+                self.n_jobs, initializer=_init_auto_arima_worker,
+                initargs=(endog, exog))
+
+        ics = {}
+        try:
+            candidates = [orders for orders in starts if valid(orders)]
+            best = None
+            while candidates:
+                args = [arima_orders(orders) for orders in candidates]
+                if executor is None:
+                    values = [_arima_ic(endog, exog, *a, self.ic) for a in args]
+                else:
+                    values = _map_in_pool(executor, _arima_ic_in_worker,
+                                          [a + (self.ic, ) for a in args])
+                ics.update(zip(candidates, values))
+                if callback is not None:
+                    callback()
+                new_best = min(ics, key=ics.get)
+                if new_best == best:
+                    break
+                best = new_best
+                candidates = [
+                    orders for orders in (tuple(map(sum, zip(best, step)))
+                                          for step in steps)
+                    if valid(orders) and orders not in ics]
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        if ics[best] == np.inf:
+            best = (0, 0, 0, 0)
+        self.order, self.seasonal_order = arima_orders(best)
+        self._model_kwargs.update(order=self.order,
+                                  seasonal_order=self.seasonal_order)
+
+    def _start_params_kwargs(self, start_params):
+        # Parameters of a previous fit may be for a different order
+        return {}
+
+
 class VAR(_BaseModel):
     """Vector auto-regression (VAR) model
 
@@ -353,7 +837,9 @@ class VAR(_BaseModel):
     SUPPORTS_VECTOR = True
     __wrapped__ = sm.tsa.VAR
 
-    MAX_LAGS = lambda arr: 12 * (len(arr) / 10) ** .5
+    @staticmethod
+    def MAX_LAGS(arr):
+        return int(12 * (len(arr) / 10) ** .5)
 
     def __init__(self, maxlags=None, ic=None, trend='c'):
         super().__init__()
@@ -364,6 +850,10 @@ class VAR(_BaseModel):
         self._maxlags = self.MAX_LAGS if maxlags is None else maxlags
         self._fit_kwargs.update(maxlags=maxlags, trend=trend, ic=ic)
 
+    @property
+    def maxlags(self):
+        return None if callable(self._maxlags) else self._maxlags
+
     def __str__(self):
         args = ('auto' if callable(self._maxlags) else self._maxlags,
                 self.ic,
@@ -401,3 +891,169 @@ class VAR(_BaseModel):
         err = q * sigma
         return np.asarray([forecast, forecast - err, forecast + err])
 
+
+
+class _ClosedFormModel(_BaseModel):
+    """Base class for simple forecasting models with closed-form estimates
+
+    The model is computed with numpy for all columns (series) at once.
+    Forecasts are normally distributed with standard deviations computed
+    from the residuals' mean square.
+    """
+    REQUIRES_STATIONARY = False
+
+    # Number of estimated parameters (e.g. mean or drift)
+    _n_params = 0
+
+    def _fit_values(self, y):
+        """Return in-sample fitted values for the last rows of 2d array y"""
+        raise NotImplementedError
+
+    def _forecast(self, y, steps, sigma):
+        """Return the forecast and its standard deviations, (steps, k)"""
+        raise NotImplementedError
+
+    def fit(self, endog, exog=None, *, callback=None, start_params=None):
+        """
+        Fit the model to endogenous variable(s) endog.
+
+        See `_BaseModel.fit`. Unlike there, endog can be an array of
+        shape ``[nobs, k]`` to fit ``k`` independent series at once,
+        while for tables, the model is fitted to the target variable.
+        Arguments `exog`, `callback` and `start_params` are ignored.
+        """
+        if isinstance(endog, Table):
+            endog, _ = self._orange_arrays(endog)
+        endog = np.asarray(endog, dtype=float)
+        if len(endog) <= max(self.max_order, self._n_params):
+            raise ValueError('Time series is too short for this model')
+        # As statsmodels' models with missing='raise'
+        if np.isnan(endog).any():
+            raise MissingDataError('NaNs were encountered in the data')
+
+        y = endog.reshape(len(endog), -1)
+        fitted = self._fit_values(y)
+        resid = y[-len(fitted):] - fitted
+        nobs = len(resid)
+        sse = np.sum(resid ** 2, axis=0)
+        loglike = -nobs / 2 * np.sum(np.log(2 * np.pi * sse / nobs) + 1)
+        n_params = (self._n_params + 1) * y.shape[1]  # + 1 for variance
+        if endog.ndim == 1:
+            fitted, resid = fitted[:, 0], resid[:, 0]
+        self._endog = endog
+        self.results = SimpleNamespace(
+            fittedvalues=fitted, resid=resid,
+            sigma=np.sqrt(sse / max(nobs - self._n_params, 1)),
+            aic=-2 * loglike + 2 * n_params,
+            bic=-2 * loglike + np.log(nobs) * n_params)
+        return self
+
+    def _predict(self, steps, exog, alpha):
+        y = self._endog.reshape(len(self._endog), -1)
+        forecast, sd = self._forecast(y, steps, self.results.sigma)
+        err = norm.ppf(1 - alpha / 2) * sd
+        prediction = np.array([forecast, forecast - err, forecast + err])
+        if self._endog.ndim == 1:
+            prediction = prediction[..., 0]
+        return prediction
+
+    def __str__(self):
+        return self.__class__.__name__
+
+
+class Mean(_ClosedFormModel):
+    """Mean model: forecasts equal the mean of the series
+
+    Returns
+    -------
+    unfitted_model
+    """
+    _n_params = 1
+
+    def _fit_values(self, y):
+        return np.repeat(y.mean(axis=0)[None, :], len(y), axis=0)
+
+    def _forecast(self, y, steps, sigma):
+        forecast = np.repeat(y.mean(axis=0)[None, :], steps, axis=0)
+        sd = np.repeat(sigma[None, :] * np.sqrt(1 + 1 / len(y)), steps, axis=0)
+        return forecast, sd
+
+
+class Naive(_ClosedFormModel):
+    """Naive (random walk) model: forecasts equal the last observed value
+
+    Returns
+    -------
+    unfitted_model
+    """
+    def __init__(self):
+        super().__init__()
+        self.order = (1,)
+
+    def _fit_values(self, y):
+        return y[:-1]
+
+    def _forecast(self, y, steps, sigma):
+        forecast = np.repeat(y[-1:], steps, axis=0)
+        sd = sigma * np.sqrt(np.arange(1, steps + 1))[:, None]
+        return forecast, sd
+
+
+class SeasonalNaive(_ClosedFormModel):
+    """Seasonal naive model: forecasts equal the last observed value from
+    the same season
+
+    Parameters
+    ----------
+    period : int
+        The number of observations in a season.
+
+    Returns
+    -------
+    unfitted_model
+    """
+    def __init__(self, period=12):
+        super().__init__()
+        self.period = period
+        self.order = (period,)
+
+    def __str__(self):
+        return '{}({})'.format(self.__class__.__name__, self.period)
+
+    def _fit_values(self, y):
+        return y[:-self.period]
+
+    def _forecast(self, y, steps, sigma):
+        period = self.period
+        steps = np.arange(steps)
+        forecast = y[len(y) - period + steps % period]
+        sd = sigma * np.sqrt(steps // period + 1)[:, None]
+        return forecast, sd
+
+
+class Drift(_ClosedFormModel):
+    """Drift model: forecasts extrapolate the line between the first and
+    the last observed value
+
+    Returns
+    -------
+    unfitted_model
+    """
+    _n_params = 1
+
+    def __init__(self):
+        super().__init__()
+        self.order = (1,)
+
+    @staticmethod
+    def _slope(y):
+        return (y[-1] - y[0]) / (len(y) - 1)
+
+    def _fit_values(self, y):
+        return y[:-1] + self._slope(y)
+
+    def _forecast(self, y, steps, sigma):
+        h = np.arange(1, steps + 1)[:, None]
+        forecast = y[-1] + h * self._slope(y)
+        sd = sigma * np.sqrt(h * (1 + h / (len(y) - 1)))
+        return forecast, sd
@@ -1,7 +1,8 @@
 import unittest
 import numpy as np
 
-from orangecontrib.timeseries import Timeseries, autocorrelation, partial_autocorrelation
+from orangecontrib.timeseries import Timeseries, autocorrelation, \
+    partial_autocorrelation, autocorrelations
 
 
 data = Timeseries.from_file('airpassengers')
@@ -17,3 +18,71 @@ class TestAutocorrelation(unittest.TestCase):
         pacf = partial_autocorrelation(data.Y)
         np.testing.assert_equal(pacf[:3, 0], [9, 13, 25])
         np.testing.assert_equal(pacf[0, 1] > 0, True)
+
+    def test_batched_acf(self):
+        from statsmodels.tsa.stattools import acf
+
+        rng = np.random.default_rng(0)
+        X = np.column_stack((data.Y, rng.normal(size=(len(data), 2))))
+        X[:, 2] = 1
+        corrs, bands = autocorrelations(X, nlags=40, alpha=.05)
+        self.assertEqual(corrs.shape, (41, 3))
+        self.assertEqual(bands.shape, (41, 3))
+        for i in range(2):
+            expected, confint = acf(X[:, i], nlags=40, fft=True, alpha=.05)
+            np.testing.assert_almost_equal(corrs[:, i], expected)
+            np.testing.assert_almost_equal(bands[:, i],
+                                           confint[:, 1] - expected)
+        self.assertTrue(np.isnan(corrs[:, 2]).all())
+
+        corrs = autocorrelations(data.Y[:, None])
+        self.assertEqual(corrs.shape, (int(.9 * len(data)) + 1, 1))
+        np.testing.assert_equal(autocorrelation(data.Y)[:4, 0],
+                                [12, 24, 36, 48])
+
+
+class TestCrossCorrelation(unittest.TestCase):
+    def test_cross_correlation(self):
+        from Orange.data import Domain
+        from orangecontrib.timeseries import cross_correlation
+
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(300, 4))
+        X[3:, 1] = X[:-3, 0]
+        X[:-5, 3] = -X[5:, 2]
+        table = Timeseries.from_numpy(Domain.from_numpy(X), X)
+        callback_values = []
+        res = cross_correlation(table, 10, callback=callback_values.append)
+        self.assertEqual(len(res), 6)
+        self.assertEqual(callback_values[-1], 1)
+        res = {tuple(r[2:]): r[:2] for r in res}
+        lag, corr = res["Feature 1", "Feature 2"]
+        self.assertEqual(lag, 3)
+        self.assertAlmostEqual(corr, 1, delta=0.05)
+        # Feature 4 leads
+        lag, corr = res["Feature 4", "Feature 3"]
+        self.assertEqual(lag, 5)
+        self.assertAlmostEqual(corr, -1, delta=0.05)
+
+        # Peaks beyond max lag are not found
+        res = cross_correlation(table, 2)
+        self.assertNotIn(["Feature 1", "Feature 2"],
+                         [r[2:] for r in res if abs(r[1]) > 0.5])
+
+    def test_peaks_match_direct_computation(self):
+        from orangecontrib.timeseries.functions import \
+            _cross_correlation_peaks
+
+        rng = np.random.default_rng(1)
+        X = rng.normal(size=(50, 3)).cumsum(axis=0)
+        X[:, 2] = 1
+        lags, peaks = _cross_correlation_peaks(X, 7)
+        x, y = (X[:, :2] - X[:, :2].mean(axis=0)).T / X[:, :2].std(axis=0)[:, None]
+        ccf = {lag: (x[:50 - lag] @ y[lag:] if lag >= 0
+                     else x[-lag:] @ y[:50 + lag]) / 50
+               for lag in range(-7, 8)}
+        lag = max(ccf, key=lambda lag: abs(ccf[lag]))
+        self.assertEqual(lags[0, 1], lag)
+        self.assertAlmostEqual(peaks[0, 1], ccf[lag])
+        self.assertTrue(np.isnan(peaks[:, 2]).all())
+        self.assertTrue(np.isnan(peaks[1:, :2]).all())
@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+
+from orangecontrib.timeseries import difference
+
+
+class TestDifference(unittest.TestCase):
+    def setUp(self):
+        self.X = np.array([[4, 5, 8],
+                           [1, -2, 0],
+                           [3, np.nan, 2],
+                           [7, np.nan, 1]])
+
+    def test_difference(self):
+        np.testing.assert_equal(
+            difference(self.X),
+            [[np.nan, np.nan, np.nan],
+             [-3, -7, -8],
+             [2, np.nan, 2],
+             [4, np.nan, -1]])
+        np.testing.assert_equal(
+            difference(self.X, shift=2, assume_zero=True),
+            [[4, 5, 8],
+             [1, -2, 0],
+             [-1, np.nan, -6],
+             [6, np.nan, 1]])
+        np.testing.assert_equal(
+            difference(self.X, 'diff2', invert=True),
+            [[5, np.nan, 10],
+             [2, np.nan, -3],
+             [np.nan, np.nan, np.nan],
+             [np.nan, np.nan, np.nan]])
+
+    def test_quotients(self):
+        np.testing.assert_almost_equal(
+            difference(self.X, 'quotient'),
+            [[np.nan, np.nan, np.nan],
+             [0.25, -0.4, 0],
+             [3, np.nan, np.nan],
+             [7 / 3, np.nan, 0.5]])
+        np.testing.assert_almost_equal(
+            difference(self.X, 'percent', invert=True),
+            [[300, -350, np.nan],
+             [-200 / 3, np.nan, -100],
+             [-400 / 7, np.nan, 100],
+             [np.nan, np.nan, np.nan]])
+
+    def test_columns_and_1d(self):
+        for op in ('diff', 'diff2', 'quotient', 'percent'):
+            block = difference(self.X, op, invert=True)
+            for i, col in enumerate(self.X.T):
+                np.testing.assert_equal(
+                    difference(col, op, invert=True), block[:, i])
+
+    def test_short(self):
+        self.assertEqual(difference(self.X, shift=5).shape, self.X.shape)
+        self.assertTrue(np.isnan(difference(self.X, shift=5)).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
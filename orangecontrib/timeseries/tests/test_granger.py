@@ -0,0 +1,128 @@
+import unittest
+
+import numpy as np
+from statsmodels.tsa.api import VAR
+from statsmodels.tsa.stattools import grangercausalitytests
+
+from Orange.data import Domain
+
+from orangecontrib.timeseries import Timeseries, granger_causality
+from orangecontrib.timeseries.functions import _granger_pvalues, \
+    _var_granger_pvalues, GRANGER_CONDITIONAL
+
+
+class TestGrangerCausality(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        X = rng.normal(size=(200, 4)).cumsum(axis=0)
+        X[3:, 1] += X[:-3, 0]
+        X[1:, 3] += 0.5 * X[:-1, 2]
+        self.X = X
+
+    def test_pvalues_match_statsmodels(self):
+        X, max_lag = self.X, 5
+        pvalues = _granger_pvalues(X, max_lag)
+        for i in range(4):
+            self.assertTrue(np.isnan(pvalues[i, i]).all())
+            for j in range(4):
+                if i == j:
+                    continue
+                tests = grangercausalitytests(X[:, [j, i]], max_lag,
+                                              verbose=False)
+                np.testing.assert_almost_equal(
+                    pvalues[i, j],
+                    [tests[lag][0]["ssr_ftest"][1]
+                     for lag in range(1, max_lag + 1)])
+
+    def test_early_exit(self):
+        X, max_lag, alpha = self.X, 5, 0.05
+        pvalues = _granger_pvalues(X, max_lag)
+        early = _granger_pvalues(X, max_lag, alpha=alpha)
+        for i in range(4):
+            for j in range(4):
+                if i == j:
+                    continue
+                significant = np.flatnonzero(pvalues[i, j] < alpha)
+                tested = significant[0] + 1 if significant.size else max_lag
+                np.testing.assert_equal(early[i, j, :tested],
+                                        pvalues[i, j, :tested])
+                self.assertTrue(np.isnan(early[i, j, tested:]).all())
+        # Feature 1 causes Feature 2 at lag 3 and isn't tested further
+        self.assertTrue(np.isnan(early[0, 1, 3:]).all())
+
+    def test_infeasible(self):
+        X = self.X.copy()
+        X[:, 2] = 1
+        pvalues = _granger_pvalues(X, 5)
+        self.assertTrue(np.isnan(pvalues[2]).all())
+        self.assertTrue(np.isnan(pvalues[:, 2]).all())
+        self.assertFalse(np.isnan(pvalues[0, 1]).any())
+
+        self.assertTrue(np.isnan(_granger_pvalues(X[:16], 5)).all())
+
+    def test_granger_causality(self):
+        data = Timeseries.from_numpy(Domain.from_numpy(self.X), self.X)
+        callback_values = []
+        res = granger_causality(data, 5, callback=callback_values.append)
+        self.assertIn(["Feature 1", "Feature 2"], [r[2:] for r in res])
+        self.assertIn(["Feature 3", "Feature 4"], [r[2:] for r in res])
+        for lag, pvalue, *_ in res:
+            self.assertLess(pvalue, 0.05)
+            self.assertTrue(1 <= lag <= 5)
+        self.assertEqual(callback_values[-1], 1)
+
+    def test_granger_causality_in_pool(self):
+        data = Timeseries.from_numpy(Domain.from_numpy(self.X), self.X)
+        expected = granger_causality(data, 5)
+        callback_values, partial = [], []
+        res = granger_causality(data, 5, n_jobs=2,
+                                callback=callback_values.append,
+                                partial_result=partial.extend)
+        self.assertEqual(res, expected)
+        self.assertEqual(sorted(partial), sorted(expected))
+        self.assertEqual(callback_values[-1], 1)
+
+    def test_pvalues_for_consequents(self):
+        pvalues = _granger_pvalues(self.X, 5)
+        part = _granger_pvalues(self.X, 5, consequents=[1, 3])
+        np.testing.assert_equal(part[:, [1, 3]], pvalues[:, [1, 3]])
+        self.assertTrue(np.isnan(part[:, [0, 2]]).all())
+
+    def test_var_pvalues_match_statsmodels(self):
+        lag, pvalues = _var_granger_pvalues(self.X, 5)
+        results = VAR(self.X).fit(maxlags=5, ic='aic')
+        self.assertEqual(lag, results.k_ar)
+        for i in range(4):
+            self.assertTrue(np.isnan(pvalues[i, i]))
+            for j in range(4):
+                if i != j:
+                    self.assertAlmostEqual(
+                        pvalues[i, j],
+                        results.test_causality(j, i, kind='f').pvalue)
+
+    def test_var_infeasible(self):
+        X = self.X.copy()
+        X[:, 2] = 1
+        _, pvalues = _var_granger_pvalues(X, 5)
+        self.assertTrue(np.isnan(pvalues[2]).all())
+        self.assertTrue(np.isnan(pvalues[:, 2]).all())
+        self.assertFalse(np.isnan(pvalues[0, 1]))
+
+        # Max lag is reduced for short series
+        lag, pvalues = _var_granger_pvalues(X[:20], 10)
+        self.assertLessEqual(lag, 5)
+        self.assertEqual(_var_granger_pvalues(X[:4], 5)[0], 0)
+
+    def test_conditional_granger_causality(self):
+        data = Timeseries.from_numpy(Domain.from_numpy(self.X), self.X)
+        res = granger_causality(data, 5, method=GRANGER_CONDITIONAL)
+        pairs = [r[2:] for r in res]
+        self.assertIn(["Feature 1", "Feature 2"], pairs)
+        self.assertIn(["Feature 3", "Feature 4"], pairs)
+        self.assertNotIn(["Feature 2", "Feature 1"], pairs)
+        lags = {lag for lag, *_ in res}
+        self.assertEqual(len(lags), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
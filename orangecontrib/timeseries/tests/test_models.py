@@ -1,7 +1,15 @@
+import pickle
 import unittest
+import warnings
+from unittest.mock import Mock, patch
+
 import numpy as np
+from statsmodels.tools.sm_exceptions import MissingDataError
+
+from Orange.data import Domain, ContinuousVariable, DiscreteVariable
 
-from orangecontrib.timeseries import Timeseries, ARIMA, VAR, model_evaluation
+from orangecontrib.timeseries import Timeseries, ARIMA, AutoARIMA, VAR, \
+    Mean, Naive, SeasonalNaive, Drift, model_evaluation
 
 
 data = Timeseries.from_file('airpassengers')
@@ -37,6 +45,78 @@ class TestARIMA(unittest.TestCase):
         pred, ci95_low, ci95_high = model.predict(10)
         np.testing.assert_equal(forecast, np.c_[pred, ci95_low, ci95_high])
 
+    def test_start_params(self):
+        model = ARIMA((2, 1, 0))
+        model.fit(data)
+        warm = ARIMA((2, 1, 0))
+        warm.fit(data[:-3], start_params=model.results.params)
+        np.testing.assert_almost_equal(
+            warm.results.params, ARIMA((2, 1, 0)).fit(data[:-3]).results.params,
+            decimal=2)
+
+    def test_method(self):
+        rng = np.random.default_rng(0)
+        long_ar = np.cumsum(rng.normal(size=ARIMA.LONG_SERIES))
+        for order, y, method in (((1, 0, 0), data, 'statespace'),
+                                 ((1, 0, 0), long_ar, 'yule_walker'),
+                                 ((1, 0, 1), long_ar, 'innovations_mle'),
+                                 ((1, 1, 0), long_ar, 'statespace'),
+                                 ((1, 1, 1), long_ar, 'statespace')):
+            model = ARIMA(order)
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                model.fit(y, callback=lambda: None)
+            self.assertEqual(model._fit_method, method)
+            self.assertFalse(
+                [warning for warning in w
+                 if "differenced" in str(warning.message)])
+
+        model = ARIMA((2, 1, 0), method='burg')
+        model.fit(data)
+        self.assertEqual(str(model), 'ARIMA(2,1,0; burg)')
+        forecast, low, high = model.predict(3)
+        np.testing.assert_array_less(low, forecast)
+
+        model = ARIMA((2, 1, 0), concentrate_scale=True)
+        model.fit(data)
+        np.testing.assert_almost_equal(
+            model.predict(3)[0], ARIMA((2, 1, 0)).fit(data).predict(3)[0], 1)
+
+        self.assertRaises(ValueError, ARIMA, method='foo')
+
+
+class TestAutoARIMA(unittest.TestCase):
+    def test_select_order(self):
+        model = AutoARIMA(period=12)
+        self.assertEqual(str(model), 'AutoARIMA')
+        model.fit(data)
+        self.assertEqual(model.order[1], 1)
+        self.assertEqual(model.seasonal_order[1:], (1, 0, 12))
+        self.assertTrue(str(model).startswith('AutoARIMA('))
+        forecast, ci95_low, ci95_high = model.predict(10)
+        self.assertTrue(
+            np.logical_and(forecast > ci95_low, forecast < ci95_high).all())
+        self.assertEqual(len(model.fittedvalues()), len(data))
+
+    def test_max_orders(self):
+        model = AutoARIMA(max_p=1, max_d=0, max_q=1)
+        model.fit(data)
+        self.assertLessEqual(model.order[0], 1)
+        self.assertEqual(model.order[1], 0)
+        self.assertLessEqual(model.order[2], 1)
+
+    def test_n_jobs(self):
+        model = AutoARIMA(max_p=2, max_q=2)
+        model.fit(data)
+        parallel = AutoARIMA(max_p=2, max_q=2, n_jobs=2)
+        parallel.fit(data)
+        self.assertEqual(model.order, parallel.order)
+
+    def test_callback(self):
+        callback = Mock()
+        AutoARIMA(max_p=2, max_q=2).fit(data, callback=callback)
+        self.assertGreater(callback.call_count, 0)
+
 
 class TestVAR(unittest.TestCase):
     def test_predict(self):
@@ -52,6 +132,184 @@ class TestVAR(unittest.TestCase):
         forecast = model.predict(10, as_table=True)
         self.assertEqual(len(forecast.domain.variables), 2 * (1 + 2))
 
+    def test_default_maxlags(self):
+        model = pickle.loads(pickle.dumps(VAR()))
+        model.fit(data)
+        self.assertEqual(model.order, (int(12 * (len(data) / 10) ** .5),))
+
+
+class TestBaselines(unittest.TestCase):
+    def test_predict(self):
+        y = np.array([1., 3, 2, 5, 4, 7])
+        for model, forecast, fitted in (
+                (Mean(), [11 / 3] * 3, [11 / 3] * 6),
+                (Naive(), [7, 7, 7], [1, 3, 2, 5, 4]),
+                (SeasonalNaive(2), [4, 7, 4], [1, 3, 2, 5]),
+                (Drift(), [8.2, 9.4, 10.6], [2.2, 4.2, 3.2, 6.2, 5.2])):
+            model.fit(y)
+            pred, low, high = model.predict(3, alpha=0.1)
+            np.testing.assert_almost_equal(pred, forecast)
+            np.testing.assert_almost_equal(high - pred, pred - low)
+            self.assertTrue(np.all(high > pred))
+            np.testing.assert_almost_equal(model.fittedvalues(), fitted)
+            np.testing.assert_almost_equal(
+                model.residuals(as_table=False), y[-len(fitted):] - fitted)
+
+    def test_intervals(self):
+        y = np.array([1., 3, 2, 5, 4, 7])
+        model = Naive().fit(y)
+        sigma = np.sqrt(np.mean(np.diff(y) ** 2))
+        _, low, high = model.predict(4)
+        np.testing.assert_almost_equal(
+            (high - low) / 2, 1.959964 * sigma * np.sqrt([1, 2, 3, 4]), 5)
+
+    def test_columns(self):
+        Y = np.random.default_rng(0).normal(size=(30, 4)).cumsum(axis=0)
+        for model in (Mean(), Naive(), SeasonalNaive(4), Drift()):
+            pred = model.fit(Y).predict(5)
+            self.assertEqual(pred.shape, (3, 5, 4))
+            np.testing.assert_almost_equal(
+                pred[:, :, 2], model.fit(Y[:, 2]).predict(5))
+
+    def test_table(self):
+        model = SeasonalNaive()
+        model.fit(data)
+        self.assertEqual(str(model), 'SeasonalNaive(12)')
+        np.testing.assert_equal(model.predict(12)[0], data.Y[-12:])
+        forecast = model.predict(3, as_table=True)
+        self.assertEqual(len(forecast.domain.variables), 1 + 2)
+
+        results = model_evaluation(data, [Mean(), Naive(), Drift(), model],
+                                   n_folds=5, forecast_steps=3)
+        self.assertNotIn('err', np.array(results, dtype=object))
+
+    def test_too_short(self):
+        self.assertRaises(ValueError, SeasonalNaive(4).fit, np.arange(4.))
+
+    def test_missing_values(self):
+        y = np.array([1., 3, np.nan, 5, 4, 7])
+        for model in (Mean(), Naive(), SeasonalNaive(2), Drift()):
+            self.assertRaises(MissingDataError, model.fit, y)
+            self.assertRaises(MissingDataError, model.fit,
+                              np.column_stack((y[::-1], y)))
+        # Same error as for statsmodels' models
+        self.assertRaises(MissingDataError, ARIMA((1, 0, 0)).fit, y)
+
+
+class TestFitMany(unittest.TestCase):
+    def setUp(self):
+        y = data.Y
+        X = np.column_stack((y, 2 * y + np.arange(len(y)) % 5,
+                             np.r_[1, 2, [np.nan] * (len(y) - 2)]))
+        self.wide = Timeseries.from_numpy(
+            Domain([ContinuousVariable(name) for name in "abc"]), X)
+
+    def test_columns(self):
+        model = ARIMA((1, 1, 0))
+        model.fit_many(self.wide, self.wide.domain.attributes[:2])
+        self.assertEqual(list(model.series_models), ["a", "b"])
+        self.assertEqual(model.series_errors, {})
+        self.assertIsNone(model.results)
+
+        forecast = model.predict_many(3, alpha=0.1)
+        self.assertEqual(
+            [var.name for var in forecast.domain.attributes],
+            ["Step", "Forecast", "90%CI low", "90%CI high"])
+        np.testing.assert_equal(forecast.metas[:, 0], list("aaabbb"))
+        np.testing.assert_equal(forecast.X[:, 0], [1, 2, 3] * 2)
+        expected = ARIMA((1, 1, 0)).fit(data).predict(3, alpha=0.1)
+        np.testing.assert_almost_equal(forecast.X[:3, 1:], np.array(expected).T)
+
+    def test_failing_series(self):
+        model = ARIMA((1, 1, 0)).fit_many(self.wide, n_jobs=2)
+        self.assertEqual(list(model.series_models), ["a", "b"])
+        self.assertEqual(list(model.series_errors), ["c"])
+        self.assertEqual(len(model.predict_many(2)), 4)
+
+    def test_fitted_model_is_not_copied(self):
+        model = ARIMA((1, 1, 0)).fit(data)
+        results = model.results
+        with patch.object(ARIMA, "copy") as copy:
+            model.fit_many(self.wide, self.wide.domain.attributes[:2])
+        copy.assert_not_called()
+        self.assertIs(model.results, results)
+        for series_model in model.series_models.values():
+            self.assertIsNot(series_model.results, results)
+
+    def test_groups(self):
+        group = DiscreteVariable("id", values=("x", "y"))
+        y = data.Y
+        ids = np.repeat([0., 1.], len(y))
+        long = Timeseries.from_numpy(
+            Domain([], ContinuousVariable("y"), [group]),
+            np.empty((2 * len(y), 0)), np.r_[y, 2 * y], ids.reshape(-1, 1))
+        model = ARIMA((1, 1, 0)).fit_many(long, group_var=group)
+        self.assertEqual(list(model.series_models), ["x", "y"])
+        forecast = model.predict_many(2)
+        np.testing.assert_equal(forecast.metas[:, 0], list("xxyy"))
+        np.testing.assert_almost_equal(forecast.X[:2, 1],
+                                       ARIMA((1, 1, 0)).fit(data).predict(2)[0])
+
+
+class TestCopy(unittest.TestCase):
+    def test_clone(self):
+        for model in (ARIMA((2, 1, 0), method='burg'), AutoARIMA(max_p=2),
+                      VAR(2, 'aic'), VAR(), SeasonalNaive(4)):
+            model.name = 'foo'
+            model.fit(data)
+            clone = model.clone()
+            self.assertIsInstance(clone, type(model))
+            self.assertIsNone(clone.results)
+            self.assertEqual(clone.get_params(), model.get_params())
+            self.assertEqual(clone.name, 'foo')
+            np.testing.assert_almost_equal(clone.fit(data).predict(3),
+                                           model.predict(3))
+
+    def test_pickle(self):
+        for model in (ARIMA((2, 1, 1)), ARIMA((1, 1, 0), method='burg'),
+                      VAR(2), Drift()):
+            model.fit(data)
+            unpickled = pickle.loads(pickle.dumps(model))
+            np.testing.assert_almost_equal(unpickled.predict(3),
+                                           model.predict(3))
+            np.testing.assert_almost_equal(unpickled.fittedvalues(),
+                                           model.fittedvalues())
+            np.testing.assert_almost_equal(model.copy().residuals(False),
+                                           model.residuals(False))
+
+    def test_unpickle_old_model(self):
+        state = ARIMA((2, 1, 0)).__dict__.copy()
+        # Attributes added after models were first pickled
+        for name in ('method', 'concentrate_scale', '_fit_method',
+                     '_exog', 'series_models', 'series_errors'):
+            del state[name]
+        model = ARIMA.__new__(ARIMA)
+        model.__setstate__(state)
+        self.assertEqual(str(model), 'ARIMA(2,1,0)')
+        self.assertEqual(model.series_models, {})
+        self.assertEqual(model.get_params()['method'], 'auto')
+        self.assertFalse(model.get_params()['concentrate_scale'])
+        np.testing.assert_almost_equal(
+            model.fit(data).predict(3),
+            ARIMA((2, 1, 0)).fit(data).predict(3))
+
+        state = VAR(2).__dict__.copy()
+        for name in ('_exog', 'series_models', 'series_errors'):
+            del state[name]
+        model = VAR.__new__(VAR)
+        model.__setstate__(state)
+        self.assertEqual(model.series_errors, {})
+        # ARIMA's attributes are not added to other models
+        self.assertNotIn('_fit_method', model.__dict__)
+
+    def test_pickle_is_compact(self):
+        model = ARIMA((2, 1, 1))
+        model.fit(data)
+        size = len(pickle.dumps(model))
+        model.clear()
+        # The fitted model only adds parameters and data
+        self.assertLess(size - len(pickle.dumps(model)), 10 * data.X.nbytes)
+
 
 class TestModelEvaluation(unittest.TestCase):
     def test_model_evaluation(self):
@@ -60,3 +318,47 @@ class TestModelEvaluation(unittest.TestCase):
         results = np.array(results, dtype=object)
         self.assertEqual(results.shape, (4 * 2 + 1, 8))
         np.testing.assert_equal(results[1:, 1:].astype(float) > 0, True)
+
+    def test_model_evaluation_warm_start(self):
+        models = [ARIMA((1, 1, 0)), VAR(1)]
+        expected = model_evaluation(data, models, n_folds=5, forecast_steps=3)
+        callback = Mock()
+        results = model_evaluation(data, models, n_folds=5, forecast_steps=3,
+                                   warm_start=True, callback=callback)
+        self.assertEqual(callback.call_count, 10)
+        np.testing.assert_almost_equal(
+            np.array(results, dtype=object)[1:, 1:].astype(float),
+            np.array(expected, dtype=object)[1:, 1:].astype(float),
+            decimal=2)
+
+    def test_model_evaluation_without_start_params(self):
+        class MeanModel:
+            max_order = 0
+
+            def fit(self, data):
+                self.y = np.ravel(data.Y)
+                return self
+
+            def predict(self, steps):
+                return np.full(steps, self.y.mean()), None, None
+
+            def fittedvalues(self):
+                return np.full(len(self.y), self.y.mean())
+
+        results = model_evaluation(data, [MeanModel()], n_folds=3,
+                                   forecast_steps=2)
+        self.assertNotIn('err', results[1][1:6])
+        self.assertNotIn('err', results[2][1:6])
+
+    def test_model_evaluation_n_jobs(self):
+        models = [ARIMA((1, 1, 0)), VAR(1), VAR(3)]
+        expected = model_evaluation(data, models, n_folds=5, forecast_steps=3)
+        callback = Mock()
+        results = model_evaluation(data, models, n_folds=5, forecast_steps=3,
+                                   n_jobs=2, callback=callback)
+        self.assertEqual(callback.call_count, 15)
+        self.assertEqual([row[0] for row in results],
+                         [row[0] for row in expected])
+        np.testing.assert_almost_equal(
+            np.array(results, dtype=object)[1:, 1:].astype(float),
+            np.array(expected, dtype=object)[1:, 1:].astype(float))
@@ -13,6 +13,80 @@ class TestPeriodogram(unittest.TestCase):
         self.assertEqual(max(pgram), 1)
         self.assertEqual(np.round(periods[pgram == 1]), 6)
 
+    def test_welch_periodogram(self):
+        from scipy.signal import welch
+        from orangecontrib.timeseries.functions import _welch
+
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=10001) + np.sin(np.arange(10001) * 2 * np.pi / 37)
+        for segment_length in (256, 255):
+            freqs, pgram = _welch(x, segment_length, detrend='linear',
+                                  block_size=1000)
+            expected_freqs, expected = welch(
+                x, nperseg=segment_length, detrend='linear')
+            np.testing.assert_almost_equal(freqs, expected_freqs)
+            np.testing.assert_almost_equal(pgram, expected)
+
+        periods, pgram = periodogram(x, segment_length=256, detrend='linear')
+        self.assertEqual(max(pgram), 1)
+        self.assertAlmostEqual(periods[pgram == 1][0], 37, delta=1)
+        self.assertLessEqual(max(periods), 256)
+
+        # Segments longer than the signal
+        periods, pgram = periodogram(data.Y, segment_length=1000)
+        self.assertEqual(max(pgram), 1)
+
+    def test_spectrogram(self):
+        from scipy.signal import spectrogram as scipy_spectrogram
+        from orangecontrib.timeseries import spectrogram
+
+        x = np.random.default_rng(0).normal(size=10000)
+        centers, freqs, sxx = spectrogram(x, 256, .25, start=100, stop=9000)
+        expected_freqs, times, expected = scipy_spectrogram(
+            x[100:9000], nperseg=256, noverlap=64, window='hann')
+        np.testing.assert_almost_equal(freqs, expected_freqs)
+        np.testing.assert_almost_equal(centers, 100 + times)
+        np.testing.assert_almost_equal(sxx, expected.T)
+
+        # Decimated frames are spread evenly over the entire range
+        centers, freqs, sxx = spectrogram(x, 256, max_frames=10)
+        self.assertEqual(sxx.shape, (10, 129))
+        self.assertEqual(centers[0], 128)
+        self.assertGreater(centers[-1], 10000 - 256)
+        _, _, expected = scipy_spectrogram(
+            x[centers[3] - 128:centers[3] + 128], nperseg=256,
+            window='hann')
+        np.testing.assert_almost_equal(sxx[3], expected[:, 0])
+
+        # Windows longer than the signal
+        centers, freqs, sxx = spectrogram(x[:100], 256)
+        self.assertEqual(sxx.shape, (1, 51))
+
     def test_periodogram_nonequispaced(self):
         periods, pgram = periodogram_nonequispaced(data.X.ravel(), data.Y, detrend='diff')
         self.assertEqual(max(pgram), 1)
+
+    def test_fast_periodogram_nonequispaced(self):
+        from scipy.signal import lombscargle
+        from orangecontrib.timeseries.functions import _fast_lombscargle
+
+        rng = np.random.default_rng(0)
+        times = np.sort(rng.uniform(0, 1000, 2000))
+        x = np.sin(2 * np.pi * times / 7) + rng.normal(size=len(times))
+        freqs = np.linspace(2 * np.pi / 500, 2 * np.pi / 2, 1000)
+        np.testing.assert_allclose(_fast_lombscargle(times, x, freqs),
+                                   lombscargle(times, x, freqs),
+                                   rtol=0.01, atol=0.05)
+
+        periods, pgram = periodogram_nonequispaced(
+            times, x, fast=True, period_low=2, period_high=100,
+            n_periods=5000)
+        self.assertEqual(max(pgram), 1)
+        self.assertAlmostEqual(periods[np.argmax(pgram)], 7, places=1)
+        slow_periods, slow_pgram = periodogram_nonequispaced(
+            times, x, period_low=2, period_high=100, n_periods=5000)
+        self.assertAlmostEqual(slow_periods[np.argmax(slow_pgram)], 7,
+                               places=1)
+
+        self.assertRaises(ValueError, periodogram_nonequispaced, times, x,
+                          freqs=2 * np.pi / np.arange(2, 10), fast=True)
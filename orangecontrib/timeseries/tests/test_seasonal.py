@@ -20,3 +20,84 @@ class TestSeasonalDecompose(unittest.TestCase):
             data[:, data.domain.class_var],
             decomp[:, 'Air passengers (season. adj.)'] * decomp[:, 'Air passengers (seasonal)'].X
         )
+
+    def test_multiple_columns(self):
+        from Orange.data import Domain
+        from statsmodels.tsa.seasonal import seasonal_decompose as sm_decompose
+
+        y = data.get_column(data.domain.class_var)
+        X = np.column_stack((y, y[::-1], np.sqrt(y)))
+        X[[10, 50], 1] = np.nan
+        table = Timeseries.from_numpy(Domain.from_numpy(X), X)
+        for model, period in (('multiplicative', 12), ('additive', 7)):
+            calls = []
+            decomp = seasonal_decompose(table, model, period,
+                                        callback=lambda: calls.append(1))
+            self.assertEqual(len(calls), 3)
+            self.assertEqual(len(decomp.domain.variables), 12)
+            for i, var in enumerate(table.domain.variables):
+                x = table.interp().get_column(var)
+                expected = sm_decompose(x, model, period=period)
+                np.testing.assert_almost_equal(
+                    decomp.get_column(f"{var.name} (seasonal)"),
+                    expected.seasonal)
+                trend = decomp.get_column(f"{var.name} (trend)")
+                nonnan = ~np.isnan(expected.trend) & ~np.isnan(X[:, i])
+                np.testing.assert_almost_equal(trend[nonnan],
+                                               expected.trend[nonnan])
+                # Trend is extrapolated to ends, but nans are kept
+                np.testing.assert_equal(np.isnan(trend), np.isnan(X[:, i]))
+
+    def test_errors(self):
+        y = data[:, data.domain.class_var]
+        self.assertRaises(ValueError, seasonal_decompose, y[:20], period=12)
+        negative = y.copy()
+        with negative.unlocked():
+            negative.Y[0] = -1
+        self.assertRaises(ValueError, seasonal_decompose, negative)
+        seasonal_decompose(negative, 'additive')
+
+    def test_stl(self):
+        from statsmodels.tsa.seasonal import STL
+        from orangecontrib.timeseries.functions import DECOMPOSE_STL
+
+        y = data[:, data.domain.class_var]
+        x = y.Y.ravel()
+        calls = []
+        decomp = seasonal_decompose(y, 'additive', method=DECOMPOSE_STL,
+                                    callback=lambda: calls.append(1))
+        self.assertEqual(len(calls), 1)
+        adjusted, seasonal, trend, resid = decomp.X.T
+        expected = STL(x, period=12, robust=True).fit()
+        np.testing.assert_almost_equal(seasonal, expected.seasonal)
+        np.testing.assert_almost_equal(trend, expected.trend)
+        np.testing.assert_almost_equal(adjusted + seasonal, x)
+        np.testing.assert_almost_equal(trend + resid, adjusted)
+
+        decomp = seasonal_decompose(y, 'multiplicative', method=DECOMPOSE_STL)
+        adjusted, seasonal, trend, resid = decomp.X.T
+        np.testing.assert_almost_equal(adjusted * seasonal, x)
+        np.testing.assert_almost_equal(trend * resid, adjusted)
+
+        self.assertRaises(ValueError, seasonal_decompose, y, period=(6, 12))
+
+    def test_mstl_in_pool(self):
+        from Orange.data import Domain
+        from orangecontrib.timeseries.functions import DECOMPOSE_STL
+
+        t = np.arange(24 * 7 * 3)
+        X = np.column_stack((np.sin(2 * np.pi * t / 24),
+                             np.sin(2 * np.pi * t / 168))) + 0.01 * t[:, None]
+        table = Timeseries.from_numpy(Domain.from_numpy(X), X)
+        calls = []
+        decomp = seasonal_decompose(table, 'additive', (24, 168),
+                                    method=DECOMPOSE_STL, n_jobs=2,
+                                    callback=lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+        serial = seasonal_decompose(table, 'additive', (24, 168),
+                                    method=DECOMPOSE_STL)
+        np.testing.assert_almost_equal(decomp.X, serial.X)
+        # Both seasons are removed
+        adjusted = decomp.X[:, [0, 4]]
+        np.testing.assert_allclose(adjusted, np.column_stack((0.01 * t,) * 2),
+                                   atol=0.1)
@@ -4,9 +4,13 @@ import unittest
 import platform
 from unittest.mock import patch
 
-from Orange.data import Table
+import numpy as np
+
+from Orange.data import Table, Domain, ContinuousVariable, StringVariable
+from Orange.preprocess.transformation import Transformation
 
 from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries.timeseries import SeriesComputeValue
 from orangecontrib.timeseries.functions import timestamp, fromtimestamp
 
 
@@ -102,6 +106,36 @@ class TestTimestamp(unittest.TestCase):
             self.assertEqual(fromtimestamp(TS, tz=timezone.utc), expected)
             self.assertTrue(was_hit)
 
+    def test_series_compute_value(self):
+        class CumSum(Transformation, SeriesComputeValue):
+            def transform(self, c):
+                return np.cumsum(c)
+
+        x = ContinuousVariable("x")
+        s = StringVariable("s")
+        n = 12000  # Table.from_table computes blocks of 5000 rows
+        data = Table.from_numpy(
+            Domain([x], None, [s]), np.arange(n, dtype=float)[:, None],
+            metas=np.full((n, 1), "a", dtype=object))
+        expected = np.cumsum(np.arange(n))
+        cumsums = [ContinuousVariable(f"c{i}", compute_value=CumSum(x))
+                   for i in range(3)]
+        domain = Domain([x, cumsums[0]], cumsums[1], [s, cumsums[2]])
+        for source in (data, Timeseries.from_data_table(data)):
+            ts = Timeseries.from_table(domain, source)
+            self.assertIsInstance(ts, Timeseries)
+            self.assertIs(ts.domain, domain)
+            np.testing.assert_equal(ts.X, np.column_stack((data.X, expected)))
+            np.testing.assert_equal(ts.Y, expected)
+            np.testing.assert_equal(ts.metas[:, 0], "a")
+            np.testing.assert_equal(ts.metas[:, 1].astype(float), expected)
+            np.testing.assert_equal(ts.ids, data.ids)
+
+            ts = Timeseries.from_table(domain, source, np.arange(100, n))
+            np.testing.assert_equal(ts.Y, np.cumsum(np.arange(100, n)))
+            np.testing.assert_equal(ts.ids, data.ids[100:])
+        self.assertEqual(data.domain, Domain([x], None, [s]))
+
 
 if __name__ == "__main__":
     unittest.main()
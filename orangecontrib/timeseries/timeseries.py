@@ -9,7 +9,7 @@ from Orange.data import Table, Domain, TimeVariable
 import Orange.data
 from os.path import join, dirname
 
-from Orange.data.util import get_unique_names
+from Orange.data.util import get_unique_names, SharedComputeValue
 
 Orange.data.table.dataset_dirs.insert(0, join(dirname(__file__), 'datasets'))
 
@@ -91,6 +91,16 @@ class TimeDelta:
         return delta[0] if len(delta) == 1 else None
 
 
+class SeriesComputeValue:
+    """
+    Mixin for compute values that depend on the entire series, not just
+    on the values in the same row (differences, moving windows ...).
+
+    `Table.from_table` computes values in blocks of rows; `Timeseries`
+    computes such columns on all rows at once.
+    """
+
+
 class Timeseries(Table):
 
     from os.path import join, dirname
@@ -164,11 +174,72 @@ class Timeseries(Table):
         return cls.convert_from_data_table(table, time_attr=time_attr)
 
     @classmethod
-    def from_table(cls, domain, source, *args, time_attr=None, **kwargs):
+    def from_table(cls, domain, source, row_indices=..., time_attr=None):
+        series = [var for var in chain(domain.variables, domain.metas)
+                  if isinstance(var.compute_value, SeriesComputeValue)
+                  and var not in source.domain]
+        if series:
+            return cls._from_table_series(
+                domain, source, row_indices, series, time_attr)
         if not isinstance(source, Timeseries):
-            table = Table.from_table(domain, source, *args, **kwargs)
+            table = Table.from_table(domain, source, row_indices)
             return cls.convert_from_data_table(table, time_attr=time_attr)
-        return super().from_table(domain, source, *args, **kwargs)
+        return super().from_table(domain, source, row_indices)
+
+    @classmethod
+    def _from_table_series(cls, domain, source, row_indices, series,
+                           time_attr):
+        """
+        Compute columns of `series` on all selected rows of `source`, and
+        the rest of `domain` by `from_table`
+        """
+        if row_indices is not ...:
+            source = source[row_indices]
+        shared = {}
+        columns = []
+        for var in series:
+            compute_value = var.compute_value
+            if isinstance(compute_value, SharedComputeValue):
+                compute_shared = compute_value.compute_shared
+                if compute_shared not in shared:
+                    shared[compute_shared] = compute_shared(source)
+                columns.append(
+                    compute_value(source, shared_data=shared[compute_shared]))
+            else:
+                columns.append(compute_value(source))
+
+        # Convert with placeholders (columns of nans) instead of `series`;
+        # unique names ensure they aren't copied (or viewed) from the source
+        names = [var.name for var in chain(source.domain, domain)]
+        placeholders = {
+            var: var.copy(compute_value=None,
+                          name=get_unique_names(names, var.name))
+            for var in series}
+
+        def replaced(variables):
+            return [placeholders.get(var, var) for var in variables]
+
+        table = cls.from_table(
+            Domain(replaced(domain.attributes), replaced(domain.class_vars),
+                   replaced(domain.metas)),
+            source, time_attr=time_attr)
+        n_attrs = len(domain.attributes)
+        for var, column in zip(series, columns):
+            index = domain.index(var)
+            if index < 0:
+                array, index = table.metas, -1 - index
+            elif index < n_attrs:
+                array = table.X
+            else:
+                array, index = table.Y, index - n_attrs
+            # Arrays with placeholders are not views, so they can be unlocked
+            with table.unlocked(array):
+                if array.ndim == 1:
+                    array[:] = column
+                else:
+                    array[:, index] = column
+        table.domain = domain
+        return table
 
     @classmethod
     def from_numpy(cls, *args, time_attr=None, **kwargs):
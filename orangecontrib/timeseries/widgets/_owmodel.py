@@ -1,14 +1,78 @@
+import hashlib
+from types import SimpleNamespace
+
+import numpy as np
+
 from AnyQt.QtCore import QTimer, Qt
 from AnyQt.QtWidgets import QFormLayout
 
 from Orange.data import Table
 from Orange.widgets import widget, gui, settings
+from Orange.widgets.utils.concurrent import TaskState, ConcurrentWidgetMixin
 from Orange.widgets.widget import Input, Output
 from orangecontrib.timeseries import Timeseries
 from orangecontrib.timeseries.models import _BaseModel
 
 
-class OWBaseModel(widget.OWWidget):
+class Results(SimpleNamespace):
+    model = None  # fitted model, if fitting succeeded
+    forecast = None
+    fitted_values = None
+    residuals = None
+    error = None  # (action, exception) if fitting or forecasting failed
+
+
+def fingerprint(data):
+    """Return a key that identifies the data, but not the table instance"""
+    return (data.domain, data.time_variable) + tuple(
+        hashlib.sha1(np.ascontiguousarray(arr)).hexdigest()
+        for arr in (data.X, data.Y))
+
+
+def run(model, data, fit, forecast_kwargs, state: TaskState):
+    """
+    Fit the model to `data` (if `fit` is set), and compute the forecast
+    (with `model.predict(**forecast_kwargs)`), fitted values and residuals
+    """
+    def interrupt():
+        if state.is_interruption_requested():
+            raise Exception
+
+    def advance(progress: float):
+        interrupt()
+        state.set_progress_value(progress)
+
+    iterations = 0
+
+    def iterate():
+        nonlocal iterations
+        iterations += 1
+        # The number of iterations is unknown, so progress approaches 70
+        advance(70 * iterations / (iterations + 10))
+
+    res = Results()
+    action = 'fitting model'
+    try:
+        if fit:
+            model.fit(data.interp(), callback=iterate)
+        res.model = model
+        advance(70)
+        action = 'forecasting'
+        res.forecast = model.predict(**forecast_kwargs, as_table=True)
+        res.forecast.name = f"Forecast ({model.name})"
+        advance(80)
+        res.fitted_values = model.fittedvalues(as_table=True)
+        res.fitted_values.name = f"Fitted values ({model.name})"
+        advance(90)
+        res.residuals = model.residuals(as_table=True)
+        res.residuals.name = f"Residuals ({model.name})"
+    except Exception as ex:
+        interrupt()
+        res = Results(model=res.model, error=(action, ex))
+    return res
+
+
+class OWBaseModel(widget.OWWidget, ConcurrentWidgetMixin, openclass=True):
     """Abstract widget representing a time series model"""
     LEARNER = None
 
@@ -37,13 +101,17 @@ class OWBaseModel(widget.OWWidget):
         model_error = widget.Msg('Error {}: {}: {}')
 
     def __init__(self):
-        super().__init__()
+        widget.OWWidget.__init__(self)
+        ConcurrentWidgetMixin.__init__(self)
         self.name_lineedit = None
         self.data = None
         self.learner = None
         self.model = None
         self.preprocessors = None
         self.outdated_settings = False
+        # (key, model) for the last fitted model; see `update_model`
+        self._fitted = None
+        self._fitting_key = None
         self.setup_layout()
         QTimer.singleShot(0, self.apply.now)
 
@@ -68,39 +136,46 @@ class OWBaseModel(widget.OWWidget):
         learner.name = self.learner_name or str(learner)
         self.Outputs.learner.send(learner)
 
-    def fit_model(self, model, data):
-        return model.fit(data.interp())
-
-    def forecast(self, model):
-        return model.predict(self.forecast_steps,
-                             alpha=1 - self.forecast_confint / 100,
-                             as_table=True)
+    def forecast_kwargs(self):
+        """Return arguments for the model's `predict`"""
+        return dict(steps=self.forecast_steps,
+                    alpha=1 - self.forecast_confint / 100)
 
     def update_model(self):
-        forecast = None
-        fittedvalues = None
-        residuals = None
         self.Error.model_error.clear()
-        if self.is_data_valid():
-            model = self.learner = self.create_learner()
-            model.name = self.learner_name or str(model)
-            try:
-                is_fit = False
-                self.fit_model(model, self.data)
-                is_fit = True
-                forecast = self.forecast(model)
-                forecast.name = f"Forecast ({model.name})"
-                fittedvalues = model.fittedvalues(as_table=True)
-                fittedvalues.name = f"Fitted values ({model.name})"
-                residuals = model.residuals(as_table=True)
-                residuals.name = f"Residuals ({model.name})"
-            except Exception as ex:
-                action = 'forecasting' if is_fit else 'fitting model'
-                self.Error.model_error(action, ex.__class__.__name__,
-                                       ex.args[0] if ex.args else '')
-        self.Outputs.forecast.send(forecast)
-        self.Outputs.fitted_values.send(fittedvalues)
-        self.Outputs.residuals.send(residuals)
+        if not self.is_data_valid():
+            self.cancel()
+            self._send_results(Results())
+            return
+        model = self.create_learner()
+        key = (fingerprint(self.data), type(model), model.get_params())
+        if self._fitted is not None and self._fitted[0] == key:
+            # Only forecast settings or name changed: reuse the fitted model
+            model, fit = self._fitted[1], False
+        else:
+            fit = True
+        self.learner = model
+        model.name = self.learner_name or str(model)
+        self._fitting_key = key
+        self.start(run, model, self.data, fit, self.forecast_kwargs())
+
+    def on_done(self, res: Results):
+        if res.model is not None:
+            self._fitted = (self._fitting_key, res.model)
+        if res.error is not None:
+            action, ex = res.error
+            self.Error.model_error(action, ex.__class__.__name__,
+                                   ex.args[0] if ex.args else '')
+        self._send_results(res)
+
+    def _send_results(self, res: Results):
+        self.Outputs.forecast.send(res.forecast)
+        self.Outputs.fitted_values.send(res.fitted_values)
+        self.Outputs.residuals.send(res.residuals)
+
+    def onDeleteWidget(self):
+        self.shutdown()
+        super().onDeleteWidget()
 
     def is_data_valid(self):
         data = self.data
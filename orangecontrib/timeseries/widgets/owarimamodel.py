@@ -7,7 +7,7 @@ from Orange.data import Domain
 from Orange.widgets import gui, settings
 from Orange.widgets.widget import Input
 
-from orangecontrib.timeseries import Timeseries, ARIMA
+from orangecontrib.timeseries import Timeseries, ARIMA, AutoARIMA
 from orangecontrib.timeseries.widgets._owmodel import OWBaseModel
 
 
@@ -17,9 +17,19 @@ class OWARIMAModel(OWBaseModel):
     icon = 'icons/ARIMA.svg'
     priority = 210
 
+    Methods = (('Automatic', 'auto'),
+               ('Exact likelihood (Kalman filter)', 'statespace'),
+               ('Innovations likelihood', 'innovations_mle'),
+               ('Hannan-Rissanen', 'hannan_rissanen'),
+               ('Yule-Walker (AR only)', 'yule_walker'),
+               ('Burg (AR only)', 'burg'))
+
     p = settings.Setting(1)
     d = settings.Setting(0)
     q = settings.Setting(0)
+    auto_order = settings.Setting(False)
+    seasonal_period = settings.Setting(0)
+    method = settings.Setting(0)
 
     class Inputs(OWBaseModel.Inputs):
         exogenous_data = Input("Exogenous data", Timeseries)
@@ -44,15 +54,40 @@ class OWARIMAModel(OWBaseModel):
                       gui.spin(None, self, 'd', 0, 2, **kwargs))
         layout.addRow('Moving average order (q):',
                       gui.spin(None, self, 'q', 0, 100, **kwargs))
+        layout.addRow(gui.checkBox(
+            None, self, 'auto_order', 'Select order automatically',
+            callback=self._auto_order_changed,
+            tooltip='Choose differencing with KPSS test, and p and q by '
+                    'stepwise search minimizing AICc'))
+        period_spin = gui.spin(None, self, 'seasonal_period', 0, 366,
+                               **kwargs)
+        period_spin.setSpecialValueText('None')
+        period_spin.setToolTip('With automatic order, also search for '
+                               'seasonal orders with this period')
+        layout.addRow('Seasonal period:', period_spin)
+        layout.addRow('Estimation:', gui.comboBox(
+            None, self, 'method', items=[label for label, _ in self.Methods],
+            callback=self.apply.deferred))
+        self._update_order_controls()
+
+    def _auto_order_changed(self):
+        self._update_order_controls()
+        self.apply.deferred()
+
+    def _update_order_controls(self):
+        for name in ('p', 'd', 'q', 'method'):
+            getattr(self.controls, name).setDisabled(self.auto_order)
+        self.controls.seasonal_period.setEnabled(self.auto_order)
 
-    def forecast(self, model):
-        return model.predict(self.forecast_steps,
-                             exog=self.exog_data,
-                             alpha=1 - self.forecast_confint / 100,
-                             as_table=True)
+    def forecast_kwargs(self):
+        return dict(super().forecast_kwargs(), exog=self.exog_data)
 
     def create_learner(self):
-        return ARIMA((self.p, self.d, self.q), self.exog_data is not None)
+        if self.auto_order:
+            return AutoARIMA(period=self.seasonal_period or None,
+                             use_exog=self.exog_data is not None)
+        return ARIMA((self.p, self.d, self.q), self.exog_data is not None,
+                     self.Methods[self.method][1])
 
 
 if __name__ == "__main__":
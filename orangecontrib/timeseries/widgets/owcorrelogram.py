@@ -10,7 +10,8 @@ from orangewidget.utils.widgetpreview import WidgetPreview
 from Orange.widgets import gui
 
 from orangecontrib.timeseries import (
-    Timeseries, autocorrelation, partial_autocorrelation)
+    Timeseries, autocorrelations, partial_autocorrelation)
+from orangecontrib.timeseries.functions import _significant_acf
 
 
 class OWCorrelogram(OWPeriodBase):
@@ -35,13 +36,29 @@ class OWCorrelogram(OWPeriodBase):
                      label='Plot 95% significance interval',
                      callback=self.replot)
 
-    def acf(self, attr, pacf, confint):
-        key = (attr, pacf, confint)
-        if key not in self._cached:
-            x = self.data.interp(attr).ravel()
-            func = partial_autocorrelation if pacf else autocorrelation
-            self._cached[key] = func(x, alpha=.05 if confint else None)
-        return self._cached[key]
+    def acf(self, attrs, pacf):
+        """
+        Return (significant lags and correlations, confidence band) for
+        each attribute. Those that are not cached are computed at once.
+        """
+        missing = [attr for attr in attrs if (attr, pacf) not in self._cached]
+        if missing:
+            X = self.data.interp(missing).astype(float)
+            n = len(X)
+            if pacf:
+                # Band for PACF is the same for all lags
+                band = np.array([[0, n], [1.96 / np.sqrt(n)] * 2])
+                for attr, x in zip(missing, X.T):
+                    self._cached[(attr, pacf)] = \
+                        partial_autocorrelation(x), band
+            else:
+                corrs, bands = autocorrelations(X, alpha=.05)
+                lags = np.arange(len(corrs))
+                for attr, corr, band in zip(missing, corrs.T, bands.T):
+                    self._cached[(attr, pacf)] = \
+                        _significant_acf(corr, False), \
+                        np.vstack((lags[1:], band[1:]))
+        return [self._cached[(attr, pacf)] for attr in attrs]
 
     def replot(self):
         self.plot.clear()
@@ -51,9 +68,10 @@ class OWCorrelogram(OWPeriodBase):
         self.plot_widget.addItem(pg.InfiniteLine(0, 0, pen=pg.mkPen(0., width=2)))
 
         palette = self.get_palette()
-        for i, attr in enumerate(self.selection):
+        acfs = self.acf(self.selection, self.use_pacf)
+        for i, (points, (lags, band)) in enumerate(acfs):
             color = palette.value_to_qcolor(i)
-            x, acf = np.array(self.acf(attr, self.use_pacf, False)).T
+            x, acf = np.array(points).T
             x = np.repeat(x, 2)
             y = np.vstack((np.zeros(len(acf)), acf)).T.flatten()
             item = pg.PlotCurveItem(
@@ -62,14 +80,12 @@ class OWCorrelogram(OWPeriodBase):
             self.plot_widget.addItem(item)
 
             if self.use_confint:
-                # Confidence intervals, from:
-                # https://www.mathworks.com/help/econ/autocorrelation-and-partial-autocorrelation.html
-                # https://www.mathworks.com/help/signal/ug/confidence-intervals-for-sample-autocorrelation.html
-                se = np.sqrt((1 + 2 * (acf ** 2).sum()) / len(self.data))
-                std = 1.96 * se
+                # 95% confidence intervals around zero; for ACF from
+                # Bartlett's formula, as in statsmodels
                 pen = pg.mkPen(color, width=2, style=Qt.DashLine)
-                self.plot_widget.addItem(pg.InfiniteLine(std, 0, pen=pen))
-                self.plot_widget.addItem(pg.InfiniteLine(-std, 0, pen=pen))
+                for sign in (1, -1):
+                    self.plot_widget.addItem(
+                        pg.PlotCurveItem(x=lags, y=sign * band, pen=pen))
 
 
 if __name__ == "__main__":
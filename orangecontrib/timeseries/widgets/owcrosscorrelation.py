@@ -0,0 +1,137 @@
+from AnyQt.QtCore import Qt
+
+from Orange.data import Table
+from Orange.widgets import widget, gui
+from Orange.widgets.settings import Setting
+from Orange.widgets.utils.itemmodels import PyTableModel
+from Orange.widgets.widget import Input, Output, OWWidget, AttributeList
+from Orange.widgets.utils.concurrent import TaskState, ConcurrentWidgetMixin
+
+from orangecontrib.timeseries import Timeseries, cross_correlation
+from orangewidget.utils.widgetpreview import WidgetPreview
+
+
+COLUMNS = ["Lag", "Correlation", "Series 1", "", "Series 2"]
+
+
+class CorrelationModel(PyTableModel):
+    """Sort correlations by their absolute value, strongest first"""
+    def sortColumnData(self, column):
+        data = super().sortColumnData(column)
+        if column == COLUMNS.index("Correlation"):
+            return [abs(corr) for corr in data]
+        return data
+
+
+def run(data: Table, max_lag: int, state: TaskState):
+    def advance(progress: float):
+        if state.is_interruption_requested():
+            raise Exception
+        state.set_progress_value(progress * 100)
+
+    res = cross_correlation(data, max_lag, callback=advance)
+    return [[lag, corr, row, "→", col] for lag, corr, row, col in res]
+
+
+class OWCrossCorrelation(OWWidget, ConcurrentWidgetMixin):
+    name = "Cross-Correlation"
+    description = "Find the lag at which pairs of time series are most " \
+                  "correlated."
+    icon = "icons/Correlogram.svg"
+    priority = 120
+    keywords = ["cross-correlation", "ccf", "lead", "lag"]
+
+    class Inputs:
+        time_series = Input("Time series", Table)
+
+    class Outputs:
+        selected_features = Output("Selected features", AttributeList)
+
+    max_lag = Setting(20)
+    autocommit = Setting(True)
+    sorting = Setting((1, Qt.DescendingOrder))
+
+    UserAdviceMessages = [
+        widget.Message(
+            "The table shows, for each pair of series, the lag at which "
+            "the correlation between them is the strongest. The first "
+            "series leads: its values are correlated with the later "
+            "values of the second series.",
+            "explanation")
+    ]
+
+    class Error(widget.OWWidget.Error):
+        unexpected_error = widget.Msg("Unexpected error: {}")
+
+    def __init__(self):
+        OWWidget.__init__(self)
+        ConcurrentWidgetMixin.__init__(self)
+        self.data = None
+        self.selected_attributes = None
+        box = gui.vBox(self.controlArea, "Cross-Correlation")
+        gui.spin(
+            box, self, "max_lag", 0, 1000, label="Max lag:",
+            callback=self._run)
+        gui.rubber(self.controlArea)
+
+        self.model = model = CorrelationModel(parent=self)
+        model.setHorizontalHeaderLabels(COLUMNS)
+        self.view = view = gui.TableView(self)
+        view.setModel(model)
+        bold = view.BoldFontDelegate(self)
+        view.setItemDelegateForColumn(2, bold)
+        view.setItemDelegateForColumn(4, bold)
+        view.horizontalHeader().setStretchLastSection(False)
+        view.horizontalHeader().sectionClicked.connect(self.header_click)
+        view.selectionModel().selectionChanged.connect(self.on_select)
+        self.mainArea.layout().addWidget(view)
+
+        gui.auto_commit(self.controlArea, self, "autocommit", "Apply",
+                        commit=self.commit)
+
+    def _run(self):
+        self.model.clear()
+        self.selected_attributes = None
+        self.Error.unexpected_error.clear()
+        if self.data is None:
+            self.cancel()
+            return
+        self.start(run, self.data, self.max_lag)
+
+    def on_done(self, res):
+        self.model.wrap(res)
+        sort_column, sort_order = self.sorting
+        self.model.sort(sort_column, sort_order)
+        self.view.horizontalHeader().setSortIndicator(sort_column, sort_order)
+
+    def on_exception(self, ex):
+        self.Error.unexpected_error(str(ex))
+
+    @Inputs.time_series
+    def set_data(self, data):
+        self.data = None if data is None else Timeseries.from_data_table(data)
+        self._run()
+        self.commit()
+
+    def commit(self):
+        self.Outputs.selected_features.send(self.selected_attributes or None)
+
+    def on_select(self):
+        rows = self.model.mapToSourceRows(
+            [index.row() for index in self.view.selectionModel().selectedRows()])
+        names = [self.model[i][j] for i in rows
+                 for j in (COLUMNS.index("Series 1"), COLUMNS.index("Series 2"))]
+        self.selected_attributes = \
+            [self.data.domain[name] for name in dict.fromkeys(names)]
+        self.commit()
+
+    def header_click(self, _):
+        self.sorting = (self.model.sortColumn(), self.model.sortOrder())
+
+    def onDeleteWidget(self):
+        self.shutdown()
+        super().onDeleteWidget()
+
+
+if __name__ == "__main__":
+    WidgetPreview(OWCrossCorrelation).run(Timeseries.from_file("AMZN"))
@@ -1,25 +1,72 @@
 from functools import partial
 from typing import List, NamedTuple
 
-import numpy as np
-
 from AnyQt.QtCore import Qt
 from AnyQt.QtWidgets import QListView
 
 from Orange.data import Table, Domain, ContinuousVariable
-from Orange.data.util import get_unique_names
+from Orange.data.util import get_unique_names, SharedComputeValue
 from Orange.widgets import widget, gui, settings
 from Orange.widgets.utils.itemmodels import VariableListModel, signal_blocking, \
     select_rows
 from Orange.widgets.widget import Input, Output
 
-from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries import Timeseries, difference
+from orangecontrib.timeseries.timeseries import SeriesComputeValue
 from orangewidget.utils.widgetpreview import WidgetPreview
 
 
 class OpDesc(NamedTuple):
     name: str
     prefix: str
+    op: str  # argument `op` of `difference`
+
+
+class BlockDifference:
+    """Differences of a block of variables, shared by derived variables
+
+    Arguments are as for `orangecontrib.timeseries.difference`.
+    """
+    def __init__(self, variables, op, shift=1, invert=False,
+                 assume_zero=False):
+        self.variables = tuple(variables)
+        self.op = op
+        self.shift = shift
+        self.invert = invert
+        self.assume_zero = assume_zero
+
+    def __call__(self, data):
+        X = data.transform(Domain(self.variables)).X
+        return difference(X, self.op, self.shift, self.invert,
+                          self.assume_zero)
+
+    def __eq__(self, other):
+        return type(self) is type(other) \
+            and self.variables == other.variables \
+            and self.op == other.op \
+            and self.shift == other.shift \
+            and self.invert == other.invert \
+            and self.assume_zero == other.assume_zero
+
+    def __hash__(self):
+        return hash((type(self), self.variables, self.op, self.shift,
+                     self.invert, self.assume_zero))
+
+
+class Difference(SharedComputeValue, SeriesComputeValue):
+    """Difference of the `index`-th variable of a `BlockDifference`"""
+    def __init__(self, compute_shared, index):
+        super().__init__(compute_shared, compute_shared.variables[index])
+        self.index = index
+
+    def compute(self, data, shared_data):
+        return shared_data[:, self.index]
+
+    def __eq__(self, other):
+        return super().__eq__(other) and self.index == other.index
+
+    def __hash__(self):
+        return hash((super().__hash__(), self.index))
 
 
 class OWDifference(widget.OWWidget):
@@ -37,10 +84,10 @@ class OWDifference(widget.OWWidget):
         time_series = Output("Time series", Timeseries)
 
     Operations = [
-        OpDesc("First order difference", "Δ"),
-        OpDesc("Second order difference", "ΔΔ"),
-        OpDesc("Change quotient", "q"),
-        OpDesc("Percentage change", "%"),
+        OpDesc("First order difference", "Δ", "diff"),
+        OpDesc("Second order difference", "ΔΔ", "diff2"),
+        OpDesc("Change quotient", "q", "quotient"),
+        OpDesc("Percentage change", "%", "percent"),
     ]
 
     Diff, Diff2, Quot, Perc = range(4)
@@ -140,65 +187,36 @@ class OWDifference(widget.OWWidget):
             self.Outputs.time_series.send(None)
             return
 
-        attrs, columns = self.compute(data, self.selection)
         domain = data.domain
         out_domain = Domain(
-            domain.attributes + attrs, domain.class_vars, domain.metas)
-        ts = Timeseries.from_numpy(
-            out_domain,
-            np.column_stack((data.X, columns)), data.Y, data.metas,
-            time_attr=data.time_variable)
+            domain.attributes + self.derived_variables(data, self.selection),
+            domain.class_vars, domain.metas)
+        ts = data.transform(out_domain)
+        ts.time_variable = data.time_variable
         self.Outputs.time_series.send(ts)
 
-    def compute(self, data, attr_names):
-        columns = []
-        attrs = []
+    def derived_variables(self, data, attr_names):
         shift = self.shift_period
         name_prefix = self.Operations[self.operation].prefix
         name_postfix = f":{shift}" if shift != 1 else ""
         op = self.operation
         get_unique = partial(get_unique_names, data.domain)
 
-        for name in attr_names:
-            col = data.get_column(name)
-            if self.invert_direction:
-                col = col[::-1]
-
-            out = np.full(len(col), np.nan)
-            number_of_decimals = data.domain[name].number_of_decimals
-            if op == self.Diff:
-                out[shift:] = col[shift:] - col[:-shift]
-                if not self.invert_direction and self.assume_zero_before:
-                    out[:shift] = col[:shift]
-            elif op == self.Diff2:
-                out[2:] = np.diff(col, 2)
-                if not self.invert_direction and self.assume_zero_before:
-                    out[1] = col[1] - 2 * col[0]
-                    out[0] = col[0]
+        block = BlockDifference(
+            [data.domain[name] for name in attr_names],
+            self.Operations[op].op, shift, self.invert_direction,
+            self.assume_zero_before)
+        attrs = []
+        for i, var in enumerate(block.variables):
+            if op in (self.Diff, self.Diff2):
+                number_of_decimals = var.number_of_decimals
             else:
-                assert op in (self.Quot, self.Perc)
-                quots = col[:-shift].copy()
-                zeros = quots == 0
-                quots[zeros] = 1
-                out[shift:] = col[shift:] / quots
-                if op == self.Perc:
-                    out = (out - 1) * 100
-                out[shift:][zeros] = np.nan
                 number_of_decimals = 3
-            if self.invert_direction:
-                out = out[::-1]
-
-            columns.append(out)
-            attr = ContinuousVariable(
-                name=get_unique(name_prefix + name + name_postfix),
-                number_of_decimals=number_of_decimals)
-            attrs.append(attr)
-
-        if columns:
-            columns = np.column_stack(columns)
-        else:
-            columns = np.zeros((len(data), 0), dtype=float)
-        return tuple(attrs), columns
+            attrs.append(ContinuousVariable(
+                name=get_unique(name_prefix + var.name + name_postfix),
+                number_of_decimals=number_of_decimals,
+                compute_value=Difference(block, i)))
+        return tuple(attrs)
 
     @classmethod
     def migrate_settings(cls, settings, version):
@@ -1,3 +1,5 @@
+import os
+
 from AnyQt.QtCore import Qt
 
 from Orange.data import Table
@@ -8,21 +10,43 @@ from Orange.widgets.widget import Input, Output, OWWidget, Msg, AttributeList
 from Orange.widgets.utils.concurrent import TaskState, ConcurrentWidgetMixin
 
 from orangecontrib.timeseries import Timeseries, granger_causality
+from orangecontrib.timeseries.functions import GRANGER_PAIRWISE, \
+    GRANGER_CONDITIONAL
 from orangewidget.utils.widgetpreview import WidgetPreview
 
 
+# Starting worker processes takes a while, so use them only for many series
+POOL_MIN_SERIES = 10
+
 COLUMNS = ["Min. lag", "p-value", "Series 1", "", "Series 2"]
 
+METHODS = (("Pairwise", GRANGER_PAIRWISE),
+           ("Conditional (VAR)", GRANGER_CONDITIONAL))
+
 
-def run(data: Table, max_lag: int, confidence: int, state: TaskState):
+def run(data: Table, max_lag: int, confidence: int, method: str,
+        state: TaskState):
     def advance(progress: float):
         if state.is_interruption_requested():
             raise Exception
         state.set_progress_value(progress * 100)
 
+    def partial_result(res):
+        state.set_partial_result(_table_rows(res))
+
+    n_series = sum(var.is_continuous and var is not data.time_variable
+                   for var in data.domain.variables)
+    n_jobs = -1 if n_series >= POOL_MIN_SERIES and os.cpu_count() > 1 \
+        else None
+
     res = granger_causality(
-        data, max_lag, 1 - confidence / 100, callback=advance
+        data, max_lag, 1 - confidence / 100, callback=advance, method=method,
+        n_jobs=n_jobs, partial_result=partial_result
     )
+    return _table_rows(res)
+
+
+def _table_rows(res):
     return [[lag, pval, row, "→", col] for lag, pval, row, col in res]
 
 
@@ -49,6 +73,7 @@ class OWGrangerCausality(OWWidget, ConcurrentWidgetMixin):
 
     max_lag = Setting(20)
     confidence = Setting(95)
+    method = Setting(0)
     autocommit = Setting(True)
     sorting = Setting((1, Qt.AscendingOrder))
 
@@ -93,6 +118,18 @@ class OWGrangerCausality(OWWidget, ConcurrentWidgetMixin):
             label="Max lag:",
             callback=self._setting_changed,
         )
+        gui.comboBox(
+            box,
+            self,
+            "method",
+            label="Test:",
+            items=[label for label, _ in METHODS],
+            orientation=Qt.Horizontal,
+            callback=self._setting_changed,
+            tooltip="Pairwise tests consider each pair of series on its own; "
+                    "the conditional test fits a single VAR model of all "
+                    "series and also controls for the remaining ones.",
+        )
         self.test_button = gui.button(box, self, "&Test", self._toggle_run)
         gui.rubber(self.controlArea)
 
@@ -144,13 +181,21 @@ class OWGrangerCausality(OWWidget, ConcurrentWidgetMixin):
         self.Error.unexpected_error.clear()
         if self.data is None:
             return
-        self.start(run, self.data, self.max_lag, self.confidence)
+        self.start(run, self.data, self.max_lag, self.confidence,
+                   METHODS[self.method][1])
         self.test_button.setText("Stop")
 
+    def on_partial_result(self, res):
+        # Sorted model can't be extended, so rewrap and sort again
+        self.model.wrap(self.model.tolist() + res)
+        self._sort()
+
     def on_done(self, res):
         self.model.wrap(res)
         self.test_button.setText("Test")
+        self._sort()
 
+    def _sort(self):
         # Re-apply sort
         try:
             sort_column, sort_order = self.sorting
@@ -6,6 +6,7 @@ from AnyQt.QtCore import QSize
 
 from Orange.data import Table
 from Orange.widgets import widget, gui, settings
+from Orange.widgets.utils.concurrent import TaskState, ConcurrentWidgetMixin
 from Orange.widgets.utils.itemmodels import PyTableModel
 from Orange.widgets.widget import Input
 
@@ -18,7 +19,31 @@ class Output:
     TIMESERIES = 'Time series'
 
 
-class OWModelEvaluation(widget.OWWidget):
+def run(data, models, n_folds, forecast_steps, state: TaskState):
+    n_fits = len(models) * n_folds
+    fits = 0
+
+    def advance():
+        nonlocal fits
+        if state.is_interruption_requested():
+            raise Exception
+        fits += 1
+        state.set_progress_value(100 * fits / n_fits)
+
+    # Models are evaluated one by one to show the results as they come
+    res = []
+    interp_data = data.interp()
+    for model in models:
+        rows = model_evaluation(data, [model], n_folds, forecast_steps,
+                                callback=advance, interp_data=interp_data)
+        if not res:
+            res.append(rows[0])
+        res += rows[1:]
+        state.set_partial_result(res[:])
+    return res
+
+
+class OWModelEvaluation(widget.OWWidget, ConcurrentWidgetMixin):
     name = 'Model Evaluation'
     description = '''Evaluate different time series' models by comparing the
                   errors they make in terms of:
@@ -48,6 +73,8 @@ class OWModelEvaluation(widget.OWWidget):
         model_failed = widget.Msg('One or more models failed.')
 
     def __init__(self):
+        widget.OWWidget.__init__(self)
+        ConcurrentWidgetMixin.__init__(self)
         self.data = None
         self._models = OrderedDict()
         box = gui.vBox(self.controlArea, 'Evaluation Parameters')
@@ -79,7 +106,7 @@ class OWModelEvaluation(widget.OWWidget):
         if model is None:
             self._models.pop(id, None)
         else:
-            self._models[id] = model.copy()
+            self._models[id] = model.clone()
 
     def handleNewSignals(self):
         self.commit.now()
@@ -91,21 +118,31 @@ class OWModelEvaluation(widget.OWWidget):
         self.model.clear()
         data = self.data
         if not data or not self._models:
+            self.cancel()
             return
-        try:
-            with self.progressBar(len(self._models) * (self.n_folds + 1) + 1) as progress:
-                res = model_evaluation(data, list(self._models.values()),
-                                       self.n_folds, self.forecast_steps,
-                                       callback=progress.advance)
-        except ValueError as e:
-            self.Error.unexpected_error(e.args[0])
-            return
+        self.start(run, data, list(self._models.values()),
+                   self.n_folds, self.forecast_steps)
+
+    def on_partial_result(self, res):
+        self._show_results(res)
+
+    def on_done(self, res):
+        self._show_results(res)
+
+    def on_exception(self, ex):
+        self.model.clear()
+        self.Error.unexpected_error(ex.args[0] if ex.args else str(ex))
+
+    def _show_results(self, res):
         res = np.array(res, dtype=object)
         self.Warning.model_failed(shown="err" in res)
         self.model.setHorizontalHeaderLabels(res[0, 1:].tolist())
         self.model.setVerticalHeaderLabels(res[1:, 0].tolist())
         self.model.wrap(res[1:, 1:].tolist())
 
+    def onDeleteWidget(self):
+        self.shutdown()
+        super().onDeleteWidget()
 
 if __name__ == "__main__":
     class BadModel(_BaseModel):
@@ -12,11 +12,13 @@ from orangewidget.utils.widgetpreview import WidgetPreview
 
 from Orange.data import Domain, Table, ContinuousVariable
 import Orange.data.util
+from Orange.preprocess.transformation import Transformation
 from Orange.widgets import widget, gui, settings
 from Orange.widgets.utils.itemmodels import VariableListModel
 from Orange.widgets.widget import Input, Output
 
 from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries.timeseries import SeriesComputeValue
 from orangecontrib.timeseries.aggregate import \
     PeriodOptions, AggOptions, time_blocks
 
@@ -24,6 +26,35 @@ N_NONPERIODIC = \
     next(iter(i for i, p in enumerate(PeriodOptions.values()) if p.periodic))
 
 
+class MovingAggregate(Transformation, SeriesComputeValue):
+    """Sliding window aggregate of a variable, aligned with original rows
+
+    Values for the first `width - 1` rows, for which the window is incomplete,
+    are undefined, except for cumulative aggregations.
+    """
+    def __init__(self, variable, aggregation, width):
+        super().__init__(variable)
+        self.aggregation = aggregation
+        self.width = width
+
+    def transform(self, c):
+        agg = AggOptions[self.aggregation]
+        if agg.cumulative:
+            return agg.cumulative(c)
+        out = np.full(len(c), np.nan)
+        agg_column = agg.transform(c, self.width, 1)
+        out[len(c) - len(agg_column):] = agg_column
+        return out
+
+    def __eq__(self, other):
+        return super().__eq__(other) \
+            and self.aggregation == other.aggregation \
+            and self.width == other.width
+
+    def __hash__(self):
+        return hash((super().__hash__(), self.aggregation, self.width))
+
+
 class TransformationsModel(VariableListModel):
     def __init__(self, *args, **kwargs):
         super().__init__()
@@ -153,6 +184,9 @@ class OWMovingTransform(widget.OWWidget):
     def __init__(self):
         self.data = None
         self.only_numeric = False
+        # Computed aggregates, keyed by
+        # (variable, aggregation, method, width, include leading instances)
+        self._cached = {}
 
         self.mainArea.layout().setDirection(QBoxLayout.LeftToRight)
         box = gui.hBox(self.controlArea, True)
@@ -339,6 +373,7 @@ class OWMovingTransform(widget.OWWidget):
 
     @Inputs.time_series
     def set_data(self, data):
+        self._cached.clear()
         if data is None:
             self.data = None
             self.var_model.set_variables([])
@@ -394,14 +429,18 @@ class OWMovingTransform(widget.OWWidget):
 
         attributes = []
         columns = []
+        include_leading = self.keep_instances == self.KeepAll
         if discard:
-            rows = leading = None
+            rows = None
         elif self.keep_instances == self.KeepComplete:
             rows = slice(self.window_width - 1, None)
-            leading = None
         else:
             rows = ...
-            leading = np.full(self.window_width - 1, np.nan)
+
+        def compute(column, agg, compute_value):
+            if include_leading:
+                return compute_value.transform(column)
+            return agg.transform(column, self.window_width, 1)
 
         def add_aggregates(attr, column):
             if attr not in model:  # skip time_attribute
@@ -409,14 +448,14 @@ class OWMovingTransform(widget.OWWidget):
             row = model.indexOf(attr)
             for transformation in model.get_transformations(row):
                 agg = AggOptions[transformation]
-                attributes.append(self._var_for_agg(attr, agg, names))
-                if agg.cumulative and self.keep_instances == self.KeepAll:
-                    agg_column = agg.cumulative(column)
-                else:
-                    agg_column = agg.transform(column, self.window_width, 1)
-                    if self.keep_instances == self.KeepAll:
-                        agg_column = np.hstack((leading, agg_column))
-                columns.append(agg_column)
+                compute_value = \
+                    MovingAggregate(attr, transformation, self.window_width)
+                attributes.append(
+                    self._var_for_agg(attr, agg, names, compute_value))
+                columns.append(self._cached_aggregate(
+                    (attr, transformation, self.SlidingWindow,
+                     self.window_width, include_leading),
+                    compute, column, agg, compute_value))
 
         for attr, column in zip(domain.attributes, data.X.T):
             if not discard:
@@ -452,6 +491,11 @@ class OWMovingTransform(widget.OWWidget):
             self.Warning.block_to_large()
             return None
 
+        def compute(attr, column, agg):
+            if column is None:
+                column = data.get_column(attr)
+            return agg.transform(column, width, width)
+
         def add_aggregates(attr, column=None):
             if attr not in model:  # skip time_attribute
                 return
@@ -461,11 +505,10 @@ class OWMovingTransform(widget.OWWidget):
                 if agg.block_transform is None:
                     inapplicable.add(agg.long_desc)
                     continue
-                if column is None:
-                    column = data.get_column(attr)
-                agg_column = agg.transform(column, width, width)
                 attributes.append(self._var_for_agg(attr, agg, names))
-                columns.append(agg_column)
+                columns.append(self._cached_aggregate(
+                    (attr, transformation, self.SequentialBlocks, width, False),
+                    compute, attr, column, agg))
 
         names = self._names_for_blocked_aggregation()
         attributes = []
@@ -514,6 +557,12 @@ class OWMovingTransform(widget.OWWidget):
         attributes.append(ContinuousVariable(next(names)))
         columns.append(counts)
 
+        def compute(attr, agg):
+            column = data.get_column(attr)
+            return np.array([
+                agg.block_transform(column[period_indices == i])
+                for i in range(len(periods))])
+
         inapplicable = set()
         for i, attr in enumerate(model):
             for transformation in model.get_transformations(i):
@@ -522,11 +571,10 @@ class OWMovingTransform(widget.OWWidget):
                     inapplicable.add(agg.long_desc)
                     continue
                 attributes.append(self._var_for_agg(attr, agg, names))
-                column = data.get_column(attr)
-                agg_column = np.array([
-                    agg.block_transform(column[period_indices == i])
-                    for i in range(len(periods))])
-                columns.append(agg_column)
+                columns.append(self._cached_aggregate(
+                    (attr, transformation, self.TimePeriods,
+                     self.period_width, False),
+                    compute, attr, agg))
 
         self._set_warnings(columns, inapplicable)
         if not columns:
@@ -554,12 +602,18 @@ class OWMovingTransform(widget.OWWidget):
             names = Orange.data.util.get_unique_names_duplicates(names)
         return iter(names)
 
+    def _cached_aggregate(self, key, compute, *args):
+        if key not in self._cached:
+            self._cached[key] = compute(*args)
+        return self._cached[key]
+
     @staticmethod
-    def _var_for_agg(attr, agg, names):
+    def _var_for_agg(attr, agg, names, compute_value=None):
         name = next(names)
         if agg.count_aggregate:
-            return ContinuousVariable(name, number_of_decimals=0)
-        return attr.copy(name=name)
+            return ContinuousVariable(name, number_of_decimals=0,
+                                      compute_value=compute_value)
+        return attr.copy(name=name, compute_value=compute_value)
 
     def _set_warnings(self, columns, inapplicable):
         if inapplicable:
@@ -1,12 +1,19 @@
 import numpy as np
 import pyqtgraph as pg
 
+from orangewidget.settings import Setting
 from orangewidget.utils.widgetpreview import WidgetPreview
 
+from Orange.widgets import gui
+from Orange.widgets.widget import Msg
+
 from orangecontrib.timeseries import \
     Timeseries, periodogram as periodogram_equispaced, periodogram_nonequispaced
 from orangecontrib.timeseries.widgets.owperiodbase import OWPeriodBase
 
+# Use the fast (approximate) Lomb-Scargle periodogram for longer series
+FAST_LOMBSCARGLE_MIN = 10000
+
 
 class OWPeriodogram(OWPeriodBase):
     name = 'Periodogram'
@@ -15,13 +22,61 @@ class OWPeriodogram(OWPeriodBase):
     icon = 'icons/Periodogram.svg'
     priority = 100
 
+    use_welch = Setting(False)
+    segment_length = Setting(256)
+
     yrange = (0, 1)
 
+    class Information(OWPeriodBase.Information):
+        no_welch = Msg("Welch's method requires regularly sampled series; "
+                       "Lomb-Scargle periodogram is shown instead.")
+
+    def __init__(self):
+        super().__init__()
+        gui.separator(self.controlArea)
+        box = gui.vBox(self.controlArea, True)
+        self.welch_box = gui.checkBox(
+            box, self, "use_welch",
+            label="Average over segments (Welch's method)",
+            callback=self._welch_changed,
+            tooltip="Less noisy and faster for long, regularly sampled "
+                    "series; periods longer than the segment are not shown.")
+        self.segment_spin = gui.spin(
+            gui.indentedBox(box), self, "segment_length", 16, 2 ** 20,
+            label="Segment length:", callback=self._welch_changed,
+            keyboardTracking=False)
+        self._update_welch_controls()
+
+    def _is_equispaced(self):
+        return self.data is None \
+            or getattr(self.data.time_delta, "is_equispaced", True)
+
+    def _update_welch_controls(self):
+        equispaced = self._is_equispaced()
+        self.welch_box.setEnabled(equispaced)
+        self.segment_spin.setEnabled(equispaced and self.use_welch)
+        self.Information.no_welch(shown=not equispaced and self.use_welch)
+
+    def _welch_changed(self):
+        self._update_welch_controls()
+        self._cached.clear()
+        self.replot()
+
+    @OWPeriodBase.Inputs.time_series
+    def set_data(self, data):
+        super().set_data(data)
+        self._update_welch_controls()
+
     def periodogram(self, attr):
         if attr not in self._cached:
-            if getattr(self.data.time_delta, "is_equispaced", True):
+            if self._is_equispaced():
                 x = np.ravel(self.data.interp(attr))
-                periods, values = periodogram_equispaced(x)
+                if self.use_welch:
+                    periods, values = periodogram_equispaced(
+                        x, detrend="linear",
+                        segment_length=self.segment_length)
+                else:
+                    periods, values = periodogram_equispaced(x)
                 if self.data.time_delta is not None:
                     periods *= self.data.time_delta.time_interval
                 self._cached[attr] = (periods, values)
@@ -33,7 +88,8 @@ class OWPeriodogram(OWPeriodBase):
                 nonnan = ~np.isnan(x)
                 if not nonnan.all():
                     x, times = x[nonnan], times[nonnan]
-                self._cached[attr] = periodogram_nonequispaced(times, x)
+                self._cached[attr] = periodogram_nonequispaced(
+                    times, x, fast=len(x) >= FAST_LOMBSCARGLE_MIN)
         return self._cached[attr]
 
     def replot(self):
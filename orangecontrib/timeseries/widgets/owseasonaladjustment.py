@@ -1,19 +1,109 @@
+import numpy as np
+
 from AnyQt.QtWidgets import QListView, QFormLayout
 from AnyQt.QtCore import Qt
 
-from Orange.data import Table, Domain
+from Orange.data import Table, Domain, ContinuousVariable
+from Orange.data.util import SharedComputeValue
 from Orange.widgets import widget, gui, settings
+from Orange.widgets.utils.concurrent import TaskState, ConcurrentWidgetMixin
 from Orange.widgets.utils.itemmodels import VariableListModel
 from Orange.widgets.widget import Input, Output, Msg
-from numpy import hstack
 
 from orangecontrib.timeseries import Timeseries, seasonal_decompose
+from orangecontrib.timeseries.timeseries import SeriesComputeValue
+from orangecontrib.timeseries.functions import DECOMPOSE_CLASSICAL, \
+    DECOMPOSE_STL
+from orangecontrib.timeseries.widgets.utils import available_name
 
 
 MAX_PERIODS = 1000
 
+# Decompose with STL in a process pool if there are at least this many values
+POOL_MIN_SIZE = 10000
+
+# Columns of the table returned by `seasonal_decompose`, for a single variable
+COMPONENTS = ('season. adj.', 'seasonal', 'trend', 'residual')
+
+
+class SeasonalDecomposition:
+    """Decompose a single variable; shared by its components' compute values
+
+    Arguments are as for `orangecontrib.timeseries.seasonal_decompose`.
+    """
+    def __init__(self, variable, model, period, method=DECOMPOSE_CLASSICAL):
+        self.variable = variable
+        self.model = model
+        self.period = period
+        self.method = method
+
+    def __call__(self, data):
+        domain = Domain([self.variable])
+        series = Timeseries.from_numpy(domain, data.transform(domain).X)
+        return seasonal_decompose(series, self.model, self.period,
+                                  method=self.method).X
+
+    def __eq__(self, other):
+        return type(self) is type(other) \
+            and self.variable == other.variable \
+            and self.model == other.model \
+            and self.period == other.period \
+            and self.method == other.method
+
+    def __hash__(self):
+        return hash((type(self), self.variable, self.model, self.period,
+                     self.method))
+
+    def __setstate__(self, state):
+        # Pickles from before STL was supported don't have a method
+        self.__dict__.update(state)
+        self.__dict__.setdefault("method", DECOMPOSE_CLASSICAL)
+
+
+class SeasonalComponent(SharedComputeValue, SeriesComputeValue):
+    """One of the `COMPONENTS` of a variable's seasonal decomposition"""
+    def __init__(self, compute_shared, component):
+        super().__init__(compute_shared)
+        self.component = component
+
+    def compute(self, data, shared_data):
+        return shared_data[:, self.component]
+
+    def __eq__(self, other):
+        return super().__eq__(other) and self.component == other.component
+
+    def __hash__(self):
+        return hash((super().__hash__(), self.component))
+
+
+def run(data: Timeseries, variables, model, period, method,
+        state: TaskState):
+    """
+    Decompose variables at once and return a dict with their components
+    (in columns) by (variable, model, period, method)
+    """
+    done = 0
+
+    def advance():
+        nonlocal done
+        if state.is_interruption_requested():
+            raise Exception
+        done += 1
+        state.set_progress_value(100 * done / len(variables))
+
+    # Decompose just like SeasonalDecomposition, for all variables at once
+    domain = Domain(variables)
+    series = Timeseries.from_numpy(domain, data.transform(domain).X)
+    n_jobs = -1 if method == DECOMPOSE_STL and len(variables) > 1 \
+        and len(variables) * len(data) >= POOL_MIN_SIZE else None
+    X = seasonal_decompose(series, model, period, callback=advance,
+                           method=method, n_jobs=n_jobs).X
+    n_comp = len(COMPONENTS)
+    return {(var, model, period, method): X[:, i * n_comp:(i + 1) * n_comp]
+            for i, var in enumerate(variables)}
+
 
-class OWSeasonalAdjustment(widget.OWWidget):
+class OWSeasonalAdjustment(widget.OWWidget, ConcurrentWidgetMixin):
     name = 'Seasonal Adjustment'
     description = 'Remove the seasonal component of a time series that ' \
                   'exhibits a seasonal pattern.'
@@ -30,7 +120,9 @@ class OWSeasonalAdjustment(widget.OWWidget):
     resizing_enabled = False
 
     n_periods = settings.Setting(12)
+    second_period = settings.Setting(0)
     decomposition = settings.Setting(0)
+    method = settings.Setting(0)
     selected = settings.Setting([])
     autocommit = settings.Setting(False)
 
@@ -50,16 +142,29 @@ class OWSeasonalAdjustment(widget.OWWidget):
                        'correspond to one of the most significant periods '
                        'in periodogram.',
                        'season-period'),
+        widget.Message('STL decomposes each series with local regression, '
+                       'which is robust to outliers and allows the season '
+                       'to change over time. It can also remove a second '
+                       'season, e.g. weekly besides daily cycles in hourly '
+                       'data.',
+                       'stl'),
     ]
 
     DECOMPOSITION_MODELS = ('additive', 'multiplicative')
+    METHODS = (('Moving averages', DECOMPOSE_CLASSICAL),
+               ('STL', DECOMPOSE_STL))
 
     class Error(widget.OWWidget.Error):
         seasonal_decompose_fail = Msg("{}")
         not_enough_instances = Msg("Time series has to have at least 3 instances.")
 
     def __init__(self):
+        widget.OWWidget.__init__(self)
+        ConcurrentWidgetMixin.__init__(self)
         self.data = None
+        # Components of decomposed variables by (variable, model, period,
+        # method), so that changing the selection decomposes only new ones
+        self._components = {}
         form = QFormLayout()
         gui.widgetBox(self.controlArea, box=True, orientation=form)
 
@@ -71,6 +176,22 @@ class OWSeasonalAdjustment(widget.OWWidget):
                              'monthly data and the apparent season repeats every '
                              'year, you put in 12.')
         )
+        form.addRow(
+            'Second period:',
+            gui.spin(None, self, 'second_period', 0, MAX_PERIODS,
+                     callback=self.on_changed,
+                     tooltip='The length of another season cycle, which is '
+                             'removed together with the first one; e.g. '
+                             '168 (a week) besides 24 (a day) for hourly '
+                             'data. Available only for STL.')
+        )
+        self.controls.second_period.setSpecialValueText('(none)')
+        form.addRow(
+            'Method:',
+            gui.comboBox(None, self, 'method',
+                         items=[label for label, _ in self.METHODS],
+                         orientation=Qt.Horizontal,
+                         callback=self._method_changed))
         form.addRow(
             'Decomposition model:',
             gui.comboBox(None, self, 'decomposition',
@@ -84,11 +205,29 @@ class OWSeasonalAdjustment(widget.OWWidget):
         view.selectionModel().selectionChanged.connect(self.on_changed)
         self.controlArea.layout().addWidget(view)
         gui.auto_commit(self.buttonsArea, self, 'autocommit', '&Apply')
+        self._update_controls()
+
+    def _method_changed(self):
+        self._update_controls()
+        self.on_changed()
+
+    def _update_controls(self):
+        self.controls.second_period.setEnabled(
+            self.METHODS[self.method][1] == DECOMPOSE_STL)
+
+    def _periods(self):
+        method = self.METHODS[self.method][1]
+        if method == DECOMPOSE_STL \
+                and self.second_period not in (0, self.n_periods):
+            return tuple(sorted((self.n_periods, self.second_period)))
+        return self.n_periods
 
     @Inputs.time_series
     def set_data(self, data):
         self.Error.not_enough_instances.clear()
+        self.cancel()
         self.data = None
+        self._components = {}
         self.model.clear()
         data = None if data is None else Timeseries.from_data_table(data)
         if data is None:
@@ -97,7 +236,9 @@ class OWSeasonalAdjustment(widget.OWWidget):
             self.data = data
             self.model.wrap([var for var in data.domain.variables
                              if var.is_continuous and var is not data.time_variable])
-            self.controls.n_periods.setMaximum(min(MAX_PERIODS, len(data) - 1))
+            max_period = min(MAX_PERIODS, len(data) - 1)
+            self.controls.n_periods.setMaximum(max_period)
+            self.controls.second_period.setMaximum(max_period)
         else:
             self.Error.not_enough_instances()
         self.on_changed()
@@ -107,42 +248,66 @@ class OWSeasonalAdjustment(widget.OWWidget):
                          for i in self.view.selectionModel().selectedIndexes()]
         self.commit()
 
+    def _key(self, name):
+        return (self.data.domain[name],
+                self.DECOMPOSITION_MODELS[self.decomposition],
+                self._periods(),
+                self.METHODS[self.method][1])
+
     def commit(self):
         self.Error.seasonal_decompose_fail.clear()
+        self.cancel()
         data = self.data
         if not data or not self.selected:
             self.Outputs.time_series.send(data)
             return
 
-        selected_subset = Timeseries.from_table(Domain(self.selected,
-                                                source=data.domain), data)
-        # FIXME: might not pass selected interpolation method
-
-        with self.progressBar(len(self.selected)) as progress:
-            try:
-                adjusted_data = seasonal_decompose(
-                    selected_subset,
-                    self.DECOMPOSITION_MODELS[self.decomposition],
-                    self.n_periods,
-                    callback=lambda *_: progress.advance())
-            except ValueError as ex:
-                self.Error.seasonal_decompose_fail(str(ex))
-                adjusted_data = None
-
-        if adjusted_data is not None:
-            new_domain = Domain(data.domain.attributes +
-                                adjusted_data.domain.attributes,
-                                data.domain.class_vars,
-                                data.domain.metas)
-            ts = Timeseries.from_numpy(new_domain, X=hstack((data.X,
-                                                       adjusted_data.X)),
-                                                   Y=data.Y,
-                                                   metas=data.metas)
-            ts.time_variable = data.time_variable
+        missing = [self.data.domain[name] for name in self.selected
+                   if self._key(name) not in self._components]
+        if missing:
+            _, model, period, method = self._key(self.selected[0])
+            self.start(run, data, missing, model, period, method)
         else:
-            ts = None
+            self._send_output()
+
+    def on_done(self, result):
+        self._components.update(result)
+        self._send_output()
+
+    def on_exception(self, ex):
+        self.Error.seasonal_decompose_fail(str(ex))
+        self.Outputs.time_series.send(None)
+
+    def _send_output(self):
+        data = self.data
+        domain = data.domain
+        attrs = []
+        X = [data.X]
+        for name in self.selected:
+            _, model, period, method = key = self._key(name)
+            decomposition = SeasonalDecomposition(
+                domain[name], model, period, method)
+            attrs.extend(
+                ContinuousVariable(
+                    available_name(domain, f"{name} ({component})"),
+                    compute_value=SeasonalComponent(decomposition, i))
+                for i, component in enumerate(COMPONENTS))
+            X.append(self._components[key])
+        new_domain = Domain(domain.attributes + tuple(attrs),
+                            domain.class_vars, domain.metas)
+        # Components were computed as compute values would compute them;
+        # these remain in the domain to be used on other data
+        # FIXME: might not pass selected interpolation method
+        ts = Timeseries.from_numpy(
+            new_domain, np.hstack(X), data.Y, data.metas, data.W,
+            data.attributes, data.ids)
+        ts.time_variable = data.time_variable
         self.Outputs.time_series.send(ts)
 
+    def onDeleteWidget(self):
+        self.shutdown()
+        super().onDeleteWidget()
+
 
 if __name__ == "__main__":
     from AnyQt.QtWidgets import QApplication
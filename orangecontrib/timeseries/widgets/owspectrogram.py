@@ -0,0 +1,167 @@
+import numpy as np
+import pyqtgraph as pg
+
+from AnyQt.QtCore import QRectF, QTimer
+
+from orangewidget.settings import Setting, ContextSetting
+from orangewidget.utils.widgetpreview import WidgetPreview
+
+from Orange.data import Table, ContinuousVariable
+from Orange.widgets import gui
+from Orange.widgets.settings import DomainContextHandler
+from Orange.widgets.utils.itemmodels import VariableListModel
+from Orange.widgets.widget import OWWidget, Input, Msg
+
+from orangecontrib.timeseries import Timeseries, spectrogram
+
+# Number of frames computed when the width of the view is unknown
+DEFAULT_FRAMES = 1000
+
+
+class OWSpectrogram(OWWidget):
+    name = 'Spectrogram'
+    description = "Visualize how the spectrum of time series changes " \
+                  "over time."
+    icon = 'icons/Periodogram.svg'
+    priority = 105
+    keywords = ["spectrogram", "stft", "short-time fourier transform"]
+
+    class Inputs:
+        time_series = Input("Time series", Table)
+
+    settingsHandler = DomainContextHandler()
+    attribute = ContextSetting(None)
+    window_length = Setting(256)
+    overlap = Setting(50)
+    log_scale = Setting(True)
+
+    graph_name = 'plot'  # pg.GraphicsItem (pg.PlotItem)
+
+    class Error(OWWidget.Error):
+        no_instances = Msg("Data contains just a single instance")
+        no_variables = Msg("Data doesn't contain any numeric variables")
+
+    class Warning(OWWidget.Warning):
+        irregular = Msg("Series is not regularly sampled; "
+                        "samples are treated as equidistant.")
+
+    def __init__(self):
+        super().__init__()
+        self.data = None
+        self.x = None
+
+        box = gui.vBox(self.controlArea, "Spectrogram")
+        self.var_model = VariableListModel()
+        gui.comboBox(
+            box, self, "attribute", model=self.var_model,
+            callback=self._attribute_changed)
+        gui.spin(
+            box, self, "window_length", 8, 2 ** 16, label="Window length:",
+            callback=self.update_image, keyboardTracking=False)
+        gui.spin(
+            box, self, "overlap", 0, 90, step=10, label="Overlap:",
+            callback=self.update_image, keyboardTracking=False,
+            posttext="%")
+        gui.checkBox(
+            box, self, "log_scale", "Logarithmic power",
+            callback=self.update_image)
+        gui.rubber(self.controlArea)
+
+        self.plot_widget = pg.PlotWidget(background="w")
+        self.plot = self.plot_widget.getPlotItem()
+        self.plot.buttonsHidden = False
+        self.plot.setLabel("bottom", "sample")
+        self.plot.setLabel("left", "frequency", "cycles per sample")
+        self.image = pg.ImageItem(axisOrder="col-major")
+        self.image.setColorMap(pg.colormap.get("viridis"))
+        self.plot.addItem(self.image)
+        self.mainArea.layout().addWidget(self.plot_widget)
+
+        # Frames are decimated to the resolution of the view, so
+        # the image is recomputed when the view changes
+        self._update_timer = QTimer(
+            self, singleShot=True, interval=50, timeout=self.update_image)
+        self.plot.sigXRangeChanged.connect(self._update_timer.start)
+
+    @Inputs.time_series
+    def set_data(self, data):
+        self.closeContext()
+        self.Error.clear()
+        self.Warning.clear()
+        self.data = self.x = None
+        self.attribute = None
+        self.var_model.clear()
+
+        if data is not None and len(data) < 2:
+            self.Error.no_instances()
+        elif data is not None:
+            self.data = Timeseries.from_data_table(data)
+            self.var_model[:] = [
+                var for var in self.data.domain.variables
+                if isinstance(var, ContinuousVariable)
+                and var is not self.data.time_variable]
+            if not self.var_model:
+                self.Error.no_variables()
+                self.data = None
+            else:
+                self.Warning.irregular(
+                    shown=not getattr(self.data.time_delta, "is_equispaced",
+                                      True))
+                self.attribute = self.var_model[0]
+                self.openContext(self.data.domain)
+        self._attribute_changed()
+
+    def _attribute_changed(self):
+        if self.data is None:
+            self.x = None
+        else:
+            self.x = np.ravel(self.data.interp([self.attribute])).astype(float)
+            self.plot.setXRange(0, len(self.x), padding=0)
+            self.plot.setYRange(0, 0.5, padding=0)
+        self.update_image()
+
+    def update_image(self):
+        self._update_timer.stop()
+        if self.x is None:
+            self.image.clear()
+            return
+
+        n = len(self.x)
+        (x0, x1), _ = self.plot.viewRange()
+        start = int(np.clip(x0 - self.window_length, 0, n))
+        stop = int(np.clip(x1 + self.window_length, 0, n))
+        if stop - start < 2:
+            self.image.clear()
+            return
+        width = int(self.plot.vb.width())
+        centers, freqs, sxx = spectrogram(
+            self.x, self.window_length, self.overlap / 100,
+            start=start, stop=stop,
+            max_frames=width if width > 1 else DEFAULT_FRAMES)
+        if self.log_scale:
+            sxx = np.log10(np.fmax(sxx, np.finfo(float).tiny))
+        self.image.setImage(sxx)
+
+        if len(centers) > 1:
+            step = centers[1] - centers[0]
+        else:
+            # A single frame covers the window, or the entire shorter series
+            step = min(self.window_length, stop - start)
+        df = freqs[1] - freqs[0]
+        self.image.setRect(QRectF(
+            centers[0] - step / 2, -df / 2, len(centers) * step,
+            len(freqs) * df))
+
+    def send_report(self):
+        if self.x is None:
+            return
+        self.report_items((("Series", self.attribute.name),
+                           ("Window length", self.window_length),
+                           ("Overlap", f"{self.overlap} %")))
+        self.report_plot()
+
+
+if __name__ == "__main__":
+    WidgetPreview(OWSpectrogram).run(
+        Timeseries.from_file("airpassengers")
+    )
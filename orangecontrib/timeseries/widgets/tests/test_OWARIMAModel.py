@@ -1,8 +1,10 @@
 import unittest
+from unittest.mock import patch, Mock
 
 from Orange.widgets.tests.base import WidgetTest
 
-from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries import Timeseries, ARIMA, AutoARIMA
+from orangecontrib.timeseries.widgets._owmodel import run
 from orangecontrib.timeseries.widgets.owarimamodel import OWARIMAModel
 
 
@@ -13,21 +15,142 @@ class TestCorrelogramWidget(WidgetTest):
 
     def test_data(self):
         self.send_signal(self.widget.Inputs.time_series, self.data)
+        self.wait_until_finished()
         output = self.get_output(self.widget.Outputs.forecast)
         self.assertEqual(3, len(output))
         self.assertIsNotNone(self.widget.Outputs.learner)
         self.assertIsNotNone(self.widget.Outputs.fitted_values)
         self.assertIsNotNone(self.widget.Outputs.residuals)
 
+        self.send_signal(self.widget.Inputs.time_series, None)
+        self.assertIsNone(self.get_output(self.widget.Outputs.forecast))
+
     def test_exog_data(self):
         self.send_signal(self.widget.Inputs.time_series, self.data)
         self.send_signal(self.widget.Inputs.exogenous_data, self.data[:3, :1])
+        self.wait_until_finished()
         output = self.get_output(self.widget.Outputs.forecast)
         self.assertEqual(3, len(output))
         self.assertIsNotNone(self.widget.Outputs.learner)
         self.assertIsNotNone(self.widget.Outputs.fitted_values)
         self.assertIsNotNone(self.widget.Outputs.residuals)
 
+    def test_auto_order(self):
+        widget = self.widget
+        self.assertFalse(widget.controls.seasonal_period.isEnabled())
+        widget.controls.auto_order.setChecked(True)
+        self.assertFalse(widget.controls.p.isEnabled())
+        self.assertTrue(widget.controls.seasonal_period.isEnabled())
+        self.send_signal(widget.Inputs.time_series, self.data)
+        # Stepwise search with default maximal orders takes a few seconds
+        self.wait_until_finished(timeout=30000)
+        learner = self.get_output(widget.Outputs.learner)
+        self.assertIsInstance(learner, AutoARIMA)
+        self.assertIsNone(learner.period)
+        self.assertEqual(len(self.get_output(widget.Outputs.forecast)), 3)
+
+        with patch.object(AutoARIMA, "fit"):
+            widget.controls.seasonal_period.setValue(12)
+            widget.apply.now()
+            self.assertEqual(
+                self.get_output(widget.Outputs.learner).period, 12)
+            self.wait_until_finished(timeout=30000)
+
+        widget.controls.auto_order.setChecked(False)
+        self.assertTrue(widget.controls.p.isEnabled())
+        self.assertFalse(widget.controls.seasonal_period.isEnabled())
+        self.assertNotIsInstance(self.get_output(widget.Outputs.learner),
+                                 AutoARIMA)
+
+    def test_method(self):
+        widget = self.widget
+        self.send_signal(widget.Inputs.time_series, self.data)
+        self.wait_until_finished()
+        self.assertEqual(self.get_output(widget.Outputs.learner).method,
+                         "auto")
+
+        widget.controls.method.setCurrentIndex(3)
+        widget.controls.method.activated.emit(3)
+        self.wait_until_finished()
+        learner = self.get_output(widget.Outputs.learner)
+        self.assertEqual(learner.method, "hannan_rissanen")
+        self.assertEqual(str(learner), "ARMA(1,0,0; hannan_rissanen)")
+        self.assertFalse(widget.Error.model_error.is_shown())
+        self.assertEqual(len(self.get_output(widget.Outputs.forecast)), 3)
+
+    def test_model_error(self):
+        with patch.object(ARIMA, "predict", side_effect=ValueError("foo")):
+            self.send_signal(self.widget.Inputs.time_series, self.data)
+            self.wait_until_finished()
+        self.assertTrue(self.widget.Error.model_error.is_shown())
+        self.assertIn("forecasting", str(self.widget.Error.model_error))
+        self.assertIsNone(self.get_output(self.widget.Outputs.forecast))
+
+    def test_new_data_cancels_fit(self):
+        fit = ARIMA.fit
+        with patch.object(ARIMA, "fit", autospec=True, side_effect=fit) as m:
+            self.send_signal(self.widget.Inputs.time_series, self.data)
+            self.send_signal(self.widget.Inputs.time_series, self.data[:100])
+            self.wait_until_finished()
+        # The first fit was aborted through its callback
+        self.assertRaises(Exception, m.call_args_list[0].kwargs["callback"])
+        self.assertEqual(
+            len(self.get_output(self.widget.Outputs.fitted_values)), 100)
+
+    def test_forecast_settings_reuse_fit(self):
+        widget = self.widget
+        fit = ARIMA.fit
+        with patch.object(ARIMA, "fit", autospec=True, side_effect=fit) as m:
+            self.send_signal(widget.Inputs.time_series, self.data)
+            self.wait_until_finished()
+            self.assertEqual(m.call_count, 1)
+
+            widget.controls.forecast_steps.setValue(5)
+            widget.apply.now()
+            self.wait_until_finished()
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(
+                len(self.get_output(widget.Outputs.forecast)), 5)
+
+            # Same data in a new table
+            self.send_signal(widget.Inputs.time_series, self.data.copy())
+            self.wait_until_finished()
+            self.assertEqual(m.call_count, 1)
+
+            widget.p = 2
+            widget.apply.now()
+            self.wait_until_finished()
+            self.assertEqual(m.call_count, 2)
+
+            self.send_signal(widget.Inputs.time_series, self.data[:100])
+            self.wait_until_finished()
+            self.assertEqual(m.call_count, 3)
+
+    def test_run_progress(self):
+        state = Mock()
+        state.is_interruption_requested.return_value = False
+        fit = ARIMA.fit
+
+        def fit_with_callback(model, *args, callback, **kwargs):
+            for _ in range(5):
+                callback()
+            return fit(model, *args, callback=callback, **kwargs)
+
+        # All inputs are passed to run; it doesn't need the widget
+        with patch.object(ARIMA, "fit", autospec=True,
+                          side_effect=fit_with_callback):
+            model = ARIMA((1, 0, 0))
+            model.name = "ARIMA"
+            res = run(model, self.data, True, dict(steps=5, alpha=0.1), state)
+        self.assertIsNone(res.error)
+        self.assertEqual(len(res.forecast), 5)
+        progress = [args[0] for args, _ in
+                    state.set_progress_value.call_args_list]
+        fitting = progress[:progress.index(70)]
+        self.assertGreaterEqual(len(fitting), 5)
+        self.assertEqual(fitting, sorted(fitting))
+        self.assertLess(fitting[-1], 70)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 from AnyQt.QtCore import QItemSelectionModel
@@ -7,6 +8,7 @@ from Orange.data import Table, Domain, ContinuousVariable
 from Orange.widgets.tests.base import WidgetTest
 
 from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries.widgets import owcorrelogram
 from orangecontrib.timeseries.widgets.owcorrelogram import OWCorrelogram
 
 
@@ -92,6 +94,33 @@ class TestCorrelogramWidget(WidgetTest):
         self.send_signal(self.widget.Inputs.time_series, data[:, 3:])
         self.assertEqual(self.widget.selection, ["d"])
 
+    def test_acf_in_one_call(self):
+        data = Timeseries.from_numpy(
+            Domain([ContinuousVariable(n) for n in "abcd"]),
+            np.random.default_rng(0).normal(size=(50, 4)))
+        self.send_signal(self.widget.Inputs.time_series, data)
+        index = self.widget.model.index
+        selmodel = self.widget.selectionModel
+        with patch.object(owcorrelogram, "autocorrelations",
+                          wraps=owcorrelogram.autocorrelations) as acf:
+            selmodel.select(index(1), QItemSelectionModel.ClearAndSelect)
+            selmodel.select(index(3), QItemSelectionModel.Select)
+            self.assertEqual(acf.call_count, 2)
+            self.assertEqual(acf.call_args[0][0].shape, (50, 1))
+
+            acf.reset_mock()
+            self.widget._cached.clear()
+            self.widget.selection = ["a", "b", "c", "d"]
+            self.widget.replot()
+            acf.assert_called_once()
+            np.testing.assert_almost_equal(acf.call_args[0][0], data.X)
+
+            acf.reset_mock()
+            self.widget.replot()
+            acf.assert_not_called()
+
+            self.widget.controls.use_pacf.click()
+            acf.assert_not_called()
 
 if __name__ == "__main__":
     unittest.main()
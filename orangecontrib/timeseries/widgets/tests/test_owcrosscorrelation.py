@@ -0,0 +1,65 @@
+import os
+import unittest
+
+from AnyQt.QtCore import Qt
+
+from Orange.widgets.tests.base import WidgetTest
+
+from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries.widgets.owcrosscorrelation import \
+    OWCrossCorrelation
+
+
+class TestOWCrossCorrelation(WidgetTest):
+    def setUp(self):
+        self.widget: OWCrossCorrelation = \
+            self.create_widget(OWCrossCorrelation)
+        dataset_dir = os.path.join(os.path.dirname(__file__), "datasets")
+        self.amzn = Timeseries.from_file(
+            os.path.join(dataset_dir, "AMZN.tab"))[:, :-3]
+
+    def test_data(self):
+        self.send_signal(self.widget.Inputs.time_series, self.amzn)
+        self.wait_until_finished()
+        # Three continuous variables besides time
+        self.assertEqual(self.widget.model.rowCount(), 3)
+
+        self.send_signal(self.widget.Inputs.time_series, None)
+        self.wait_until_finished()
+        self.assertEqual(self.widget.model.rowCount(), 0)
+
+    def test_max_lag(self):
+        self.send_signal(self.widget.Inputs.time_series, self.amzn)
+        self.wait_until_finished()
+        self.widget.controls.max_lag.setValue(0)
+        self.wait_until_finished()
+        self.assertEqual({row[0] for row in self.widget.model}, {0})
+
+    def test_selection(self):
+        self.send_signal(self.widget.Inputs.time_series, self.amzn)
+        self.wait_until_finished()
+        self.widget.view.selectRow(2)
+        output = self.get_output(self.widget.Outputs.selected_features)
+        self.assertEqual(2, len(output))
+
+        self.widget.view.clearSelection()
+        self.assertIsNone(
+            self.get_output(self.widget.Outputs.selected_features))
+
+    def test_sort_by_absolute_correlation(self):
+        w = self.widget
+        self.send_signal(w.Inputs.time_series, self.amzn)
+        self.wait_until_finished()
+        rows = w.model.mapToSourceRows(list(range(w.model.rowCount())))
+        corrs = [abs(w.model[i][1]) for i in rows]
+        self.assertEqual(corrs, sorted(corrs, reverse=True))
+
+        w.model.wrap([[1, 0.5, "a", "→", "b"], [2, -0.9, "a", "→", "c"],
+                      [3, 0.1, "b", "→", "c"]])
+        w.model.sort(1, Qt.DescendingOrder)
+        self.assertEqual([w.model[i][1] for i in w.model.mapToSourceRows(
+            [0, 1, 2])], [-0.9, 0.5, 0.1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,10 +8,15 @@ from Orange.widgets.utils.itemmodels import select_rows
 from Orange.data import \
     Domain, Table, ContinuousVariable, DiscreteVariable, StringVariable
 
-from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries import Timeseries, difference
 from orangecontrib.timeseries.widgets.owdifference import OWDifference
 
 
+def compute(widget, data, attr_names):
+    return data.transform(
+        Domain(widget.derived_variables(data, attr_names))).X
+
+
 class TestOWDifference(WidgetTest):
     def setUp(self):
         self.widget: OWDifference = self.create_widget(OWDifference)
@@ -73,7 +78,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 1
         widget.invert_direction = False
         widget.assume_zero_before = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [-3, -7, -8],
@@ -81,7 +86,7 @@ class TestOWDifference(WidgetTest):
                       [4, np.nan, -1]])
 
         widget.assume_zero_before = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[4, 5, 8],
                       [-3, -7, -8],
@@ -91,7 +96,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 1
         widget.invert_direction = True
         widget.assume_zero_before = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[3, 7, 8],
                       [-2, np.nan, -2],
@@ -101,7 +106,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 1
         widget.invert_direction = True
         widget.assume_zero_before = True  # This must be ignored!
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[3, 7, 8],
                       [-2, np.nan, -2],
@@ -111,7 +116,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 2
         widget.invert_direction = False
         widget.assume_zero_before = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [np.nan, np.nan, np.nan],
@@ -121,7 +126,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 2
         widget.invert_direction = False
         widget.assume_zero_before = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[4, 5, 8],
                       [1, -2, 0],
@@ -130,7 +135,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 2
         widget.invert_direction = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[1, np.nan, 6],
                       [-6, np.nan, -1],
@@ -140,7 +145,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 2
         widget.invert_direction = True
         widget.assume_zero_before = True  # This must be ignored!
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[1, np.nan, 6],
                       [-6, np.nan, -1],
@@ -150,7 +155,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 3
         widget.invert_direction = False
         widget.assume_zero_before = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [np.nan, np.nan, np.nan],
@@ -160,7 +165,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 3
         widget.invert_direction = False
         widget.assume_zero_before = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[4, 5, 8],
                       [1, -2, 0],
@@ -169,7 +174,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 3
         widget.invert_direction = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[-3, np.nan, 7],
                       [np.nan, np.nan, np.nan],
@@ -179,7 +184,7 @@ class TestOWDifference(WidgetTest):
         for widget.shift_period in (4, 5, 10):
             for widget.invert_direction in (False, True):
                 for widget.assume_zero_before in (False, True):
-                    _, columns = widget.compute(self.data, list("abc"))
+                    columns = compute(widget, self.data, list("abc"))
                     if not widget.assume_zero_before or widget.invert_direction:
                         np.testing.assert_equal(
                             columns, [[np.nan, np.nan, np.nan],
@@ -196,7 +201,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 1
         widget.invert_direction = False
         widget.assume_zero_before = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [np.nan, np.nan, np.nan],
@@ -206,7 +211,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 1
         widget.invert_direction = False
         widget.assume_zero_before = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[4, 5, 8],
                       [-7, -12, -16],
@@ -216,7 +221,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 1
         widget.invert_direction = True
         widget.assume_zero_before = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[5, np.nan, 10],
                       [2, np.nan, -3],
@@ -226,7 +231,7 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 1
         widget.invert_direction = True
         widget.assume_zero_before = True  # This must be ignored!
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_equal(
             columns, [[5, np.nan, 10],
                       [2, np.nan, -3],
@@ -239,7 +244,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 1
         widget.invert_direction = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [1 / 4, -2 / 5, 0 / 8],
@@ -248,7 +253,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 1
         widget.invert_direction = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[4, -5 / 2, np.nan],
                       [1 / 3, np.nan, 0],
@@ -257,7 +262,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 2
         widget.invert_direction = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [np.nan, np.nan, np.nan],
@@ -266,7 +271,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 2
         widget.invert_direction = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[4 / 3, np.nan, 8 / 2],
                       [1 / 7, np.nan, 0],
@@ -275,7 +280,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 3
         widget.invert_direction = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [np.nan, np.nan, np.nan],
@@ -284,7 +289,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 3
         widget.invert_direction = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[4 / 7, np.nan, 8 / 1],
                       [np.nan, np.nan, np.nan],
@@ -293,7 +298,7 @@ class TestOWDifference(WidgetTest):
 
         for widget.shift_period in (4, 5, 10):
             for widget.invert_direction in (False, True):
-                _, columns = widget.compute(self.data, list("abc"))
+                columns = compute(widget, self.data, list("abc"))
                 np.testing.assert_equal(
                     columns, [[np.nan, np.nan, np.nan],
                               [np.nan, np.nan, np.nan],
@@ -306,7 +311,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 1
         widget.invert_direction = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [-75, -140, -100],
@@ -315,7 +320,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 1
         widget.invert_direction = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[300, -350, np.nan],
                       [-200 / 3, np.nan, -100],
@@ -324,7 +329,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 2
         widget.invert_direction = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [np.nan, np.nan, np.nan],
@@ -333,7 +338,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 2
         widget.invert_direction = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[100 / 3, np.nan, 300],
                       [-600 / 7, np.nan, -100],
@@ -342,7 +347,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 3
         widget.invert_direction = False
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[np.nan, np.nan, np.nan],
                       [np.nan, np.nan, np.nan],
@@ -351,7 +356,7 @@ class TestOWDifference(WidgetTest):
 
         widget.shift_period = 3
         widget.invert_direction = True
-        _, columns = widget.compute(self.data, list("abc"))
+        columns = compute(widget, self.data, list("abc"))
         np.testing.assert_almost_equal(
             columns, [[-300 / 7, np.nan, 700],
                       [np.nan, np.nan, np.nan],
@@ -360,7 +365,7 @@ class TestOWDifference(WidgetTest):
 
         for widget.shift_period in (4, 5, 10):
             for widget.invert_direction in (False, True):
-                _, columns = widget.compute(self.data, list("abc"))
+                columns = compute(widget, self.data, list("abc"))
                 np.testing.assert_equal(
                     columns, [[np.nan, np.nan, np.nan],
                               [np.nan, np.nan, np.nan],
@@ -385,9 +390,15 @@ class TestOWDifference(WidgetTest):
         widget.shift_period = 1
         widget.operation = 2
 
-        widget.compute = lambda data, names: (
-            tuple(ContinuousVariable(n + "x") for n in names),
-            sq(len(data), len(names), widget.operation + widget.shift_period * 10))
+        def derived_variables(data, names):
+            cols = sq(len(data), len(names),
+                      widget.operation + widget.shift_period * 10)
+            return tuple(
+                ContinuousVariable(n + "x",
+                                   compute_value=lambda _, col=col: col)
+                for n, col in zip(names, cols.T))
+
+        widget.derived_variables = derived_variables
 
         checkout(None)
 
@@ -440,6 +451,40 @@ class TestOWDifference(WidgetTest):
         self.send_signal(widget.Inputs.time_series, None)
         checkout(None, [])
 
+    def test_compute_value(self):
+        widget = self.widget
+        widget.operation = widget.Diff
+        self.send_signal(widget.Inputs.time_series, self.data)
+        select_rows(widget.view, (0, 2))
+        out = self.get_output(widget.Outputs.time_series)
+
+        # Derived columns are recomputed when the domain is applied to new data
+        new_data = self.data[::-1]
+        transformed = new_data.transform(out.domain)
+        np.testing.assert_equal(
+            transformed.X[:, -2:],
+            [[np.nan, np.nan], [-4, 1], [-2, -2], [3, 8]])
+
+    def test_long_data(self):
+        # Table.from_table computes columns in blocks of 5000 rows
+        widget = self.widget
+        x = np.arange(12000, dtype=float) ** 1.5
+        data = Timeseries.from_numpy(Domain([ContinuousVariable("x")]),
+                                     x[:, None])
+        self.send_signal(widget.Inputs.time_series, data)
+        select_rows(widget.view, [0])
+        out = self.get_output(widget.Outputs.time_series)
+        np.testing.assert_equal(out.X[:, 1], difference(x, "diff"))
+
+        widget.controls.assume_zero_before.click()
+        out = self.get_output(widget.Outputs.time_series)
+        np.testing.assert_equal(out.X[:, 1],
+                                difference(x, "diff", assume_zero=True))
+
+        transformed = data[100:].transform(out.domain)
+        np.testing.assert_equal(
+            transformed.X[:, 1], difference(x[100:], "diff", assume_zero=True))
+
     def test_convert_non_timeseries(self):
         self.send_signal(self.widget.Inputs.time_series, Table("iris"))
         self.assertIsInstance(self.widget.data, Timeseries)
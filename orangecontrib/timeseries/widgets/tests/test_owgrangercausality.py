@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest.mock import patch
 
 from Orange.widgets.tests.base import WidgetTest
 
@@ -23,6 +24,36 @@ class TestOWGrangerCausality(WidgetTest):
         self.wait_until_finished(timeout=10000)
         self.assertEqual(self.widget.model.rowCount(), 6)
 
+    @patch("orangecontrib.timeseries.widgets.owgrangercausality."
+           "POOL_MIN_SERIES", 2)
+    @patch("os.cpu_count", return_value=2)
+    def test_pool(self, _):
+        self.send_signal(self.widget.Inputs.time_series, self.amzn)
+        self.wait_until_finished(timeout=30000)
+        self.assertEqual(self.widget.model.rowCount(), 6)
+
+    def test_partial_results(self):
+        self.send_signal(self.widget.Inputs.time_series, self.amzn)
+        self.wait_until_finished(timeout=10000)
+        rows = sorted(map(list, self.widget.model))
+
+        self.widget.model.clear()
+        self.widget.on_partial_result(rows[:2])
+        self.widget.on_partial_result(rows[2:])
+        self.assertEqual(sorted(map(list, self.widget.model)), rows)
+
+    def test_conditional(self):
+        self.widget.controls.method.setCurrentIndex(1)
+        self.widget.controls.method.activated.emit(1)
+        self.assertTrue(self.widget.Information.modified.is_shown())
+        self.widget.test_button.click()
+        self.send_signal(self.widget.Inputs.time_series, self.amzn)
+        self.wait_until_finished(timeout=10000)
+        self.assertFalse(self.widget.Error.unexpected_error.is_shown())
+        lags = {self.widget.model[i][0]
+                for i in range(self.widget.model.rowCount())}
+        self.assertEqual(len(lags), 1)
+
     def test_selection(self):
         """ Test if selection is correctly handled """
         self.send_signal(self.widget.Inputs.time_series, self.amzn)
@@ -1,8 +1,10 @@
 import unittest
 
+from AnyQt.QtCore import Qt
+
 from Orange.widgets.tests.base import WidgetTest
 
-from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries import Timeseries, ARIMA, VAR
 from orangecontrib.timeseries.models import _BaseModel
 from orangecontrib.timeseries.widgets.owmodelevaluation import OWModelEvaluation
 
@@ -10,6 +12,7 @@ from orangecontrib.timeseries.widgets.owmodelevaluation import OWModelEvaluation
 class TestOWModelEvaluation(WidgetTest):
     def setUp(self):
         self.widget = self.create_widget(OWModelEvaluation)  # type: OWModelEvaluation
+        self.data = Timeseries.from_file('airpassengers')
 
     def test_bad_model(self):
         class BadModel(_BaseModel):
@@ -21,14 +24,51 @@ class TestOWModelEvaluation(WidgetTest):
 
         time_series = Timeseries.from_file('airpassengers')
         self.send_signal(w.Inputs.time_series, time_series)
+        self.wait_until_finished()
         self.assertFalse(w.Warning.model_failed.is_shown())
 
         self.send_signal(w.Inputs.time_series_model, BadModel(), 0)
+        self.wait_until_finished()
         self.assertTrue(w.Warning.model_failed.is_shown())
 
         self.send_signal(w.Inputs.time_series_model, None, 0)
+        self.wait_until_finished()
         self.assertFalse(w.Warning.model_failed.is_shown())
 
+    def test_results(self):
+        w = self.widget
+        w.n_folds = 5
+        self.send_signal(w.Inputs.time_series, self.data)
+        self.send_signal(w.Inputs.time_series_model, ARIMA((1, 1, 0)), 0)
+        self.send_signal(w.Inputs.time_series_model, VAR(1), 1)
+        self.wait_until_finished()
+        self.assertEqual(
+            [w.model.headerData(i, Qt.Vertical) for i in range(4)],
+            ["ARIMA(1,1,0)", "ARIMA(1,1,0) (in-sample)",
+             "VAR(1)", "VAR(1) (in-sample)"])
+        self.assertEqual(w.model.columnCount(), 7)
+
+    def test_partial_results(self):
+        w = self.widget
+        w.on_partial_result([["Model", "RMSE"], ["ARIMA(1,1,0)", 1]])
+        self.assertEqual(w.model.rowCount(), 1)
+        self.assertEqual(w.model.headerData(0, Qt.Vertical), "ARIMA(1,1,0)")
+
+    def test_new_data_restarts(self):
+        w = self.widget
+        self.send_signal(w.Inputs.time_series_model, ARIMA((2, 1, 1)), 0)
+        self.send_signal(w.Inputs.time_series, self.data)
+        self.send_signal(w.Inputs.time_series, self.data[:100])
+        self.wait_until_finished()
+        self.assertFalse(w.Error.unexpected_error.is_shown())
+        self.assertEqual(w.model.rowCount(), 2)
+
+        w.n_folds = 50
+        w.commit.now()
+        self.wait_until_finished()
+        self.assertTrue(w.Error.unexpected_error.is_shown())
+        self.assertEqual(w.model.rowCount(), 0)
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
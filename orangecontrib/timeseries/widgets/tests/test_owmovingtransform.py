@@ -1,6 +1,7 @@
 import sys
 import unittest
-from unittest.mock import Mock
+from dataclasses import replace
+from unittest.mock import Mock, patch
 
 import numpy as np
 from AnyQt.QtCore import Qt, QItemSelectionModel
@@ -11,6 +12,7 @@ from Orange.data import DiscreteVariable, ContinuousVariable, Domain, \
 from Orange.widgets.tests.base import WidgetTest
 from orangewidget.tests.base import GuiTest
 from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries.aggregate import AggOptions
 
 from orangecontrib.timeseries.widgets.owmovingtransform import \
     OWMovingTransform, TransformationsModel, NumericFilterProxy
@@ -381,6 +383,47 @@ class TestOWMovingTransform(WidgetTest):
              [1.0, 3.0, 13.25, -1.0],
              [1.0, 3.5, 16.75, -2.0]])
 
+    def test_compute_sliding_window_compute_value(self):
+        widget = self.widget
+        widget.commit.now = Mock()
+        widget.var_hints = {("c1", True): {"min", "cumsum"},
+                            ("c2", False): {"mode"}}
+        widget.method = widget.SlidingWindow
+        widget.window_width = 3
+        widget.keep_instances = widget.KeepAll
+        self.send_signal(widget.Inputs.time_series, self.data)
+        data = widget._compute_sliding_window()
+
+        transformed = self.data.transform(data.domain)
+        np.testing.assert_equal(transformed.X, data.X)
+
+        widget.keep_instances = widget.KeepComplete
+        data = widget._compute_sliding_window()
+        transformed = self.data.transform(data.domain)
+        np.testing.assert_equal(transformed.X[2:, 2:4], data.X[:, 2:4])
+
+    def test_compute_sliding_window_long_data(self):
+        # Table.from_table computes columns in blocks of 5000 rows
+        widget = self.widget
+        widget.commit.now = Mock()
+        widget.var_hints = {("c1", True): {"mean", "cumsum"}}
+        widget.method = widget.SlidingWindow
+        widget.window_width = 3
+        widget.keep_instances = widget.KeepAll
+        long_data = Timeseries.from_numpy(
+            self.data.domain,
+            np.column_stack((np.zeros(12000), np.arange(12000) ** 1.5,
+                             np.zeros(12000))),
+            np.zeros(12000))
+        self.send_signal(widget.Inputs.time_series, long_data)
+        data = widget._compute_sliding_window()
+
+        transformed = long_data.transform(data.domain)
+        np.testing.assert_equal(transformed.X, data.X)
+        transformed = long_data[100:].transform(data.domain)
+        mean = data.domain.index("c1 (mean)")
+        np.testing.assert_equal(transformed.X[2:, mean], data.X[102:, mean])
+
     def test_compute_sliding_window_warnings(self):
         widget = self.widget
         widget.commit.now = Mock()
@@ -396,6 +439,52 @@ class TestOWMovingTransform(WidgetTest):
         widget._compute_sliding_window()
         self.assertTrue(widget.Warning.window_to_large.is_shown())
 
+    def test_compute_sliding_window_cache(self):
+        widget = self.widget
+        widget.commit.now = Mock()
+        widget.var_hints = {("c1", True): {"min", "max"}}
+        widget.method = widget.SlidingWindow
+        widget.window_width = 3
+        widget.keep_instances = widget.KeepComplete
+        self.send_signal(widget.Inputs.time_series, self.data)
+
+        with patch.dict(AggOptions, {
+                name: replace(AggOptions[name],
+                              transform=Mock(wraps=AggOptions[name].transform))
+                for name in ("min", "max", "mean")}):
+            data = widget._compute_sliding_window()
+            AggOptions["min"].transform.assert_called_once()
+            AggOptions["max"].transform.assert_called_once()
+
+            # Adding an aggregation computes only that aggregation
+            widget.var_model.set_transformations(
+                1, {"min", "max", "mean"})
+            widget._compute_sliding_window()
+            AggOptions["min"].transform.assert_called_once()
+            AggOptions["max"].transform.assert_called_once()
+            AggOptions["mean"].transform.assert_called_once()
+
+            # Undoing it is free
+            widget.var_model.set_transformations(1, {"min", "max"})
+            np.testing.assert_equal(widget._compute_sliding_window().X, data.X)
+            AggOptions["min"].transform.assert_called_once()
+
+            # Discarding original data reuses the same aggregates ...
+            widget.keep_instances = widget.DiscardOriginal
+            widget._compute_sliding_window()
+            AggOptions["min"].transform.assert_called_once()
+
+            # ... but a different width does not
+            widget.window_width = 2
+            widget._compute_sliding_window()
+            self.assertEqual(AggOptions["min"].transform.call_count, 2)
+
+            # New data invalidates the cache
+            self.send_signal(widget.Inputs.time_series, self.data[:5])
+            widget.window_width = 3
+            widget._compute_sliding_window()
+            self.assertEqual(AggOptions["min"].transform.call_count, 3)
+
     def test_compute_sequential_blocks(self):
         # if this failes, first check test_set_data_applies_hints
         widget = self.widget
@@ -1,8 +1,13 @@
 import unittest
+from unittest.mock import patch
 
+import numpy as np
+
+from Orange.data import Domain, ContinuousVariable, TimeVariable
 from Orange.widgets.tests.base import WidgetTest
 
 from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries.widgets import owperiodogram
 from orangecontrib.timeseries.widgets.owperiodogram import OWPeriodogram
 
 # There are not many tests here.
@@ -25,6 +30,48 @@ class TestPeriodogramWidget(WidgetTest):
         ts = Timeseries.from_file("iris")
         self.send_signal(self.widget.Inputs.time_series, ts)
 
+    def test_welch(self):
+        x = np.sin(np.arange(1000) * 2 * np.pi / 10)
+        ts = Timeseries.from_numpy(Domain([ContinuousVariable("x")]), x[:, None])
+        self.send_signal(self.widget.Inputs.time_series, ts)
+        self.assertFalse(self.widget.segment_spin.isEnabled())
+        with patch.object(owperiodogram, "periodogram_equispaced",
+                          wraps=owperiodogram.periodogram_equispaced) as pgram:
+            self.widget.controls.use_welch.click()
+            self.assertTrue(self.widget.segment_spin.isEnabled())
+            self.assertEqual(pgram.call_args[1]["segment_length"], 256)
+
+            self.widget.controls.segment_length.setValue(32)
+            self.widget.controls.segment_length.editingFinished.emit()
+            self.assertEqual(pgram.call_args[1]["segment_length"], 32)
+            periods, _ = self.widget._cached["x"]
+            self.assertLessEqual(max(periods), 32)
+
+            self.widget.controls.use_welch.click()
+            self.assertNotIn("segment_length", pgram.call_args[1])
+
+    def test_welch_irregular(self):
+        w = self.widget
+        t = np.cumsum(np.random.RandomState(0).rand(100) + 0.5)
+        ts = Timeseries.from_numpy(
+            Domain([TimeVariable("t"), ContinuousVariable("x")]),
+            np.column_stack((t, np.sin(t))))
+        w.controls.use_welch.click()
+        self.assertTrue(w.segment_spin.isEnabled())
+        with patch.object(owperiodogram, "periodogram_equispaced") as pgram:
+            self.send_signal(w.Inputs.time_series, ts)
+            pgram.assert_not_called()
+        self.assertFalse(w.controls.use_welch.isEnabled())
+        self.assertFalse(w.segment_spin.isEnabled())
+        self.assertTrue(w.Information.no_welch.is_shown())
+
+        x = np.sin(np.arange(100))
+        self.send_signal(w.Inputs.time_series, Timeseries.from_numpy(
+            Domain([ContinuousVariable("x")]), x[:, None]))
+        self.assertTrue(w.controls.use_welch.isEnabled())
+        self.assertTrue(w.segment_spin.isEnabled())
+        self.assertFalse(w.Information.no_welch.is_shown())
+
 
 if __name__ == "__main__":
     unittest.main()
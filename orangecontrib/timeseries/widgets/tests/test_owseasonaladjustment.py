@@ -1,9 +1,13 @@
 import unittest
+from unittest.mock import patch
 
-from Orange.data import Table
+import numpy as np
+
+from Orange.data import Table, Domain
 from Orange.widgets.tests.base import WidgetTest
 
-from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries import Timeseries, seasonal_decompose
+from orangecontrib.timeseries.widgets import owseasonaladjustment
 from orangecontrib.timeseries.widgets.owseasonaladjustment import OWSeasonalAdjustment
 
 
@@ -26,6 +30,7 @@ class TestOWSeasonalAdjustment(WidgetTest):
         self.assertFalse(w.Error.seasonal_decompose_fail.is_shown())
         self.send_signal(w.Inputs.time_series, table)
         self.widget.view.selectAll()
+        self.wait_until_finished()
         self.assertTrue(w.Error.seasonal_decompose_fail.is_shown())
         self.send_signal(w.Inputs.time_series, None)
         self.assertFalse(w.Error.seasonal_decompose_fail.is_shown())
@@ -64,9 +69,152 @@ class TestOWSeasonalAdjustment(WidgetTest):
         self.send_signal(w.Inputs.time_series, time_series)
         selmodel = w.view.selectionModel()
         selmodel.select(w.model.index(0), selmodel.Select)
+        self.wait_until_finished()
         self.assertGreater(len(self.get_output("Time series").domain.variables),
                            len(time_series.domain.variables))
 
+    def test_compute_value(self):
+        """
+        Components are computed by the domain transformation.
+        """
+        w = self.widget
+        w.autocommit = True
+        w.decomposition = 0
+        time_series = Timeseries.from_file("airpassengers")
+        self.send_signal(w.Inputs.time_series, time_series)
+        selmodel = w.view.selectionModel()
+        selmodel.select(w.model.index(0), selmodel.Select)
+        self.wait_until_finished()
+        out = self.get_output(w.Outputs.time_series)
+        self.assertIs(out.time_variable, time_series.time_variable)
+
+        var = time_series.domain.class_var
+        expected = seasonal_decompose(
+            Timeseries.from_numpy(Domain([var]), time_series.Y[:, None]),
+            "additive", 12)
+        np.testing.assert_almost_equal(out.X[:, -4:], expected.X)
+
+        transformed = time_series[:48].transform(out.domain)
+        expected = seasonal_decompose(
+            Timeseries.from_numpy(Domain([var]), time_series.Y[:48, None]),
+            "additive", 12)
+        np.testing.assert_almost_equal(transformed.X[:, -4:], expected.X)
+
+    def test_compute_value_long_data(self):
+        # Table.from_table computes columns in blocks of 5000 rows
+        w = self.widget
+        w.autocommit = True
+        time_series = Timeseries.from_file("airpassengers")
+        self.send_signal(w.Inputs.time_series, time_series)
+        selmodel = w.view.selectionModel()
+        selmodel.select(w.model.index(0), selmodel.Select)
+        self.wait_until_finished()
+        out = self.get_output(w.Outputs.time_series)
+
+        y = np.tile(time_series.Y, 12001 // len(time_series) + 1)[:12001]
+        domain = time_series.domain
+        long_data = Timeseries.from_numpy(
+            Domain(domain.attributes, domain.class_var),
+            np.zeros((len(y), len(domain.attributes))), y)
+        transformed = long_data.transform(out.domain)
+        expected = seasonal_decompose(
+            Timeseries.from_numpy(Domain([domain.class_var]), y[:, None]),
+            "additive", 12)
+        np.testing.assert_almost_equal(transformed.X[:, -4:], expected.X)
+
+    def test_stl(self):
+        w = self.widget
+        w.autocommit = True
+        time_series = Timeseries.from_file("airpassengers")
+        self.send_signal(w.Inputs.time_series, time_series)
+        self.assertFalse(w.controls.second_period.isEnabled())
+        w.controls.method.setCurrentIndex(1)
+        w.controls.method.activated.emit(1)
+        self.assertTrue(w.controls.second_period.isEnabled())
+        w.controls.second_period.setValue(6)
+
+        selmodel = w.view.selectionModel()
+        selmodel.select(w.model.index(0), selmodel.Select)
+        self.wait_until_finished()
+        self.assertFalse(w.Error.seasonal_decompose_fail.is_shown())
+        out = self.get_output(w.Outputs.time_series)
+        compute_value = \
+            out.domain.attributes[-1].compute_value.compute_shared
+        self.assertEqual(compute_value.method, "stl")
+        self.assertEqual(compute_value.period, (6, 12))
+        np.testing.assert_almost_equal(out.X[:, -4] + out.X[:, -3],
+                                       time_series.Y)
+
+    def test_cached_components(self):
+        w = self.widget
+        w.autocommit = True
+        time_series = Timeseries.from_data_table(Table("iris"))
+        self.send_signal(w.Inputs.time_series, time_series)
+        selmodel = w.view.selectionModel()
+        with patch.object(owseasonaladjustment, "run",
+                          wraps=owseasonaladjustment.run) as run:
+            selmodel.select(w.model.index(0), selmodel.Select)
+            self.wait_until_finished()
+            self.assertEqual(run.call_args[0][1], [w.model[0]])
+            out1 = self.get_output(w.Outputs.time_series)
+
+            selmodel.select(w.model.index(1), selmodel.Select)
+            self.wait_until_finished()
+            self.assertEqual(run.call_args[0][1], [w.model[1]])
+
+            run.reset_mock()
+            selmodel.select(w.model.index(1), selmodel.Deselect)
+            self.wait_until_finished()
+            run.assert_not_called()
+            out2 = self.get_output(w.Outputs.time_series)
+            np.testing.assert_equal(out1.X, out2.X)
+
+            w.controls.n_periods.setValue(6)
+            self.wait_until_finished()
+            self.assertEqual(run.call_args[0][1], [w.model[0]])
+
+        # Output is the same as computed by compute values
+        out = self.get_output(w.Outputs.time_series)
+        np.testing.assert_almost_equal(
+            time_series.transform(out.domain).X, out.X)
+
+    def test_output_from_cached_components(self):
+        w = self.widget
+        w.autocommit = True
+        time_series = Timeseries.from_data_table(Table("iris"))
+        self.send_signal(w.Inputs.time_series, time_series)
+        selmodel = w.view.selectionModel()
+        selmodel.select(w.model.index(0), selmodel.Select)
+        self.wait_until_finished()
+        with patch.object(owseasonaladjustment, "seasonal_decompose") as sd:
+            selmodel.select(w.model.index(0), selmodel.Deselect)
+            selmodel.select(w.model.index(0), selmodel.Select)
+            self.wait_until_finished()
+            sd.assert_not_called()
+        out = self.get_output(w.Outputs.time_series)
+        key = next(iter(w._components))
+        np.testing.assert_equal(out.X[:, -4:], w._components[key])
+        np.testing.assert_equal(out.ids, time_series.ids)
+
+    def test_pool_min_size(self):
+        w = self.widget
+        w.autocommit = True
+        w.method = 1
+        y = Timeseries.from_file("airpassengers").Y
+        X = np.column_stack((y, y[::-1]))
+        data = Timeseries.from_numpy(Domain.from_numpy(X), X)
+        with patch.object(owseasonaladjustment, "seasonal_decompose",
+                          wraps=seasonal_decompose) as sd:
+            self.send_signal(w.Inputs.time_series, data)
+            w.view.selectAll()
+            self.wait_until_finished()
+            self.assertIsNone(sd.call_args[1]["n_jobs"])
+
+            with patch.object(owseasonaladjustment, "POOL_MIN_SIZE", 2):
+                w.controls.n_periods.setValue(6)
+                self.wait_until_finished()
+            self.assertEqual(sd.call_args[1]["n_jobs"], -1)
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
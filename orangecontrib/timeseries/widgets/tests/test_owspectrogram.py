@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from Orange.data import Table, Domain, ContinuousVariable
+from Orange.widgets.tests.base import WidgetTest
+
+from orangecontrib.timeseries import Timeseries
+from orangecontrib.timeseries.widgets import owspectrogram
+from orangecontrib.timeseries.widgets.owspectrogram import OWSpectrogram
+
+
+class TestOWSpectrogram(WidgetTest):
+    def setUp(self):
+        self.widget: OWSpectrogram = self.create_widget(OWSpectrogram)
+        t = np.arange(20000)
+        self.data = Timeseries.from_numpy(
+            Domain([ContinuousVariable("a"), ContinuousVariable("b")]),
+            np.column_stack((np.sin(t * 2 * np.pi / 10),
+                             np.sin(t * 2 * np.pi / 4))))
+
+    def test_image(self):
+        widget = self.widget
+        self.send_signal(widget.Inputs.time_series, self.data)
+        self.assertIs(widget.attribute, self.data.domain["a"])
+        image = widget.image.image
+        self.assertEqual(image.shape[1], 129)
+        self.assertEqual(np.argmax(image.mean(axis=0)), round(256 / 10))
+        rect = widget.image.mapRectToParent(widget.image.boundingRect())
+        self.assertAlmostEqual(rect.top(), -0.5 / 256)
+        self.assertAlmostEqual(rect.bottom(), 0.5 + 0.5 / 256)
+
+        simulate_combo = widget.controls.attribute
+        simulate_combo.setCurrentIndex(1)
+        simulate_combo.activated.emit(1)
+        self.assertEqual(np.argmax(widget.image.image.mean(axis=0)), 256 // 4)
+
+        widget.controls.window_length.setValue(64)
+        widget.controls.window_length.editingFinished.emit()
+        self.assertEqual(widget.image.image.shape[1], 33)
+
+        self.send_signal(widget.Inputs.time_series, None)
+        self.assertIsNone(widget.image.image)
+
+    def test_decimation(self):
+        widget = self.widget
+        with patch.object(owspectrogram, "spectrogram",
+                          wraps=owspectrogram.spectrogram) as spectrogram:
+            self.send_signal(widget.Inputs.time_series, self.data)
+            kwargs = spectrogram.call_args[1]
+            self.assertEqual((kwargs["start"], kwargs["stop"]), (0, 20000))
+            self.assertLessEqual(len(widget.image.image),
+                                 kwargs["max_frames"])
+
+            widget.plot.setXRange(5000, 6000, padding=0)
+            widget.update_image()
+            kwargs = spectrogram.call_args[1]
+            self.assertEqual((kwargs["start"], kwargs["stop"]),
+                             (5000 - 256, 6000 + 256))
+
+    def test_context(self):
+        widget = self.widget
+        self.send_signal(widget.Inputs.time_series, self.data)
+        widget.attribute = self.data.domain["b"]
+        self.send_signal(widget.Inputs.time_series, Table("iris"))
+        self.send_signal(widget.Inputs.time_series, self.data)
+        self.assertIs(widget.attribute, self.data.domain["b"])
+
+    def test_errors(self):
+        widget = self.widget
+        self.send_signal(widget.Inputs.time_series, self.data[:1])
+        self.assertTrue(widget.Error.no_instances.is_shown())
+        self.send_signal(widget.Inputs.time_series, Table("titanic"))
+        self.assertTrue(widget.Error.no_variables.is_shown())
+        self.assertIsNone(widget.image.image)
+        self.send_signal(widget.Inputs.time_series, self.data[:5])
+        self.assertFalse(widget.Error.no_variables.is_shown())
+        self.assertEqual(widget.image.image.shape, (1, 3))
+
+        self.send_signal(widget.Inputs.time_series,
+                         Timeseries.from_file("airpassengers"))
+        self.assertTrue(widget.Warning.irregular.is_shown())
+        self.send_signal(widget.Inputs.time_series, None)
+        self.assertFalse(widget.Warning.irregular.is_shown())
+
+    def test_single_frame(self):
+        widget = self.widget
+        self.send_signal(widget.Inputs.time_series, self.data[:100])
+        self.assertEqual(len(widget.image.image), 1)
+        # The frame covers the whole series, not the number of frequencies
+        rect = widget.image.mapRectToParent(widget.image.boundingRect())
+        self.assertAlmostEqual(rect.left(), 0)
+        self.assertAlmostEqual(rect.right(), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()